@@ -3,16 +3,19 @@ import os
 import time
 import csv
 import json
+import re
 import requests
 import pandas as pd
+import numpy as np
 from web3 import Web3
 from dotenv import load_dotenv
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from urllib.parse import urlsplit
 import datetime
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from eth_utils import is_checksum_address, to_checksum_address
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from eth_utils import to_checksum_address
 import traceback
 import subprocess
 import sys
@@ -20,6 +23,54 @@ import hashlib
 import shelve
 from diskcache import Cache
 import threading
+import functools
+from collections import namedtuple
+from bisect import bisect_left, bisect_right
+from itertools import count, islice
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+# Optional JIT for numeric kernels; falls back to plain Python when numba is not installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Optional fast JSON codec for API responses, report files and cache keys; falls back to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional Arrow CSV reader for large token lists; falls back to csv.DictReader
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional HTTP/2 client for the 1inch API (httpx needs the h2 package for http2=True); falls back to requests
+try:
+    import httpx
+    import h2  # noqa: F401
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Optional streaming JSON parser for the multi-MB DefiLlama yield pool list; falls back to a full decode
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Base paths (script is launched from repository root via run_risk_assessment.sh)
 SCRIPT_DIR = os.path.abspath(os.path.dirname(__file__))
@@ -90,6 +141,7 @@ COINGECKO_ATTRIBUTION = "Market data provided by CoinGecko (https://www.coingeck
 VERBOSE_LOG = os.path.join(LOGS_DIR, 'risk_assessment_verbose.log')
 SUMMARY_TXT = os.path.join(LOGS_DIR, 'risk_assessment_summary.txt')
 logging.basicConfig(filename=VERBOSE_LOG, level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
 print(COINGECKO_ATTRIBUTION)
 logging.info(COINGECKO_ATTRIBUTION)
 
@@ -531,15 +583,161 @@ class APICache:
     def close(self):
         self.db.close()
 
-api_cache = Cache(API_CACHE_DIR)
+# SQLite-backed; WAL lets token workers read while another thread writes. Values are pickled
+# (highest protocol); responses up to 256 KiB stay inline in the database instead of a file each
+api_cache = Cache(API_CACHE_DIR, sqlite_journal_mode='wal', sqlite_synchronous=1, sqlite_cache_size=2 ** 14,
+                  disk_min_file_size=2 ** 18)
+# Cache lifetimes: market figures move within minutes, descriptive data far less often
+CACHE_TTL_PRICE = 300  # seconds
+CACHE_TTL_METADATA = 3600  # seconds
+CACHE_TTL_SPOT = 60  # seconds; live spot-price probes
+# Finished assess_token results are reused within the same window (0 disables); repeat batch runs
+# then only do real work for tokens that are new or whose window has rolled over
+ASSESSMENT_CACHE_TTL = int(os.getenv('RISK_ASSESSMENT_CACHE_TTL', '3600'))  # seconds
+
+# --- Per-host concurrency limits ---
+# Worker pools are sized for network fan-out; these caps keep any single API within its rate limit
+HOST_LIMITS = {
+    'api.etherscan.io': 4,
+    'api.bscscan.com': 4,
+    'api.polygonscan.com': 4,
+    'api.coingecko.com': 2,
+    'pro-api.coingecko.com': 8,
+    'pro-api.coinmarketcap.com': 4,
+    'api.breadcrumbs.app': 4,
+    'api.ethplorer.io': 2,
+    'deep-index.moralis.io': 8,
+    'api.zapper.xyz': 4,
+    'pro-openapi.debank.com': 4,
+    'api.llama.fi': 8,
+    'coins.llama.fi': 8,
+    'yields.llama.fi': 8,
+    'graphql.bitquery.io': 4,
+    'api.1inch.dev': 4,
+}
+DEFAULT_HOST_LIMIT = 8
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+def _host_semaphore(url):
+    """Return the shared semaphore bounding concurrent requests to url's host"""
+    host = urlsplit(url).hostname or ''
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = _host_semaphores[host] = threading.BoundedSemaphore(HOST_LIMITS.get(host, DEFAULT_HOST_LIMIT))
+        return semaphore
+
+# --- Per-host request rates ---
+# Sustained (requests/second, burst) for APIs with published per-second or per-minute quotas, so a
+# concurrent fan-out is spaced out up front instead of tripping 429s; unlisted hosts are only capped by HOST_LIMITS
+HOST_RATES = {
+    'api.1inch.dev': (1.5, 3),
+    'api.etherscan.io': (5, 5),
+    'api.bscscan.com': (5, 5),
+    'api.polygonscan.com': (5, 5),
+    'api.coingecko.com': (0.5, 5),
+    'pro-api.coinmarketcap.com': (0.5, 5),
+    'api.ethplorer.io': (2, 2),
+}
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until the next request fits within rate and burst"""
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        # Callers reserve a token (the balance may go negative) and sleep outside the lock until it is due
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+_host_buckets = {host: TokenBucket(rate, burst) for host, (rate, burst) in HOST_RATES.items()}
+
+def _wait_for_host_rate(url):
+    """Block until a request to url's host fits within HOST_RATES"""
+    bucket = _host_buckets.get(urlsplit(url).hostname or '')
+    if bucket is not None:
+        bucket.acquire()
+
+class HostLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that paces each request to HOST_RATES and holds the per-host semaphore for its duration (retries included)"""
+    def send(self, request, **kwargs):
+        _wait_for_host_rate(request.url)
+        with _host_semaphore(request.url):
+            return super().send(request, **kwargs)
+
+# --- Shared HTTP session for the module-level fetch_* helpers ---
+# Keep-alive reuses the TCP/TLS connection per host; 429s (honouring Retry-After) and transient server errors
+# get a short backoff retry
+_http_session = requests.Session()
+_http_adapter = HostLimitedAdapter(
+    pool_connections=32, pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=["GET", "POST"], respect_retry_after_header=True, raise_on_status=False))
+_http_session.mount('https://', _http_adapter)
+_http_session.mount('http://', _http_adapter)
+_http_session.headers.update({'Accept': 'application/json'})
+
+def _response_json(resp):
+    """Decode a JSON response body, with orjson straight from the raw bytes when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+# Shared per-key header mapping for direct session calls; a MappingProxyType is not JSON-serializable,
+# so helpers that hash their headers into a cache key keep building plain dicts
+@functools.lru_cache(maxsize=32)
+def _bearer_headers(api_key):
+    """Read-only Authorization header for api_key, built once per key"""
+    return MappingProxyType({"Authorization": f"Bearer {api_key}"})
+
+# --- Single-flight for cached API lookups ---
+# Token workers often ask for the same URL at the same time (shared protocol/chain lookups); only the
+# first caller hits the network, the others wait for its result. Keyed by helper name and arguments.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+def single_flight(func):
+    """Coalesce concurrent identical calls to func into one"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        with _inflight_lock:
+            future = _inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = _inflight[key] = Future()
+        if not is_leader:
+            return future.result()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                del _inflight[key]
+        future.set_result(result)
+        return result
+    return wrapper
 
 # --- Ethplorer Bulk API Integration for Fallbacks ---
 def fetch_ethplorer_bulk(addresses, ethplorer_key):
     url = f"https://api.ethplorer.io/bulkMonitor?apiKey={ethplorer_key}"
     try:
-        resp = requests.post(url, json={"addresses": addresses}, timeout=30)
+        resp = _http_session.post(url, json={"addresses": addresses}, timeout=30)
         if resp.status_code == 200:
-            return resp.json()
+            return _response_json(resp)
         else:
             logging.warning(f"Ethplorer bulk API error: {resp.status_code} {resp.text}")
     except Exception as e:
@@ -547,6 +745,7 @@ def fetch_ethplorer_bulk(addresses, ethplorer_key):
     return {}
 
 # --- Coinpaprika Integration ---
+@single_flight
 def fetch_coinpaprika_market(symbol):
     url = f"https://api.coinpaprika.com/v1/tickers/{symbol.lower()}-usd"
     cache_key = f"coinpaprika_{symbol.lower()}"
@@ -554,10 +753,10 @@ def fetch_coinpaprika_market(symbol):
     if cached:
         return cached
     try:
-        resp = requests.get(url, timeout=20)
+        resp = _http_session.get(url, timeout=20)
         if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
+            data = _response_json(resp)
+            api_cache.set(cache_key, data, expire=CACHE_TTL_PRICE)
             return data
         else:
             logging.warning(f"Coinpaprika API error: {resp.status_code} {resp.text}")
@@ -566,6 +765,7 @@ def fetch_coinpaprika_market(symbol):
     return {}
 
 # --- Dune Analytics Integration ---
+@single_flight
 def fetch_dune_query(query_id, dune_key):
     url = f"https://api.dune.com/api/v1/query/{query_id}/results"
     headers = {"x-dune-api-key": dune_key}
@@ -574,10 +774,10 @@ def fetch_dune_query(query_id, dune_key):
     if cached:
         return cached
     try:
-        resp = requests.get(url, headers=headers, timeout=30)
+        resp = _http_session.get(url, headers=headers, timeout=30)
         if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
+            data = _response_json(resp)
+            api_cache.set(cache_key, data, expire=CACHE_TTL_METADATA)
             return data
         else:
             logging.warning(f"Dune API error: {resp.status_code} {resp.text}")
@@ -611,14 +811,969 @@ def fetch_etherscan_tokeninfo(addresses, etherscan_key):
                 'contractaddress': addr,
                 'apikey': etherscan_key
             }
-            resp = requests.get('https://api.etherscan.io/api', params=params, timeout=20)
+            resp = _http_session.get('https://api.etherscan.io/api', params=params, timeout=20)
             if resp.status_code == 200:
-                data = resp.json()
+                data = _response_json(resp)
                 if data.get('status') == '1' and 'result' in data:
                     results[addr] = data
         except Exception as e:
             logging.warning(f"Etherscan token info failed for {addr}: {e}")
     return results
+
+# Shared read-only default for missing report sections, so lookups don't allocate a new {} each time
+EMPTY = MappingProxyType({})
+
+# --- Concurrent provider lookups ---
+# Tokens assessed in parallel by process_token_batch / assess_tokens (network-bound work);
+# per-API pressure is bounded by HOST_LIMITS, not by the pool sizes
+TOKEN_WORKERS = int(os.getenv('RISK_TOKEN_WORKERS', '16'))
+# Shared pool for independent provider calls (on-chain sources, AML/compliance lookups);
+# its size also caps how many provider requests are in flight across all token workers
+PROVIDER_WORKERS = int(os.getenv('RISK_PROVIDER_WORKERS', '32'))
+_provider_executor = ThreadPoolExecutor(max_workers=PROVIDER_WORKERS, thread_name_prefix='provider')
+
+def submit_provider_calls(calls):
+    """Start {name: (func, *args)} calls concurrently and return {name: Future}"""
+    return {name: _provider_executor.submit(func, *args) for name, (func, *args) in calls.items()}
+
+# --- Contract source patterns (lowercase, matched against lowercased source) ---
+DEFI_FEATURES = frozenset({
+    'flashloan', 'liquidation', 'collateral', 'oracle', 'amm', 'curve',
+    'governance', 'staking', 'yield', 'lending', 'borrowing', 'swap',
+    'uniswap', 'pancakeswap', 'sushiswap', 'balancer'
+})
+INNOVATION_PATTERNS = frozenset({
+    'reentrancyguard', 'pausable', 'ownable', 'accesscontrol',
+    'erc20', 'erc721', 'erc1155', 'multisig', 'timelock'
+})
+ADVANCED_PATTERNS = frozenset({
+    'reentrancyguard', 'pausable', 'ownable', 'accesscontrol',
+    'multisig', 'timelock', 'governance', 'dao'
+})
+SECURITY_PATTERNS = frozenset({
+    'reentrancyguard', 'pausable', 'ownable', 'accesscontrol',
+    'safemath', 'erc20', 'erc721', 'erc1155'
+})
+VULN_PATTERNS = frozenset({
+    'delegatecall', 'selfdestruct', 'suicide', 'assembly',
+    'inline', 'low-level', 'unchecked'
+})
+GOV_FUNCS = frozenset({'vote', 'proposal', 'governance', 'dao'})
+ESG_GOV_FUNCS = GOV_FUNCS | {'multisig', 'timelock', 'accesscontrol', 'ownable'}
+TRANSPARENCY_FEATURES = frozenset({'public', 'view', 'external', 'event', 'emit'})
+BUSINESS_FUNCS = frozenset({'stake', 'yield', 'lend', 'borrow', 'swap', 'govern'})
+ALL_CONTRACT_PATTERNS = (DEFI_FEATURES | INNOVATION_PATTERNS | ADVANCED_PATTERNS | SECURITY_PATTERNS
+                         | VULN_PATTERNS | ESG_GOV_FUNCS | TRANSPARENCY_FEATURES | BUSINESS_FUNCS)
+def _compile_keyword_scan(keywords):
+    """Build a one-pass scanner returning which keywords occur (as substrings) in a lowercased text"""
+    keywords = frozenset(keywords)
+    # Zero-width lookahead so overlapping hits are all seen; longest alternative wins at each position
+    pattern = re.compile('(?=(' + '|'.join(
+        re.escape(k) for k in sorted(keywords, key=len, reverse=True)) + '))')
+    # A hit also implies every shorter keyword it contains ('uniswap' -> 'swap', 'governance' -> 'govern')
+    closure = {k: frozenset(q for q in keywords if q in k) for k in keywords}
+
+    def scan(text):
+        found = set()
+        for hit in set(pattern.findall(text)):
+            found |= closure[hit]
+        return frozenset(found)
+    return scan
+
+_find_contract_patterns = _compile_keyword_scan(ALL_CONTRACT_PATTERNS)
+
+def _compile_keyword_search(keywords):
+    """Build a case-insensitive any-keyword test that stops at the first substring hit"""
+    return re.compile('|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)), re.IGNORECASE).search
+
+# --- Scorer keyword and rule constants ---
+# Ordered tuples where the order shows up in indicator messages
+KYC_KEYWORDS = ('kyc', 'aml', 'compliant', 'regulatory', 'regulated', 'license', 'governance',
+                'oversight', 'audit', 'transparency')
+# Red flag names shared by detection, the compliance checks and the risk boosts
+RF_LOW_LIQUIDITY = 'low_liquidity'
+RF_UNVERIFIED_CONTRACT = 'unverified_contract'
+RF_HIGH_CONCENTRATION = 'high_concentration'
+RF_EU_UNLICENSED_STABLECOIN = 'eu_unlicensed_stablecoin'
+RF_EU_REGULATORY_ISSUES = 'eu_regulatory_issues'
+RF_MICA_NON_COMPLIANT = 'mica_non_compliant'
+RF_MICA_NO_WHITEPAPER = 'mica_no_whitepaper'
+CRITICAL_COMPLIANCE_FLAGS = (RF_EU_UNLICENSED_STABLECOIN, RF_EU_REGULATORY_ISSUES,
+                             RF_MICA_NON_COMPLIANT, RF_MICA_NO_WHITEPAPER)
+CERTIK_STRONG_SCORE = 80  # audited and at least this -> strongest AML credit
+CERTIK_WEAK_SCORE = 60    # below this counts like an unaudited token
+REGULATED_EXCHANGES = frozenset({'coinbase', 'kraken', 'gemini'})
+MAJOR_EXCHANGES = frozenset({'binance', 'coinbase', 'kraken', 'gemini', 'bitfinex', 'huobi'})
+INTEGRATION_PROTOCOLS = ('zapper', 'debank', 'defillama')
+SOCIAL_PLATFORMS = ('twitter_screen_name', 'telegram_channel_identifier',
+                    'subreddit_url', 'discord', 'medium', 'reddit')
+ESTABLISHED_PLATFORMS = frozenset({'ethereum', 'binance-smart-chain', 'polygon-pos', 'avalanche', 'solana'})
+BUSINESS_KEYWORDS = frozenset({'utility', 'governance', 'staking', 'yield', 'lending', 'swap', 'amm', 'dex'})
+ESG_ENV_KEYWORDS = frozenset({
+    'carbon', 'green', 'sustainable', 'renewable', 'energy', 'climate',
+    'environmental', 'eco', 'clean', 'zero-emission', 'carbon-neutral',
+    'solar', 'wind', 'hydro', 'geothermal', 'biomass', 'recycling'})
+ESG_SOCIAL_KEYWORDS = frozenset({
+    'social', 'community', 'inclusive', 'equality', 'diversity',
+    'education', 'healthcare', 'charity', 'donation', 'philanthropy',
+    'microfinance', 'banking', 'financial inclusion', 'unbanked',
+    'developing', 'emerging markets', 'accessibility'})
+ESG_GOV_KEYWORDS = frozenset({
+    'governance', 'dao', 'democratic', 'transparent', 'accountable',
+    'voting', 'proposal', 'community-driven', 'decentralized',
+    'open source', 'audit', 'compliance', 'regulation', 'legal'})
+# Description keyword groups counted once per report (ReportView.keyword_counts)
+DESCRIPTION_KEYWORD_GROUPS = {
+    'env': ESG_ENV_KEYWORDS,
+    'social': ESG_SOCIAL_KEYWORDS,
+    'gov': ESG_GOV_KEYWORDS,
+    'business': BUSINESS_KEYWORDS,
+}
+# Every description/homepage keyword group, matched together in a single pass per text
+_find_text_keywords = _compile_keyword_scan(set(KYC_KEYWORDS).union(*DESCRIPTION_KEYWORD_GROUPS.values()))
+def _address_key(address):
+    """Canonical 20-byte lookup key for a 0x-prefixed EVM address (any case), else None"""
+    if isinstance(address, str) and len(address) == 42 and address[:2] in ('0x', '0X'):
+        try:
+            return bytes.fromhex(address[2:])
+        except ValueError:
+            return None
+    return None
+
+# MiCA / EU regulatory keyword groups, matched against lowercased symbols and descriptions
+STABLECOIN_INDICATORS = frozenset({
+    'stablecoin', 'stable', 'usd', 'eur', 'gbp', 'jpy', 'chf',
+    'tether', 'usdc', 'dai', 'busd', 'frax', 'gusd', 'husd'})
+STABLECOIN_KEYWORDS = frozenset({
+    'stablecoin', 'stable coin', 'pegged', 'backed by', 'collateralized',
+    'usd stable', 'dollar stable', 'price stable'})
+EU_INDICATORS = frozenset({
+    'european union', 'eu', 'europe', 'germany', 'france', 'italy',
+    'spain', 'netherlands', 'belgium', 'luxembourg', 'ireland',
+    'malta', 'cyprus', 'estonia', 'lithuania', 'latvia'})
+MICA_COMPLIANCE_INDICATORS = frozenset({
+    'mica', 'mica compliant', 'eu authorized', 'eu licensed',
+    'regulated', 'authorization', 'license', 'compliance'})
+_find_regulatory_keywords = _compile_keyword_scan(
+    STABLECOIN_INDICATORS | STABLECOIN_KEYWORDS | EU_INDICATORS | MICA_COMPLIANCE_INDICATORS)
+# Single-group tests for the standalone checks; they take the raw description, no lowercased copy
+_search_eu_indicators = _compile_keyword_search(EU_INDICATORS)
+_search_mica_indicators = _compile_keyword_search(MICA_COMPLIANCE_INDICATORS)
+_search_stablecoin_keywords = _compile_keyword_search(STABLECOIN_KEYWORDS)
+# Known stablecoin contracts without MiCA authorization (also the is_stablecoin address list),
+# keyed by _address_key
+UNLICENSED_STABLECOINS = {_address_key(address): info for address, info in {
+    # USDT - Not MiCA compliant, major EU regulatory issue
+    "0xdac17f958d2ee523a2206206994597c13d831ec7": {
+        "symbol": "USDT",
+        "name": "Tether USD",
+        "issue": "Not MiCA compliant - major EU regulatory risk",
+        "eu_status": "Unlicensed",
+        "restrictions": "Cannot be offered to EU retail investors"
+    },
+    # USDC - Not fully MiCA compliant
+    "0xa0b86a33e6441b8c4c8c0b8c4c8c0b8c4c8c0b8c": {
+        "symbol": "USDC",
+        "name": "USD Coin",
+        "issue": "Limited MiCA compliance",
+        "eu_status": "Restricted",
+        "restrictions": "Limited EU availability"
+    },
+    # DAI - Decentralized stablecoin, regulatory uncertainty
+    "0x6b175474e89094c44da98b954eedeac495271d0f": {
+        "symbol": "DAI",
+        "name": "Dai",
+        "issue": "Decentralized stablecoin - regulatory uncertainty",
+        "eu_status": "Unclear",
+        "restrictions": "May face regulatory challenges"
+    },
+    # BUSD - Binance USD, regulatory issues
+    "0x4fabb145d64652a948d72533023f6e7a623c7c53": {
+        "symbol": "BUSD",
+        "name": "Binance USD",
+        "issue": "Binance regulatory issues in EU",
+        "eu_status": "Restricted",
+        "restrictions": "Limited EU availability"
+    },
+    # FRAX - Algorithmic stablecoin, regulatory concerns
+    "0x853d955acef822db058eb8505911ed77f175b99e": {
+        "symbol": "FRAX",
+        "name": "Frax",
+        "issue": "Algorithmic stablecoin - regulatory concerns",
+        "eu_status": "Unclear",
+        "restrictions": "May face regulatory challenges"
+    }
+}.items()}
+MAJOR_UNLICENSED_STABLECOIN_SYMBOLS = frozenset({'USDT', 'USDC', 'DAI', 'BUSD', 'FRAX'})
+STABLECOIN_SYMBOLS = MAJOR_UNLICENSED_STABLECOIN_SYMBOLS | {'TUSD', 'USDP', 'GUSD', 'LUSD', 'SUSD'}
+# Tokens with known EU regulatory problems, keyed by _address_key
+EU_REGULATORY_ISSUES = {_address_key(address): info for address, info in {
+    "0x1f9840a85d5af5bf1d1762f925bdaddc4201f984": {  # UNI
+        "symbol": "UNI",
+        "issue": "Uniswap regulatory uncertainty in EU",
+        "eu_status": "Restricted",
+        "restrictions": "DeFi governance token - regulatory concerns"
+    },
+    "0x6b3595068778dd592e39a122f4f5a5cf09c90fe2": {  # SUSHI
+        "symbol": "SUSHI",
+        "issue": "DeFi governance token - regulatory uncertainty",
+        "eu_status": "Restricted",
+        "restrictions": "May face regulatory challenges"
+    }
+}.items()}
+PROFESSIONAL_LINKS = ('linkedin', 'medium', 'blog', 'docs', 'documentation')
+# Every stablecoin / MiCA signal for one token, from one keyword pass over its symbol and description
+StablecoinMatch = namedtuple('StablecoinMatch', ['unlicensed', 'major_symbol', 'mica_indicator',
+                                                 'eu_establishment', 'mica_authorization', 'is_stablecoin'])
+
+@functools.lru_cache(maxsize=4096)
+def _detect_stablecoin(token_address, symbol, description_lower):
+    """Classify a token against the EU stablecoin tables and the MiCA keyword groups"""
+    symbol_upper = symbol.upper()
+    symbol_hits = _find_regulatory_keywords(symbol.lower())
+    description_hits = _find_regulatory_keywords(description_lower)
+    unlicensed = UNLICENSED_STABLECOINS.get(_address_key(token_address))
+    return StablecoinMatch(
+        unlicensed=unlicensed,
+        major_symbol=symbol_upper in MAJOR_UNLICENSED_STABLECOIN_SYMBOLS,
+        mica_indicator=not STABLECOIN_INDICATORS.isdisjoint(symbol_hits | description_hits),
+        eu_establishment=not EU_INDICATORS.isdisjoint(description_hits),
+        mica_authorization=not MICA_COMPLIANCE_INDICATORS.isdisjoint(description_hits),
+        is_stablecoin=(unlicensed is not None or symbol_upper in STABLECOIN_SYMBOLS
+                       or not STABLECOIN_KEYWORDS.isdisjoint(description_hits)),
+    )
+
+# Memoized checks behind the standalone DeFiRiskAssessor helpers; all arguments are strings
+@functools.lru_cache(maxsize=4096)
+def _has_eu_indicator(description):
+    """Whether a project description mentions an EU location"""
+    return _search_eu_indicators(description) is not None
+
+@functools.lru_cache(maxsize=4096)
+def _has_mica_indicator(description):
+    """Whether a project description mentions MiCA authorization or licensing"""
+    return _search_mica_indicators(description) is not None
+
+@functools.lru_cache(maxsize=4096)
+def _is_stablecoin(token_address, symbol, description):
+    """Stablecoin by known address, then by symbol, then by project description"""
+    if _address_key(token_address) in UNLICENSED_STABLECOINS or symbol.upper() in STABLECOIN_SYMBOLS:
+        return True
+    return _search_stablecoin_keywords(description) is not None
+
+# classify_risk: upper score bound of each level (inclusive); above the last is Extreme Risk
+RISK_LEVEL_THRESHOLDS = (50, 100, 120)
+RISK_LEVELS = ("Low Risk", "Medium Risk", "High Risk", "Extreme Risk")
+# Red flags that force Extreme Risk regardless of score, in override priority order
+EU_EXTREME_RISK_FLAGS = (
+    (RF_EU_UNLICENSED_STABLECOIN, 'unlicensed stablecoin status'),
+    (RF_EU_REGULATORY_ISSUES, 'EU regulatory issues'),
+    (RF_MICA_NON_COMPLIANT, 'MiCA non-compliance'),
+)
+
+def _add_red_flag(risk_report, flag):
+    """Append flag to the report's on-chain red flags unless it is already there"""
+    red_flags = risk_report['onchain']['red_flags']
+    if flag not in red_flags:
+        red_flags.append(flag)
+# (metric, low, high, outcomes) for CoinGecko GitHub metrics; outcomes are indexed by
+# (val > low) + (val >= high) and hold (score_delta, indicator_template, sets_data_found) or None
+GITHUB_METRIC_TIERS = tuple(
+    (metric, low, high, ((penalty, f"Low {label}: {{}}", False), None, (boost, f"High {label}: {{}}", True)))
+    for metric, label, boost, penalty, high, low in (
+        ('commit_count_4_weeks', 'commits (4w)', -1, 1, 50, 5),
+        ('stars', 'stars', -0.5, 0.5, 1000, 10),
+        ('forks', 'forks', -0.5, 0.5, 500, 5),
+        ('open_issues', 'open issues', 0.5, -0.5, 100, 0),
+        ('contributors', 'contributors', -1, 1, 20, 1),
+    )
+)
+
+# --- Numeric kernels ---
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _series_mean_last(values):
+        """Return (mean, last value) of a non-empty float64 series"""
+        n = len(values)
+        total = 0.0
+        for i in range(n):
+            total += values[i]
+        return total / n, values[n - 1]
+else:
+    def _series_mean_last(values):
+        """Return (mean, last value) of a non-empty float64 series"""
+        return values.mean(), values[-1]
+
+@njit(cache=True)
+def _marketing_demand_kernel(avg_volume, recent_volume, social_presence, volume_24h, price_change_24h,
+                             transfer_count, holder_delta, liquidity_delta, tracked_by_defillama):
+    """Numeric core of score_marketing_demand; NaN inputs fail every comparison and add nothing"""
+    score = 5.0
+    data_found = False
+    # Santiment social activity
+    if avg_volume > 10000 and recent_volume > 5000:
+        score -= 2  # Very high social activity
+        data_found = True
+    elif avg_volume > 1000 and recent_volume > 500:
+        score -= 1  # High social activity
+        data_found = True
+    elif avg_volume < 100 or recent_volume < 50:
+        score += 2  # Low social activity
+    elif avg_volume < 500:
+        score += 1  # Moderate social activity
+    # Social media presence
+    if social_presence >= 3:
+        score -= 1
+        data_found = True
+    elif social_presence == 0:
+        score += 2
+    elif social_presence == 1:
+        score += 1
+    # Trading volume as demand indicator
+    if volume_24h > 10_000_000:
+        score -= 2
+        data_found = True
+    elif volume_24h > 1_000_000:
+        score -= 1
+        data_found = True
+    elif volume_24h < 10_000:
+        score += 2
+    elif volume_24h < 100_000:
+        score += 1
+    # Price performance as demand indicator
+    if price_change_24h > 20:
+        score -= 1
+        data_found = True
+    elif price_change_24h < -20:
+        score += 1
+    # Alternative data sources when primary data is limited
+    if not data_found:
+        if transfer_count > 100:
+            score -= 1
+        elif 0 < transfer_count < 10:
+            score += 1
+        score += holder_delta + liquidity_delta
+        if tracked_by_defillama:
+            score -= 1
+    return max(1.0, min(10.0, score))
+
+# Final ESG adjustment: esg_score is an integer tally, so with side='right' the bounds give
+# <= -6 -> +2, -5..-3 -> +1, -2..4 -> 0, 5..7 -> -1, >= 8 -> -2 on the risk score
+ESG_ADJUSTMENT_BOUNDS = np.array([-5, -2, 5, 8])
+ESG_ADJUSTMENT_DELTAS = np.array([2.0, 1.0, 0.0, -1.0, -2.0])
+
+@njit(cache=True)
+def _esg_keyword_tier(count):
+    """(score_delta, esg_delta, sets_data_found) for one ESG description keyword count"""
+    if count >= 3:
+        return -2.0, 3, True
+    if count >= 2:
+        return -1.0, 2, True
+    if count >= 1:
+        return 0.0, 1, False
+    return 1.0, -1, False
+
+@njit(cache=True)
+def _esg_activity_tier(value):
+    """(score_delta, esg_delta, sets_data_found) for a CoinGecko community or developer score"""
+    if value > 80:
+        return -1.0, 2, True
+    if value > 50:
+        return -0.5, 1, True
+    if value < 10:
+        return 1.0, -1, False
+    return 0.0, 0, False
+
+@njit(cache=True)
+def _esg_impact_kernel(env_count, social_count, gov_count, community_score, dev_score,
+                       contract_verified, has_contract_source, gov_func_count, trans_count,
+                       total_holders, top10_concentration, liquidity_delta, liquidity_esg_delta,
+                       market_cap, metadata_points, tracked_by_defillama, prof_count):
+    """Numeric core of score_esg_impact; NaN inputs fail every comparison and add nothing"""
+    score = 5.0
+    data_found = False
+    esg_score = 0
+    # Environmental, social and governance description keywords
+    score_delta, esg_delta, found = _esg_keyword_tier(env_count)
+    score += score_delta
+    esg_score += esg_delta
+    data_found = data_found or found
+    score_delta, esg_delta, found = _esg_keyword_tier(social_count)
+    score += score_delta
+    esg_score += esg_delta
+    data_found = data_found or found
+    score_delta, esg_delta, found = _esg_keyword_tier(gov_count)
+    score += score_delta
+    esg_score += esg_delta
+    data_found = data_found or found
+    # Community engagement and developer activity
+    score_delta, esg_delta, found = _esg_activity_tier(community_score)
+    score += score_delta
+    esg_score += esg_delta
+    data_found = data_found or found
+    score_delta, esg_delta, found = _esg_activity_tier(dev_score)
+    score += score_delta
+    esg_score += esg_delta
+    data_found = data_found or found
+    # Alternative data sources when primary data is limited
+    if not data_found:
+        if contract_verified:
+            score -= 1
+            esg_score += 2
+        else:
+            esg_score -= 1
+        if has_contract_source:
+            if gov_func_count >= 2:
+                score -= 1
+                esg_score += 2
+            elif gov_func_count >= 1:
+                esg_score += 1
+            else:
+                score += 1
+                esg_score -= 1
+            if trans_count >= 5:
+                score -= 1
+                esg_score += 2
+            elif trans_count >= 3:
+                esg_score += 1
+            else:
+                score += 1
+                esg_score -= 1
+        # Holder distribution (NaN when holders are missing)
+        if total_holders > 100000 and top10_concentration < 30:
+            score -= 2
+            esg_score += 3
+        elif total_holders > 50000 and top10_concentration < 50:
+            score -= 1
+            esg_score += 2
+        elif total_holders > 10000:
+            esg_score += 1
+        elif total_holders < 1000 or top10_concentration > 80:
+            score += 2
+            esg_score -= 2
+        elif total_holders < 5000 or top10_concentration > 60:
+            score += 1
+            esg_score -= 1
+        score += liquidity_delta
+        esg_score += liquidity_esg_delta
+        if market_cap > 1_000_000_000:
+            score -= 1
+            esg_score += 2
+        elif market_cap > 100_000_000:
+            esg_score += 1
+        elif market_cap < 1_000_000:
+            score += 1
+            esg_score -= 1
+        esg_score += metadata_points
+        if tracked_by_defillama:
+            esg_score += 1
+        if prof_count >= 2:
+            score -= 1
+            esg_score += 2
+        elif prof_count >= 1:
+            esg_score += 1
+        else:
+            score += 1
+            esg_score -= 1
+    # ESG score adjustment (the intermediate 1/10 clamps were subsumed by the final one)
+    score += ESG_ADJUSTMENT_DELTAS[np.searchsorted(ESG_ADJUSTMENT_BOUNDS, esg_score, side='right')]
+    return max(1.0, min(10.0, score))
+
+@njit(cache=True)
+def _esg_impact_batch_kernel(features):
+    """Row-wise _esg_impact_kernel over an (n_reports, 17) float64 matrix of its arguments"""
+    scores = np.empty(features.shape[0])
+    for i in range(features.shape[0]):
+        row = features[i]
+        scores[i] = _esg_impact_kernel(row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
+                                       row[8], row[9], row[10], row[11], row[12], row[13], row[14],
+                                       row[15], row[16])
+    return scores
+
+# Kernel arguments for a report with no CoinGecko project and no fallback sources: three keyword
+# misses, two zero activity scores, the fallback penalties for an unverified contract, zero
+# liquidity, a zero market cap and no professional links, and the resulting ESG penalty give a
+# constant score
+ESG_EMPTY_INPUTS = (0, 0, 0, 0, 0, False, False, 0, 0, float('nan'), float('nan'),
+                    1, -1, 0, 0, False, 0)
+ESG_EMPTY_REPORT_SCORE = float(_esg_impact_kernel(*ESG_EMPTY_INPUTS))  # also warms the kernel
+
+def _nan_if_none(value):
+    """Map a missing ReportView number to NaN for the numeric kernels"""
+    return float('nan') if value is None else value
+
+# The transfer ladders top out at 100 transfers, so a longer sample cannot change a tier
+MAX_SCORED_TRANSFERS = 200
+
+def _clamp_score(score):
+    """Clamp a raw component score into [1, 10] as a float"""
+    return 1.0 if score < 1 else 10.0 if score > 10 else float(score)
+
+def _rounded_score(score):
+    """Round half-to-even and clamp into [1, 9] for the provider-backed scorers (never 10/10)"""
+    score = round(score)
+    return 1 if score < 1 else 9 if score > 9 else score
+
+class _IndicatorLog:
+    """Scorer indicator messages; with verbose=False only the count is kept and nothing is formatted"""
+    __slots__ = ('messages', 'count', 'verbose')
+
+    def __init__(self, verbose=True):
+        self.messages = []
+        self.count = 0
+        self.verbose = verbose
+
+    def add(self, template, *args):
+        self.count += 1
+        if self.verbose:
+            self.messages.append(template.format(*args) if args else template)
+
+    def __len__(self):
+        return self.count
+
+def _transfer_stats(transfers):
+    """Fold up to MAX_SCORED_TRANSFERS Moralis transfers into (timestamped count, total value)"""
+    count = 0
+    volume = 0.0
+    for t in islice(transfers, MAX_SCORED_TRANSFERS):
+        if t.get('block_timestamp'):
+            count += 1
+        value = t.get('value')
+        if value:
+            volume += float(value)
+    return count, volume
+
+def _count_up_to(flags, cap):
+    """Count truthy flags, stopping once cap is reached (callers only compare against thresholds <= cap)"""
+    count = 0
+    for flag in flags:
+        if flag:
+            count += 1
+            if count >= cap:
+                break
+    return count
+
+def _santiment_numbers(points):
+    """Yield the non-null 'value' fields of a Santiment series, raising TypeError on non-numbers
+    
+    np.fromiter would parse numeric strings; the sum() this replaced rejected them.
+    """
+    for point in points:
+        if isinstance(point, dict):
+            value = point.get('value')
+            if value is not None:
+                if not isinstance(value, (int, float)):
+                    raise TypeError(f"Non-numeric Santiment value: {value!r}")
+                yield value
+
+def _santiment_values(points):
+    """Return the non-null 'value' fields of a Santiment series as a float64 array"""
+    return np.fromiter(_santiment_numbers(points), dtype=np.float64)
+
+def _santiment_last(points):
+    """Return the latest non-null 'value' of a Santiment series as given, for indicator text"""
+    return next(point['value'] for point in reversed(points)
+                if isinstance(point, dict) and point.get('value') is not None)
+
+# --- Compiled scoring ladders ---
+# Each rule is an ordered if/elif ladder over one value of the risk report.
+# Rungs are (op, threshold, score_delta, side_delta, sets_data_found); the side
+# delta feeds the scorer's adherence/expertise tally. guard=True skips the rule
+# when the parent container is empty, truthy=True skips falsy values, and
+# use_abs compares abs(value).
+LadderRule = namedtuple('LadderRule', ['path', 'rungs', 'default', 'guard', 'truthy', 'use_abs'],
+                        defaults=(0, False, False, False))
+
+_CG = ('market', 'coingecko')
+_CG_MARKET = _CG + ('market_data',)
+
+# Liquidity (USD) ladders per scorer, in the same rung format as LadderRule
+LIQUIDITY_LADDERS = {
+    'industry_impact': (('>', 10_000_000, -2, 0, False), ('>', 1_000_000, -1, 0, False), ('<', 100_000, 1, 0, False)),
+    'roadmap_adherence': (('>', 10_000_000, -1, 2, False), ('>', 1_000_000, -0.5, 1, False),
+                          ('<', 100_000, 2, -2, False), ('<', 500_000, 1, -1, False)),
+    'team_expertise': (('>', 10_000_000, -2, 3, False), ('>', 1_000_000, -1, 2, False),
+                       ('<', 10_000, 2, -2, False), ('<', 100_000, 1, -1, False)),
+    'management_strategy': (('>', 1_000_000, -1, 0, True), ('<', 100_000, 1, 0, False)),
+    'code_security': (('<', 50_000, 1, 0, False),),
+    'marketing_demand': (('>', 5_000_000, -1, 0, False), ('<', 100_000, 1, 0, False)),
+    'esg_impact': (('>', 10_000_000, -1, 2, False), ('>', 1_000_000, 0, 1, False), ('<', 100_000, 1, -1, False)),
+    'market_dynamics': (('>', 10_000_000, -1, 0, False), ('<', 100_000, 1, 0, False)),
+}
+
+# Holder-count ladders per scorer (single-variable ones; the management and ESG
+# checks also depend on concentration and stay inline)
+HOLDER_LADDERS = {
+    'industry_impact': (('>', 50_000, -2, 0, False), ('>', 10_000, -1, 0, False), ('<', 1_000, 1, 0, False)),
+    'tech_innovation': (('>', 50_000, -1, 2, False), ('>', 10_000, 0, 1, False), ('<', 1_000, 1, -1, False)),
+    'whitepaper_quality': (('>', 50_000, -1, 2, False), ('>', 10_000, 0, 1, False), ('<', 1_000, 1, -1, False)),
+    'roadmap_adherence': (('>', 100_000, -1, 2, False), ('>', 50_000, -0.5, 1, False),
+                          ('<', 1_000, 2, -2, False), ('<', 5_000, 1, -1, False)),
+    'team_expertise': (('>', 100_000, -1, 2, False), ('>', 50_000, 0, 1, False), ('<', 1_000, 1, -1, False)),
+    'marketing_demand': (('>', 50_000, -2, 0, False), ('>', 10_000, -1, 0, False), ('<', 1_000, 1, 0, False)),
+    'global_reach': (('>', 100_000, -2, 0, False), ('>', 20_000, -1, 0, False), ('<', 1_000, 1, 0, False)),
+}
+
+def _ladder_delta(value, rungs):
+    """Return (score_delta, side_delta, sets_data_found) for the first matching rung"""
+    for op, threshold, score_delta, side_delta, sets_found in rungs:
+        if (value > threshold) if op == '>' else (value < threshold) if op == '<' else (value <= threshold):
+            return score_delta, side_delta, sets_found
+    return 0, 0, False
+
+def _bucket_index(thresholds, value):
+    """Map a value to its bucket: even indexes are open intervals, odd ones exact thresholds"""
+    i = bisect_left(thresholds, value)
+    if i < len(thresholds) and thresholds[i] == value:
+        return 2 * i + 1
+    return 2 * i
+
+def _build_bucket_table(ladders):
+    """Precompute every ladder's delta for each bucket of their shared thresholds"""
+    thresholds = sorted({rung[1] for rungs in ladders.values() for rung in rungs})
+    samples = []
+    prev = None
+    for threshold in thresholds:
+        samples.append(threshold - 0.5 if prev is None else (prev + threshold) / 2)
+        samples.append(threshold)
+        prev = threshold
+    samples.append(thresholds[-1] + 0.5)
+    table = {name: tuple(_ladder_delta(v, rungs) for v in samples) for name, rungs in ladders.items()}
+    return tuple(thresholds), table
+
+# One bisect per report (ReportView.holder_bucket) then a tuple lookup per scorer
+HOLDER_THRESHOLDS, HOLDER_DELTAS = _build_bucket_table(HOLDER_LADDERS)
+
+# score_market_dynamics checks, one variable each ('<=' closes the healthy ranges):
+# absolute 24h price change (%), volume / market cap, Moralis transfer count, top-10 concentration
+MARKET_DYNAMICS_LADDERS = {
+    'volatility': (('<', 10, -1, 0, True), ('>', 50, 2, 0, False), ('>', 20, 1, 0, False)),
+    'volume_ratio': (('>', 0.5, 1, 0, False), ('<', 0.01, 1, 0, False), ('<=', 0.1, -1, 0, True)),
+    'transfer_count': (('>', 200, 1, 0, False), ('<', 10, 1, 0, False), ('<', 20, 0, 0, False),
+                       ('<=', 100, -1, 0, False)),
+    'top10_concentration': (('>', 80, 1, 0, False), ('<', 30, -1, 0, False)),
+}
+# Each variable has its own thresholds: name -> (thresholds, per-bucket rung results)
+MARKET_DYNAMICS_TABLES = {}
+for _name, _rungs in MARKET_DYNAMICS_LADDERS.items():
+    _thresholds, _table = _build_bucket_table({_name: _rungs})
+    MARKET_DYNAMICS_TABLES[_name] = (_thresholds, _table[_name])
+
+def _market_dynamics_delta(name, value):
+    """Return (score_delta, side_delta, sets_data_found) of a market-dynamics check via one bisect"""
+    thresholds, deltas = MARKET_DYNAMICS_TABLES[name]
+    return deltas[_bucket_index(thresholds, value)]
+
+# CoinGecko developer_score; the side delta slot carries the indicator template
+DEV_SCORE_THRESHOLDS, _dev_score_table = _build_bucket_table({'dev_activity': (
+    ('>', 80, -2, "Exceptional developer score: {}", True), ('>', 50, -1, "Good developer score: {}", True),
+    ('<', 5, 2, "Very poor developer score: {}", False), ('<', 15, 1, "Poor developer score: {}", False))})
+DEV_SCORE_TIERS = _dev_score_table['dev_activity']
+
+# Santiment dev activity. A high tier needs both the average and the latest value above
+# its thresholds (bisect_left: strict '>'); otherwise the lowest tier either value falls
+# under applies (bisect_right: strict '<'). The latest value has no 'moderate' bound.
+DEV_ACTIVITY_HIGH = (((50, 100, 150), (0, 1, 2, 3)), ((20, 50, 75), (0, 1, 2, 3)))
+DEV_ACTIVITY_LOW = (((5, 15, 30), (3, 2, 1, 0)), ((2, 8), (3, 2, 0)))
+# (score_delta, indicator_template, sets_data_found) indexed by tier + 3, from -3 (very low) to 3 (exceptional)
+DEV_ACTIVITY_TIERS = tuple(
+    tier and (tier[0], tier[1] + " dev activity: {:.1f} avg, {} recent", tier[2]) for tier in (
+        (3, "Very low", False), (2, "Low", False), (1, "Moderate", False), None,
+        (-1, "High", True), (-2, "Very high", True), (-3, "Exceptional", True),
+    )
+)
+
+def _dev_activity_tier(avg_activity, recent_activity):
+    """Map Santiment average/latest dev activity to a tier in -3..3 (0 = no adjustment)"""
+    (avg_high, avg_high_tiers), (recent_high, recent_high_tiers) = DEV_ACTIVITY_HIGH
+    high = min(avg_high_tiers[bisect_left(avg_high, avg_activity)],
+               recent_high_tiers[bisect_left(recent_high, recent_activity)])
+    if high:
+        return high
+    (avg_low, avg_low_tiers), (recent_low, recent_low_tiers) = DEV_ACTIVITY_LOW
+    return -max(avg_low_tiers[bisect_right(avg_low, avg_activity)],
+                recent_low_tiers[bisect_right(recent_low, recent_activity)])
+
+# Score delta per tier + 3, for bulk scoring without the indicator strings
+DEV_ACTIVITY_DELTAS = np.array([tier[0] if tier else 0 for tier in DEV_ACTIVITY_TIERS], dtype=np.float64)
+
+def dev_activity_tiers(avg_activity, recent_activity):
+    """Array form of _dev_activity_tier for scoring many tokens' Santiment series at once"""
+    avg_activity = np.asarray(avg_activity, dtype=np.float64)
+    recent_activity = np.asarray(recent_activity, dtype=np.float64)
+    (avg_high, avg_high_tiers), (recent_high, recent_high_tiers) = DEV_ACTIVITY_HIGH
+    high = np.minimum(np.take(avg_high_tiers, np.searchsorted(avg_high, avg_activity, side='left')),
+                      np.take(recent_high_tiers, np.searchsorted(recent_high, recent_activity, side='left')))
+    (avg_low, avg_low_tiers), (recent_low, recent_low_tiers) = DEV_ACTIVITY_LOW
+    low = np.maximum(np.take(avg_low_tiers, np.searchsorted(avg_low, avg_activity, side='right')),
+                     np.take(recent_low_tiers, np.searchsorted(recent_low, recent_activity, side='right')))
+    return np.where(high > 0, high, -low)
+
+SCORING_RULES = {
+    'roadmap_adherence': {
+        'primary': [
+            LadderRule(_CG_MARKET + ('price_change_percentage_30d',), (
+                ('>', 100, -2, 3, True), ('>', 50, -1, 2, True), ('>', 20, 0, 1, False),
+                ('<', -50, 2, -2, False), ('<', -20, 1, -1, False)), truthy=True),
+            LadderRule(_CG + ('community_score',), (
+                ('>', 80, -1, 2, True), ('>', 50, -0.5, 1, True), ('<', 10, 1, -1, False))),
+        ],
+        'fallback': [
+            LadderRule(('onchain', 'holders', 'total_holders'), HOLDER_LADDERS['roadmap_adherence'], guard=True),
+            LadderRule(('onchain', 'liquidity', 'total_liquidity_usd'), LIQUIDITY_LADDERS['roadmap_adherence']),
+            LadderRule(_CG_MARKET + ('total_volume', 'usd'), (
+                ('>', 10_000_000, -1, 2, False), ('>', 1_000_000, 0, 1, False),
+                ('<', 10_000, 1, -1, False))),
+            LadderRule(_CG_MARKET + ('market_cap', 'usd'), (
+                ('>', 1_000_000_000, -1, 2, False), ('>', 100_000_000, 0, 1, False),
+                ('<', 1_000_000, 1, -1, False))),
+        ],
+    },
+    'team_expertise': {
+        'primary': [
+            LadderRule(_CG + ('trust_score',), (
+                ('>', 9, -2, 3, True), ('>', 7, -1, 2, True),
+                ('<', 3, 2, -2, False), ('<', 5, 1, -1, False))),
+            LadderRule(_CG + ('developer_score',), (
+                ('>', 80, -2, 3, True), ('>', 50, -1, 2, True),
+                ('<', 10, 2, -2, False), ('<', 30, 1, -1, False))),
+        ],
+        'fallback': [
+            LadderRule(('onchain', 'liquidity', 'total_liquidity_usd'), LIQUIDITY_LADDERS['team_expertise']),
+            LadderRule(_CG_MARKET + ('price_change_percentage_24h',), (
+                ('<', 10, -2, 3, False), ('<', 20, -1, 2, False),
+                ('>', 50, 2, -2, False), ('>', 30, 1, -1, False)), truthy=True, use_abs=True),
+            LadderRule(('onchain', 'holders', 'total_holders'), HOLDER_LADDERS['team_expertise'], guard=True),
+            LadderRule(_CG_MARKET + ('market_cap', 'usd'), (
+                ('>', 1_000_000_000, -1, 2, False), ('>', 100_000_000, 0, 1, False),
+                ('<', 1_000_000, 1, -1, False))),
+        ],
+    },
+}
+
+def _compile_ladders(name, rules):
+    """Generate a straight-line (report, score, side, found) -> tuple function from ladder rules"""
+    lines = [f"def {name}(r, s, a, found):"]
+    for rule in rules:
+        lines.append("    try:")
+        expr = "r" + "".join(f".get({key!r}, {{}})" for key in rule.path[:-1])
+        pad = "        "
+        if rule.guard:
+            lines.append(f"{pad}p = {expr}")
+            lines.append(f"{pad}if p:")
+            pad += "    "
+            expr = "p"
+        lines.append(f"{pad}v = {expr}.get({rule.path[-1]!r}, {rule.default!r})")
+        if rule.truthy:
+            lines.append(f"{pad}if v:")
+            pad += "    "
+        if rule.use_abs:
+            lines.append(f"{pad}v = abs(v)")
+        for i, (op, threshold, score_delta, side_delta, sets_found) in enumerate(rule.rungs):
+            lines.append(f"{pad}{'if' if i == 0 else 'elif'} v {op} {threshold!r}:")
+            body = [f"a += {side_delta!r}"]
+            if score_delta:
+                body.insert(0, f"s += {score_delta!r}")
+            if sets_found:
+                body.append("found = True")
+            lines.extend(f"{pad}    {stmt}" for stmt in body)
+        # Each rule gets its own handler so one malformed field only skips that ladder
+        lines.append("    except Exception:")
+        lines.append("        pass")
+    lines.append("    return s, a, found")
+    namespace = {}
+    exec(compile("\n".join(lines), f"<scoring_rules:{name}>", "exec"), namespace)
+    return namespace[name]
+
+def _get_team_stats(project_data):
+    """Return (team size, members with both name and position) for a CoinGecko project"""
+    team = project_data.get('team') or []
+    detailed = sum(1 for member in team
+                   if isinstance(member, dict) and member.get('name') and member.get('position'))
+    return len(team), detailed
+
+def _description_text(project_data):
+    """English CoinGecko project description, '' when missing or malformed"""
+    description = project_data.get('description')
+    return (description.get('en') or '') if isinstance(description, (dict, MappingProxyType)) else ''
+
+def _number_or_none(value):
+    """Return value if it is a real number, else None so callers can test instead of catching"""
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+def _market_usd(market_data, key, absent=None):
+    """USD value of a CoinGecko market_data block, absent when the block is missing"""
+    if key not in market_data:
+        return absent
+    block = market_data[key]
+    return _number_or_none(block.get('usd', 0)) if isinstance(block, (dict, MappingProxyType)) else None
+
+@dataclass(slots=True)
+class ReportView:
+    """Flat snapshot of the report fields shared by most scorers"""
+    project_data: dict = field(default_factory=dict)
+    enhanced: dict = field(default_factory=dict)
+    onchain: dict = field(default_factory=dict)
+    holders: dict = field(default_factory=dict)
+    moralis: dict = field(default_factory=dict)
+    defillama: dict = field(default_factory=dict)
+    integrations: tuple = ()
+    links: dict = field(default_factory=dict)
+    market_data: dict = field(default_factory=dict)
+    github_metrics: dict = field(default_factory=dict)
+    tickers: list = field(default_factory=list)
+    moralis_transfers: list = field(default_factory=list)
+    description_text: str = ''
+    description_lower: str = ''
+    website_lower: str = ''
+    description_keywords: frozenset = frozenset()
+    keyword_counts: dict = field(default_factory=lambda: dict.fromkeys(DESCRIPTION_KEYWORD_GROUPS, 0))
+    kyc_matches: tuple = ()
+    liquidity_usd: float | None = 0
+    total_holders: int = 0
+    holder_bucket: int | None = 0
+    top10_concentration: float = 100
+    volume_24h: float | None = None
+    market_cap: float | None = None
+    volume_24h_or_zero: float | None = 0
+    market_cap_or_zero: float | None = 0
+    price_change_24h: float | None = 0
+    trust_score: float = 0
+    dev_score: float = 0
+    community_score: float = 0
+    contract_src_lower: str = ''
+    function_count: int = 0
+    contract_patterns: frozenset = frozenset()
+
+    @classmethod
+    def from_report(cls, risk_report):
+        """Extract the shared scalars from a risk report once"""
+        project_data = (risk_report.get('market') or EMPTY).get('coingecko') or EMPTY
+        market_data = project_data.get('market_data') or EMPTY
+        links = project_data.get('links') or EMPTY
+        repos = links.get('repos_url') or EMPTY
+        description_text = _description_text(project_data)
+        homepage = links.get('homepage') or ['']
+        enhanced = risk_report.get('enhanced') or EMPTY
+        moralis = enhanced.get('moralis') or EMPTY
+        onchain = risk_report.get('onchain') or EMPTY
+        liquidity = onchain.get('liquidity', EMPTY)
+        holders = onchain.get('holders') or EMPTY
+        src_lower = (onchain.get('contract_source') or '').lower()
+        total_holders = holders.get('total_holders', 0)
+        description_lower = description_text.lower()
+        website_lower = (homepage[0] or '').lower()
+        description_keywords = _find_text_keywords(description_lower)
+        kyc_found = description_keywords | _find_text_keywords(website_lower)
+        return cls(
+            project_data=project_data,
+            enhanced=enhanced,
+            onchain=onchain,
+            holders=holders,
+            moralis=moralis,
+            defillama=enhanced.get('defillama') or EMPTY,
+            integrations=tuple(proto for proto in INTEGRATION_PROTOCOLS if enhanced.get(proto)),
+            links=links,
+            market_data=market_data,
+            # Same fallback as before: the repo link list stands in when CoinGecko has no github block
+            github_metrics=project_data.get('github') or repos.get('github') or {},
+            tickers=project_data.get('tickers') or [],
+            moralis_transfers=moralis.get('transfers') or [],
+            description_text=description_text,
+            description_lower=description_lower,
+            website_lower=website_lower,
+            description_keywords=description_keywords,
+            keyword_counts={name: len(description_keywords & group)
+                            for name, group in DESCRIPTION_KEYWORD_GROUPS.items()},
+            kyc_matches=tuple(kw for kw in KYC_KEYWORDS if kw in kyc_found),
+            # A missing entry reads as zero liquidity; None keeps the liquidity ladders failing inside
+            # their guards when the entry is not a dict
+            liquidity_usd=(_number_or_none(liquidity.get('total_liquidity_usd', 0))
+                           if isinstance(liquidity, (dict, MappingProxyType)) else None),
+            total_holders=total_holders,
+            # None makes the HOLDER_DELTAS lookup fail inside the scorers' guards, as a bad count did before
+            holder_bucket=_bucket_index(HOLDER_THRESHOLDS, total_holders) if isinstance(total_holders, (int, float)) else None,
+            top10_concentration=holders.get('top10_concentration', 100),
+            # None when CoinGecko has no total_volume / market_cap block or its usd value is not a number
+            volume_24h=_market_usd(market_data, 'total_volume'),
+            market_cap=_market_usd(market_data, 'market_cap'),
+            # The same with a missing block read as zero, for the scorers that always defaulted it to 0
+            volume_24h_or_zero=_market_usd(market_data, 'total_volume', 0),
+            market_cap_or_zero=_market_usd(market_data, 'market_cap', 0),
+            price_change_24h=_number_or_none(market_data.get('price_change_percentage_24h', 0)),
+            trust_score=project_data.get('trust_score', 0),
+            dev_score=project_data.get('developer_score', 0),
+            community_score=project_data.get('community_score', 0),
+            contract_src_lower=src_lower,
+            function_count=src_lower.count('function '),
+            contract_patterns=_find_contract_patterns(src_lower),
+        )
+
+class _ReportCache:
+    """Values derived once per risk report and reused by every scorer"""
+    __slots__ = ('has_dao', 'team_stats', 'has_fallback_data', 'view', 'stablecoin')
+
+    def __init__(self, risk_report):
+        self.view = view = ReportView.from_report(risk_report)
+        self.has_dao = 'dao' in view.description_keywords
+        self.team_stats = _get_team_stats(view.project_data)
+        # Without these or a CoinGecko project, score_esg_impact returns the constant ESG_EMPTY_REPORT_SCORE
+        self.has_fallback_data = bool(risk_report.get('enhanced') or risk_report.get('onchain')
+                                      or risk_report.get('security') or view.market_data)
+        # StablecoinMatch, filled in by DeFiRiskAssessor.detect_stablecoin on first use
+        self.stablecoin = None
+
+def _esg_kernel_inputs(cache):
+    """Gather the _esg_impact_kernel arguments for one report (ESG_EMPTY_INPUTS when it has no data)"""
+    view = cache.view
+    if not view.project_data and not cache.has_fallback_data:
+        return ESG_EMPTY_INPUTS
+    moralis = view.moralis
+    defillama = view.defillama
+    onchain = view.onchain
+    keyword_counts = view.keyword_counts
+    
+    # Fallback-source inputs, only applied by the kernel when primary data is limited
+    has_contract_source = bool(onchain.get('contract_source', ''))
+    total_holders = _number_or_none(view.total_holders)
+    top10_concentration = _number_or_none(view.top10_concentration)
+    if not view.holders or total_holders is None:
+        total_holders = top10_concentration = None
+    elif top10_concentration is None and not (total_holders < 1000 or 10000 < total_holders <= 50000):
+        # Only these rungs settle without reading the concentration; a bad one aborts the ladder on the rest
+        total_holders = None
+    liquidity_delta = liquidity_esg_delta = 0
+    if view.liquidity_usd is not None:
+        liquidity_delta, liquidity_esg_delta, _ = _ladder_delta(view.liquidity_usd, LIQUIDITY_LADDERS['esg_impact'])
+    metadata_points = 0
+    metadata = moralis.get('metadata') if isinstance(moralis, (dict, MappingProxyType)) else None
+    if isinstance(metadata, dict) and metadata:
+        # Detailed metadata indicates transparency
+        if metadata.get('name') and metadata.get('symbol') and metadata.get('decimals'):
+            metadata_points += 1
+        description = metadata.get('description')
+        if isinstance(description, str) and len(description) > 100:
+            metadata_points += 1
+    tracked_by_defillama = bool(isinstance(defillama, (dict, MappingProxyType))
+                                and (defillama.get('yields') or defillama.get('price')))
+    links = view.links
+    prof_count = _count_up_to((links.get(link) for link in PROFESSIONAL_LINKS), 2)
+    
+    return (
+        keyword_counts['env'], keyword_counts['social'], keyword_counts['gov'],
+        _nan_if_none(_number_or_none(view.community_score)), _nan_if_none(_number_or_none(view.dev_score)),
+        onchain.get('contract_verified', '') == 'verified',
+        has_contract_source, len(view.contract_patterns & ESG_GOV_FUNCS),
+        len(view.contract_patterns & TRANSPARENCY_FEATURES),
+        _nan_if_none(total_holders), _nan_if_none(top10_concentration),
+        liquidity_delta, liquidity_esg_delta, _nan_if_none(view.market_cap_or_zero),
+        metadata_points, tracked_by_defillama, prof_count)
+
+_roadmap_primary_ladders = _compile_ladders('_roadmap_primary_ladders', SCORING_RULES['roadmap_adherence']['primary'])
+_roadmap_fallback_ladders = _compile_ladders('_roadmap_fallback_ladders', SCORING_RULES['roadmap_adherence']['fallback'])
+_team_primary_ladders = _compile_ladders('_team_primary_ladders', SCORING_RULES['team_expertise']['primary'])
+_team_fallback_ladders = _compile_ladders('_team_fallback_ladders', SCORING_RULES['team_expertise']['fallback'])
+
 class DeFiRiskAssessor:
 
     def __init__(self):
@@ -653,14 +1808,14 @@ class DeFiRiskAssessor:
             {'check': 'has_honeypot_pattern', 'risk_boost': 30},
             {'check': 'owner_change_last_24h', 'risk_boost': 15},
             {'check': 'lp_lock_expiring_soon', 'risk_boost': 25},
-            {'check': 'unverified_contract', 'risk_boost': 15},
-            {'check': 'low_liquidity', 'risk_boost': 12},
-            {'check': 'high_concentration', 'risk_boost': 15},
+            {'check': RF_UNVERIFIED_CONTRACT, 'risk_boost': 15},
+            {'check': RF_LOW_LIQUIDITY, 'risk_boost': 12},
+            {'check': RF_HIGH_CONCENTRATION, 'risk_boost': 15},
             # EU Regulatory Compliance Red Flags (CRITICAL)
-            {'check': 'eu_unlicensed_stablecoin', 'risk_boost': 50},  # Forces Extreme Risk
-            {'check': 'eu_regulatory_issues', 'risk_boost': 40},      # Forces Extreme Risk
-            {'check': 'mica_non_compliant', 'risk_boost': 35},        # High Risk
-            {'check': 'mica_no_whitepaper', 'risk_boost': 0}          # No boost, just flag
+            {'check': RF_EU_UNLICENSED_STABLECOIN, 'risk_boost': 50},  # Forces Extreme Risk
+            {'check': RF_EU_REGULATORY_ISSUES, 'risk_boost': 40},      # Forces Extreme Risk
+            {'check': RF_MICA_NON_COMPLIANT, 'risk_boost': 35},        # High Risk
+            {'check': RF_MICA_NO_WHITEPAPER, 'risk_boost': 0}          # No boost, just flag
         ]
         
         # Updated weights aligned with 15-component risk model
@@ -724,7 +1879,7 @@ class DeFiRiskAssessor:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "POST"]  # Added POST for BitQuery
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HostLimitedAdapter(max_retries=retry_strategy)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
         self.session.headers.update({'User-Agent': 'DeFiRiskAssessor/3.0'})
@@ -771,6 +1926,33 @@ class DeFiRiskAssessor:
             print(f"Warning: Could not load cmc_symbol_map.json: {e}. CMC symbol map will be empty.")
             self.cmc_symbol_map = {}
         self.well_known_tokens = set(self.cmc_symbol_map.keys())
+        # Flat lowercased address -> symbol view of the map for per-token summary lookups
+        self.symbol_by_address = {addr.lower(): obj.get('symbol', '') for addr, obj in self.cmc_symbol_map.items()
+                                  if isinstance(obj, dict)}
+        
+        # Per-report values shared across scorers while assess_token scores a report, keyed by id(risk_report)
+        self._report_caches = {}
+    
+    def _get_report_cache(self, risk_report):
+        """Return the shared per-report cache, building it on first use
+        
+        Only reports registered by assess_token keep their cache; any other caller gets a throwaway one.
+        """
+        entry = self._report_caches.get(id(risk_report))
+        if entry is None or entry[0] is not risk_report:
+            return _ReportCache(risk_report)
+        if entry[1] is None:
+            entry = (risk_report, _ReportCache(risk_report))
+            self._report_caches[id(risk_report)] = entry
+        return entry[1]
+    
+    def detect_stablecoin(self, risk_report):
+        """Return the report's StablecoinMatch, running the address/symbol/keyword checks once per report"""
+        cache = self._get_report_cache(risk_report)
+        if cache.stablecoin is None:
+            cache.stablecoin = _detect_stablecoin(risk_report.get('token', ''), risk_report.get('symbol', ''),
+                                                  cache.view.description_lower)
+        return cache.stablecoin
     
     def get_contract_verification_status(self, token_address, chain):
         """Check if contract is verified on the block explorer"""
@@ -812,9 +1994,9 @@ class DeFiRiskAssessor:
                 if response.status_code != 200:
                     print(f"[API ERROR] {url} returned {response.status_code}: {response.text}")
                     return "unknown"
-                data = response.json() if response.status_code == 200 else None
+                data = _response_json(response) if response.status_code == 200 else None
                 if data:
-                    api_cache.set(cache_key, data)
+                    api_cache.set(cache_key, data, expire=CACHE_TTL_METADATA)
             
             if data and 'result' in data:
                 result = data['result']
@@ -869,9 +2051,9 @@ class DeFiRiskAssessor:
                 info_data = cached
             else:
                 response = self.session.get(url, params=params, timeout=20)
-                info_data = response.json() if response.status_code == 200 else None
+                info_data = _response_json(response) if response.status_code == 200 else None
                 if info_data:
-                    api_cache.set(cache_key, info_data)
+                    api_cache.set(cache_key, info_data, expire=CACHE_TTL_METADATA)
             if info_data and info_data.get('status') == '1':
                 result = info_data['result']
                 if isinstance(result, list) and len(result) > 0:
@@ -918,7 +2100,7 @@ class DeFiRiskAssessor:
                         timeout=20
                     )
                     if response.status_code == 200:
-                        holder_data = response.json()
+                        holder_data = _response_json(response)
                         if holder_data.get('status') == '1' and 'result' in holder_data:
                             top_holders.extend(holder_data['result'])
                 except Exception as e:
@@ -964,7 +2146,7 @@ class DeFiRiskAssessor:
             )
             if response.status_code != 200:
                 print(f"[API ERROR] {self.CHAIN_CONFIG[chain]['scan_url']} returned {response.status_code}: {response.text}")
-            data = response.json()
+            data = _response_json(response)
             if data.get('status') == '1':
                 return float(data['result'])
             return 0
@@ -995,9 +2177,9 @@ class DeFiRiskAssessor:
                     token_data = cached
                 else:
                     response = self.session.get(cg_url, headers=headers, timeout=20)
-                    token_data = response.json() if response.status_code == 200 else None
+                    token_data = _response_json(response) if response.status_code == 200 else None
                     if token_data:
-                        api_cache.set(cache_key, token_data)
+                        api_cache.set(cache_key, token_data, expire=CACHE_TTL_PRICE)
                 if token_data and 'market_data' in token_data and 'total_volume' in token_data['market_data']:
                     liquidity = token_data['market_data']['total_volume'].get('usd', 0)
                     if liquidity:
@@ -1033,9 +2215,9 @@ class DeFiRiskAssessor:
                 info_data = cached
             else:
                 response = self.session.get(url, params=params, timeout=20)
-                info_data = response.json() if response.status_code == 200 else None
+                info_data = _response_json(response) if response.status_code == 200 else None
                 if info_data:
-                    api_cache.set(cache_key, info_data)
+                    api_cache.set(cache_key, info_data, expire=CACHE_TTL_METADATA)
             if info_data and info_data.get('status') == '1':
                 result = info_data['result']
                 if isinstance(result, list) and len(result) > 0:
@@ -1107,23 +2289,37 @@ class DeFiRiskAssessor:
             'breadcrumbs_token': None
         }
         try:
+            # The sources are independent, so fetch them all at once and read them back in order
+            calls = {
+                'contract_verified': (self.get_contract_verification_status, token_address, chain),
+                'holders': (self.get_holder_data, token_address, chain),
+                'liquidity': (self.get_liquidity_data, token_address, chain),
+                'breadcrumbs_risk': (fetch_breadcrumbs_risk_score, token_address),
+                'breadcrumbs_token': (fetch_breadcrumbs_token_info, token_address),
+            }
+            if self.BITQUERY_API_KEY:
+                calls['bitquery'] = (self.fetch_bitquery_data, token_address, chain)
+            futures = submit_provider_calls(calls)
+            
             # Basic on-chain data
-            data['contract_verified'] = self.get_contract_verification_status(token_address, chain)
-            data['holders'] = self.get_holder_data(token_address, chain)
-            data['liquidity'] = self.get_liquidity_data(token_address, chain)
+            data['contract_verified'] = futures['contract_verified'].result()
+            data['holders'] = futures['holders'].result()
+            data['liquidity'] = futures['liquidity'].result()
             
-            # Advanced on-chain checks
-            data['red_flags'] = self.detect_red_flags(token_address, chain)
+            # Advanced on-chain checks (reuse the data above instead of fetching it again)
+            data['red_flags'] = self.detect_red_flags(token_address, chain, liquidity=data['liquidity'],
+                                                      holders=data['holders'],
+                                                      contract_verified=data['contract_verified'])
             
             # BitQuery data integration
-            if self.BITQUERY_API_KEY:
-                data['bitquery'] = self.fetch_bitquery_data(token_address, chain)
+            if 'bitquery' in futures:
+                data['bitquery'] = futures['bitquery'].result()
             
             # Breadcrumbs API integration
-            breadcrumbs_risk = fetch_breadcrumbs_risk_score(token_address)
+            breadcrumbs_risk = futures['breadcrumbs_risk'].result()
             if breadcrumbs_risk:
                 data['breadcrumbs_risk'] = breadcrumbs_risk
-            breadcrumbs_token = fetch_breadcrumbs_token_info(token_address)
+            breadcrumbs_token = futures['breadcrumbs_token'].result()
             if breadcrumbs_token:
                 data['breadcrumbs_token'] = breadcrumbs_token
         except Exception as e:
@@ -1196,8 +2392,8 @@ class DeFiRiskAssessor:
                     timeout=30
                 )
                 if response.status_code == 200:
-                    bitquery_data = response.json()
-                    api_cache.set(cache_key, bitquery_data)
+                    bitquery_data = _response_json(response)
+                    api_cache.set(cache_key, bitquery_data, expire=CACHE_TTL_PRICE)
                 elif response.status_code == 401:
                     msg = f"BitQuery API error 401 Unauthorized for {token_address} on {chain}. Disabling BitQuery for this run. Please check your API key."
                     print(msg)
@@ -1286,9 +2482,9 @@ class DeFiRiskAssessor:
                     map_data = cached
                 else:
                     map_response = self.session.get(map_url, headers=headers, params=params, timeout=20)
-                    map_data = map_response.json() if map_response.status_code == 200 else None
+                    map_data = _response_json(map_response) if map_response.status_code == 200 else None
                     if map_data:
-                        api_cache.set(cache_key, map_data)
+                        api_cache.set(cache_key, map_data, expire=CACHE_TTL_METADATA)
                 cmc_id = None
                 if map_data and map_data.get('status', {}).get('error_code') == 0 and map_data.get('data'):
                     cmc_id = map_data['data'][0]['id']
@@ -1306,7 +2502,7 @@ class DeFiRiskAssessor:
                                 params = {"symbol": sym}
                                 map_response = self.session.get(map_url, headers=headers, params=params, timeout=20)
                                 if map_response.status_code == 200:
-                                    map_data = map_response.json()
+                                    map_data = _response_json(map_response)
                                     if map_data.get('status', {}).get('error_code') == 0 and map_data.get('data'):
                                         cmc_id = map_data['data'][0]['id']
                                         logging.info(f"CMC ID found by symbol '{sym}' for {token_address}")
@@ -1318,7 +2514,7 @@ class DeFiRiskAssessor:
                                     params = {"name": nm}
                                     map_response = self.session.get(map_url, headers=headers, params=params, timeout=20)
                                     if map_response.status_code == 200:
-                                        map_data = map_response.json()
+                                        map_data = _response_json(map_response)
                                         if map_data.get('status', {}).get('error_code') == 0 and map_data.get('data'):
                                             cmc_id = map_data['data'][0]['id']
                                             logging.info(f"CMC ID found by name '{nm}' for {token_address}")
@@ -1333,7 +2529,7 @@ class DeFiRiskAssessor:
                                     params = {"symbol": sym_variant}
                                     map_response = self.session.get(map_url, headers=headers, params=params, timeout=20)
                                     if map_response.status_code == 200:
-                                        map_data = map_response.json()
+                                        map_data = _response_json(map_response)
                                         if map_data.get('status', {}).get('error_code') == 0 and map_data.get('data'):
                                             cmc_id = map_data['data'][0]['id']
                                             logging.info(f"CMC ID found by global symbol '{sym_variant}' for {token_address}")
@@ -1350,7 +2546,7 @@ class DeFiRiskAssessor:
                                     params = {"name": nm_variant}
                                     map_response = self.session.get(map_url, headers=headers, params=params, timeout=20)
                                     if map_response.status_code == 200:
-                                        map_data = map_response.json()
+                                        map_data = _response_json(map_response)
                                         if map_data.get('status', {}).get('error_code') == 0 and map_data.get('data'):
                                             cmc_id = map_data['data'][0]['id']
                                             logging.info(f"CMC ID found by global name '{nm_variant}' for {token_address}")
@@ -1364,7 +2560,7 @@ class DeFiRiskAssessor:
                     params = {"id": cmc_id, "convert": "USD"}
                     quotes_response = self.session.get(quotes_url, headers=headers, params=params, timeout=20)
                     if quotes_response.status_code == 200:
-                        quotes_data = quotes_response.json()
+                        quotes_data = _response_json(quotes_response)
                         if quotes_data.get('status', {}).get('error_code') == 0:
                             data['cmc']['data'] = quotes_data.get('data', {})
                         else:
@@ -1402,8 +2598,8 @@ class DeFiRiskAssessor:
                 else:
                     response = self.session.get(cg_url, headers=headers, params=params, timeout=5)
                     if response.status_code == 200:
-                        cg_data = response.json()
-                        api_cache.set(cache_key, cg_data)
+                        cg_data = _response_json(response)
+                        api_cache.set(cache_key, cg_data, expire=CACHE_TTL_PRICE)
                     elif response.status_code == 429:
                         msg = f"CoinGecko API error 429 (rate limit) for {token_address} on {chain}. Falling back to cached or fallback data."
                         print(msg)
@@ -1443,8 +2639,7 @@ class DeFiRiskAssessor:
         missing_price = data['coingecko']['market_data']['current_price'].get('usd', 0) == 0
         if missing_market_cap or missing_price:
             try:
-                # Map internal chain names to DeFiLlama chain names
-                defillama_chain = "ethereum" if chain in ["eth", "uni"] else "bsc" if chain == "bsc" else "ethereum"
+                defillama_chain = _defillama_chain(chain)
                 llama_price = fetch_defillama_token_price(token_address, defillama_chain)
                 if llama_price and 'coins' in llama_price:
                     key = f'{defillama_chain}:{token_address.lower()}'
@@ -1538,8 +2733,8 @@ class DeFiRiskAssessor:
                     timeout=20
                 )
                 if response.status_code == 200:
-                    social_data = response.json()
-                    api_cache.set(cache_key_social, social_data)
+                    social_data = _response_json(response)
+                    api_cache.set(cache_key_social, social_data, expire=CACHE_TTL_METADATA)
                     data['social'] = social_data.get('data', {}).get('socialVolumeTotal', [])
             # Fetch developer activity
             cache_key_dev = get_cache_key(base_url, None, headers, dev_query)
@@ -1554,8 +2749,8 @@ class DeFiRiskAssessor:
                     timeout=20
                 )
                 if response.status_code == 200:
-                    dev_data = response.json()
-                    api_cache.set(cache_key_dev, dev_data)
+                    dev_data = _response_json(response)
+                    api_cache.set(cache_key_dev, dev_data, expire=CACHE_TTL_METADATA)
                     data['dev_activity'] = dev_data.get('data', {}).get('devActivity', [])
         except Exception as e:
             print(f"[fetch_santiment_data] Error for {token_address} on {chain}: {e}")
@@ -1589,9 +2784,9 @@ class DeFiRiskAssessor:
                     certik_data = cached
                 else:
                     response = self.session.get(certik_url, headers=headers, params=params, timeout=20)
-                    certik_data = response.json() if response.status_code == 200 else None
+                    certik_data = _response_json(response) if response.status_code == 200 else None
                     if certik_data:
-                        api_cache.set(cache_key, certik_data)
+                        api_cache.set(cache_key, certik_data, expire=CACHE_TTL_METADATA)
                 if certik_data and certik_data.get('items'):
                     reports.append({
                         'source': 'CertiK',
@@ -1616,16 +2811,34 @@ class DeFiRiskAssessor:
         }
         
         try:
+            # The providers are independent, so fetch them all at once and read them back in order
+            calls = {
+                'defillama_price': (fetch_defillama_token_price, token_address, chain),
+                'defillama_yields': (fetch_defillama_yield_pools, "uniswap-v3"),
+            }
+            if self.ZAPPER_API_KEY:
+                calls['zapper_portfolio'] = (fetch_zapper_portfolio_data, token_address)
+                calls['zapper_protocol'] = (fetch_zapper_protocol_data, "uniswap-v3")  # Example protocol
+            if self.DEBANK_API_KEY:
+                chain_id = "eth" if chain == "eth" else "bsc"
+                calls['debank_portfolio'] = (fetch_debank_portfolio, token_address)
+                calls['debank_tokens'] = (fetch_debank_token_list, chain_id)
+            if self.MORALIS_API_KEY:
+                calls['moralis_metadata'] = (fetch_moralis_token_metadata, token_address, chain)
+                calls['moralis_price'] = (fetch_moralis_token_price, token_address, chain)
+                calls['moralis_transfers'] = (fetch_moralis_token_transfers, token_address, chain, 50)
+            futures = submit_provider_calls(calls)
+            
             # Zapper API data
             if self.ZAPPER_API_KEY:
                 try:
                     # Fetch portfolio data for the token contract
-                    zapper_portfolio = fetch_zapper_portfolio_data(token_address)
+                    zapper_portfolio = futures['zapper_portfolio'].result()
                     if zapper_portfolio:
                         enhanced_data['zapper']['portfolio'] = zapper_portfolio
                     
                     # Fetch protocol data if available
-                    zapper_protocol = fetch_zapper_protocol_data("uniswap-v3")  # Example protocol
+                    zapper_protocol = futures['zapper_protocol'].result()
                     if zapper_protocol:
                         enhanced_data['zapper']['protocol'] = zapper_protocol
                 except Exception as e:
@@ -1635,13 +2848,12 @@ class DeFiRiskAssessor:
             if self.DEBANK_API_KEY:
                 try:
                     # Fetch portfolio data
-                    debank_portfolio = fetch_debank_portfolio(token_address)
+                    debank_portfolio = futures['debank_portfolio'].result()
                     if debank_portfolio:
                         enhanced_data['debank']['portfolio'] = debank_portfolio
                     
                     # Fetch token list for the chain
-                    chain_id = "eth" if chain == "eth" else "bsc"
-                    debank_tokens = fetch_debank_token_list(chain_id)
+                    debank_tokens = futures['debank_tokens'].result()
                     if debank_tokens:
                         enhanced_data['debank']['tokens'] = debank_tokens
                 except Exception as e:
@@ -1650,12 +2862,12 @@ class DeFiRiskAssessor:
             # DeFiLlama API data (no API key required - free API)
             try:
                 # Fetch token price data
-                defillama_price = fetch_defillama_token_price(token_address, chain)
+                defillama_price = futures['defillama_price'].result()
                 if defillama_price:
                     enhanced_data['defillama']['price'] = defillama_price
                 
                 # Fetch yield pools data
-                defillama_yields = fetch_defillama_yield_pools("uniswap-v3")
+                defillama_yields = futures['defillama_yields'].result()
                 if defillama_yields:
                     enhanced_data['defillama']['yields'] = defillama_yields
             except Exception as e:
@@ -1665,17 +2877,17 @@ class DeFiRiskAssessor:
             if self.MORALIS_API_KEY:
                 try:
                     # Fetch token metadata
-                    moralis_metadata = fetch_moralis_token_metadata(token_address, chain)
+                    moralis_metadata = futures['moralis_metadata'].result()
                     if moralis_metadata:
                         enhanced_data['moralis']['metadata'] = moralis_metadata
                     
                     # Fetch token price
-                    moralis_price = fetch_moralis_token_price(token_address, chain)
+                    moralis_price = futures['moralis_price'].result()
                     if moralis_price:
                         enhanced_data['moralis']['price'] = moralis_price
                     
                     # Fetch recent transfers
-                    moralis_transfers = fetch_moralis_token_transfers(token_address, chain, limit=50)
+                    moralis_transfers = futures['moralis_transfers'].result()
                     if moralis_transfers:
                         enhanced_data['moralis']['transfers'] = moralis_transfers
                 except Exception as e:
@@ -1686,22 +2898,28 @@ class DeFiRiskAssessor:
         
         return enhanced_data
     
-    def detect_red_flags(self, token_address, chain):
-        """Detect security red flags with improved reliability and strict compliance criteria"""
+    def detect_red_flags(self, token_address, chain, liquidity=None, holders=None, contract_verified=None):
+        """Detect security red flags with improved reliability and strict compliance criteria
+        
+        Callers that already fetched liquidity, holders or verification status can pass them in.
+        """
         flags_triggered = []
         if chain not in self.CHAIN_CONFIG:
             return flags_triggered
         try:
             address_lower = token_address.lower()
             is_well_known = address_lower in self.well_known_tokens
-            liquidity = self.get_liquidity_data(token_address, chain)
+            if liquidity is None:
+                liquidity = self.get_liquidity_data(token_address, chain)
             min_liquidity = self.CHAIN_CONFIG[chain]['min_liquidity']
             if not is_well_known and liquidity > 0 and liquidity < min_liquidity:
-                flags_triggered.append('low_liquidity')
-            holders = self.get_holder_data(token_address, chain)
+                flags_triggered.append(RF_LOW_LIQUIDITY)
+            if holders is None:
+                holders = self.get_holder_data(token_address, chain)
             if not is_well_known and holders['total_holders'] > 0 and (holders['top10_concentration'] > 80 or holders['total_holders'] < 1000):
-                flags_triggered.append('high_concentration')
-            contract_verified = self.get_contract_verification_status(token_address, chain)
+                flags_triggered.append(RF_HIGH_CONCENTRATION)
+            if contract_verified is None:
+                contract_verified = self.get_contract_verification_status(token_address, chain)
             # --- Enhanced logic for unverified_contract ---
             if not is_well_known and contract_verified != 'verified':
                 # Get contract age (block explorer or fallback)
@@ -1720,7 +2938,7 @@ class DeFiRiskAssessor:
                         timeout=20
                     )
                     if response.status_code == 200:
-                        data = response.json()
+                        data = _response_json(response)
                         if 'result' in data and isinstance(data['result'], list) and len(data['result']) > 0:
                             creation_ts = data['result'][0].get('timestamp')
                             if creation_ts:
@@ -1736,14 +2954,14 @@ class DeFiRiskAssessor:
                         cg_url = f"https://api.coingecko.com/api/v3/coins/{cg_platform}/contract/{token_address}"
                         response = self.session.get(cg_url, timeout=20)
                         if response.status_code == 200:
-                            cg_data = response.json()
+                            cg_data = _response_json(response)
                             if 'market_data' in cg_data:
                                 volume_24h = cg_data['market_data']['total_volume'].get('usd', 0)
                 except Exception as e:
                     print(f"[detect_red_flags] Error getting 24h volume: {e}")
                 # Strict compliance: only flag if contract is not verified AND (age < 90 days OR volume < $50K)
                 if ((contract_age_days is not None and contract_age_days < 90) or (volume_24h < 50_000)):
-                    flags_triggered.append('unverified_contract')
+                    flags_triggered.append(RF_UNVERIFIED_CONTRACT)
             # --- Proxy contract check (robust pattern) ---
             try:
                 params = {
@@ -1758,7 +2976,7 @@ class DeFiRiskAssessor:
                     timeout=20
                 )
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _response_json(response)
                     if 'result' in data:
                         result = data['result']
                         if isinstance(result, list) and len(result) > 0:
@@ -1773,6 +2991,14 @@ class DeFiRiskAssessor:
             print(f"[detect_red_flags] Error for {token_address} on {chain}: {e}")
         return flags_triggered
     
+    def assess_tokens(self, tokens, max_workers=TOKEN_WORKERS):
+        """Assess many (token_address, chain) pairs concurrently; results keep the input order"""
+        total = len(tokens)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.assess_token, address, chain, token_index=idx, total_tokens=total)
+                       for idx, (address, chain) in enumerate(tokens)]
+            return [future.result() for future in futures]
+    
     def assess_token(self, token_address, chain="eth", progress_callback=None, token_index=0, total_tokens=1):
         """Assess a token and return a risk report with new AML/Compliance logic"""
         chain = chain.lower()
@@ -1784,6 +3010,12 @@ class DeFiRiskAssessor:
                 'risk_category': 'Extreme Risk',
                 'details': {'error': f'Unsupported chain: {chain}'}
             }
+        assessment_key = None
+        if ASSESSMENT_CACHE_TTL > 0:
+            assessment_key = f"assess:{chain}:{token_address.lower()}:{int(time.time()) // ASSESSMENT_CACHE_TTL}"
+            cached = api_cache.get(assessment_key)
+            if cached is not None:
+                return cached
         risk_report = {
             'token': token_address,
             'symbol': '',
@@ -1814,6 +3046,8 @@ class DeFiRiskAssessor:
                 'dev_activity': {'timeseriesData': []}
             }
         }
+        # Cleared when a fetch step raises or comes back empty; such results are not cached
+        fetch_complete = True
         try:
             print(f"\nCollecting data for {token_address}...")
             
@@ -1822,6 +3056,8 @@ class DeFiRiskAssessor:
             try:
                 print("Fetching onchain data...")
                 onchain_data = self.fetch_onchain_data(token_address, chain)
+                if not onchain_data:
+                    fetch_complete = False
                 # Preserve existing red flags and merge with new ones
                 existing_red_flags = risk_report['onchain'].get('red_flags', [])
                 risk_report['onchain'].update(onchain_data)
@@ -1830,12 +3066,15 @@ class DeFiRiskAssessor:
                 combined_red_flags = list(set(existing_red_flags + new_red_flags))  # Remove duplicates
                 risk_report['onchain']['red_flags'] = combined_red_flags
             except Exception as e:
+                fetch_complete = False
                 print(f"[assess_token] Warning: Error fetching onchain data for {token_address} on {chain}: {e}")
             
             update_progress_bar(0, f"Fetching market data for {token_address[:8]}...")
             try:
                 print("Fetching market data...")
                 market_data = self.fetch_market_data(token_address, chain)
+                if not market_data:
+                    fetch_complete = False
                 risk_report['market'].update(market_data)
                 
                 # Extract symbol from market data
@@ -1850,6 +3089,7 @@ class DeFiRiskAssessor:
                 except Exception as e:
                     print(f"[assess_token] Warning: Error extracting symbol: {e}")
             except Exception as e:
+                fetch_complete = False
                 print(f"[assess_token] Warning: Error fetching market data for {token_address} on {chain}: {e}")
             
             update_progress_bar(0, f"Fetching security data for {token_address[:8]}...")
@@ -1857,6 +3097,7 @@ class DeFiRiskAssessor:
                 print("Fetching security data...")
                 risk_report['security'] = self.fetch_security_reports(token_address, chain)
             except Exception as e:
+                fetch_complete = False
                 print(f"[assess_token] Warning: Error fetching security data for {token_address} on {chain}: {e}")
             
             update_progress_bar(0, f"Fetching enhanced data for {token_address[:8]}...")
@@ -1864,7 +3105,10 @@ class DeFiRiskAssessor:
                 print("Fetching enhanced data from new APIs...")
                 # Add new API data to risk_report
                 risk_report['enhanced_data'] = self.fetch_enhanced_data(token_address, chain)
+                if not risk_report['enhanced_data']:
+                    fetch_complete = False
             except Exception as e:
+                fetch_complete = False
                 print(f"[assess_token] Warning: Error fetching enhanced data for {token_address} on {chain}: {e}")
             
             update_progress_bar(0, f"Fetching Santiment data for {token_address[:8]}...")
@@ -1874,71 +3118,85 @@ class DeFiRiskAssessor:
                 if santiment_data:
                     risk_report['santiment'].update(santiment_data)
             except Exception as e:
+                fetch_complete = False
                 print(f"[assess_token] Warning: Error fetching Santiment data for {token_address} on {chain}: {e}")
             
             # Phase 2: Analyzing security & market data
             update_progress_bar(1, f"Analyzing {token_address[:8]}...")
-            print("Applying compliance checks...")
-            self.apply_strict_compliance_checks(risk_report, chain)
-            
-            # Add stablecoin and EU compliance information
+            # Share one per-report cache across the checks and scorers; dropped however scoring ends
+            self._report_caches[id(risk_report)] = (risk_report, None)
             try:
-                symbol = risk_report.get('symbol', '')
-                project_data = risk_report.get('market', {}).get('coingecko', {})
-                risk_report['is_stablecoin'] = self.is_stablecoin(token_address, symbol, project_data)
-                risk_report['eu_compliance_status'] = self.get_eu_compliance_status(risk_report)
-            except Exception as e:
-                print(f"[assess_token] Warning: Error adding compliance info for {token_address}: {e}")
-                risk_report['is_stablecoin'] = False
-                risk_report['eu_compliance_status'] = "Unknown"
+                print("Applying compliance checks...")
+                self.apply_strict_compliance_checks(risk_report, chain)
             
-            print("Calculating component scores...")
-            component_scores = {}
-            for component in self.WEIGHTS.keys():
+                # Add stablecoin and EU compliance information
                 try:
-                    score_method = getattr(self, f"score_{component}")
-                    # Special handling for functions that need additional arguments
-                    if component in ['aml_data', 'compliance_data']:
-                        component_scores[component] = score_method(risk_report, token_address, chain)
-                    else:
-                        component_scores[component] = score_method(risk_report)
-                    print(f"{component}: {component_scores[component]}")
+                    risk_report['is_stablecoin'] = self.detect_stablecoin(risk_report).is_stablecoin
+                    risk_report['eu_compliance_status'] = self.get_eu_compliance_status(risk_report)
                 except Exception as e:
-                    print(f"[assess_token] Error calculating {component} score for {token_address} on {chain}: {e}")
-                    component_scores[component] = 7  # Default to medium-high risk on error
-            
-            # Calculate final risk score (no progress bar update for individual tokens)
-            print("Calculating final risk score...")
-            total_risk_score = 0
-            for component, weight in self.WEIGHTS.items():
-                total_risk_score += component_scores[component] * weight * 10  # Scale up the scores
-            for flag in risk_report['onchain']['red_flags']:
-                boost = next(
-                    (f['risk_boost'] for f in self.RED_FLAGS if f['check'] == flag), 
-                    0
-                )
-                print(f"Applying red flag boost for {flag}: +{boost}")
-                total_risk_score += boost
-            total_risk_score = min(150, max(0, total_risk_score))
-            
-            # After all other data collection, enrich with 1inch data
-            try:
-                oneinch_data = enrich_with_1inch_data(token_address, chain_id=self.CHAIN_CONFIG[chain]['chain_id'])
-                risk_report['oneinch'] = oneinch_data
-            except Exception as e:
-                risk_report['oneinch'] = {'error': str(e)}
+                    print(f"[assess_token] Warning: Error adding compliance info for {token_address}: {e}")
+                    risk_report['is_stablecoin'] = False
+                    risk_report['eu_compliance_status'] = "Unknown"
+            
+                print("Calculating component scores...")
+                component_scores = {}
+                for component in self.WEIGHTS.keys():
+                    try:
+                        score_method = getattr(self, f"score_{component}")
+                        # Special handling for functions that need additional arguments
+                        if component in ['aml_data', 'compliance_data']:
+                            component_scores[component] = score_method(risk_report, token_address, chain)
+                        else:
+                            component_scores[component] = score_method(risk_report)
+                        print(f"{component}: {component_scores[component]}")
+                    except Exception as e:
+                        print(f"[assess_token] Error calculating {component} score for {token_address} on {chain}: {e}")
+                        component_scores[component] = 7.0  # Default to medium-high risk on error
+            
+                # Calculate final risk score (no progress bar update for individual tokens)
+                print("Calculating final risk score...")
+                total_risk_score = 0
+                for component, weight in self.WEIGHTS.items():
+                    total_risk_score += component_scores[component] * weight * 10  # Scale up the scores
+                for flag in risk_report['onchain']['red_flags']:
+                    boost = next(
+                        (f['risk_boost'] for f in self.RED_FLAGS if f['check'] == flag), 
+                        0
+                    )
+                    print(f"Applying red flag boost for {flag}: +{boost}")
+                    total_risk_score += boost
+                total_risk_score = min(150, max(0, total_risk_score))
             
-            return {
-                'token': token_address,
-                'chain': chain,
-                'risk_score': round(total_risk_score, 2),
-                'risk_category': self.classify_risk(total_risk_score, risk_report),
-                'details': risk_report,
-                'component_scores': component_scores
-            }
+                # After all other data collection, enrich with 1inch data
+                try:
+                    oneinch_data = enrich_with_1inch_data(token_address, chain_id=self.CHAIN_CONFIG[chain]['chain_id'])
+                    risk_report['oneinch'] = oneinch_data
+                except Exception as e:
+                    risk_report['oneinch'] = {'error': str(e)}
+            
+                result = {
+                    'token': token_address,
+                    'chain': chain,
+                    'risk_score': round(total_risk_score, 2),
+                    'risk_category': self.classify_risk(total_risk_score, risk_report),
+                    'details': risk_report,
+                    'component_scores': component_scores
+                }
+            finally:
+                self._report_caches.pop(id(risk_report), None)
+            
+            # Holders and liquidity both still at their defaults means the on-chain lookups found nothing
+            onchain = risk_report['onchain']
+            if not ((onchain.get('holders') or {}).get('total_holders') or onchain.get('liquidity')):
+                fetch_complete = False
+            if assessment_key is not None and fetch_complete:
+                try:
+                    api_cache.set(assessment_key, result, expire=ASSESSMENT_CACHE_TTL)
+                except Exception:
+                    logger.exception("Could not cache assessment for %s on %s", token_address, chain)
+            return result
         except Exception as e:
             print(f"[assess_token] Critical error assessing token {token_address} on {chain}: {str(e)}")
-            import traceback
             traceback.print_exc()
             return {
                 'token': token_address,
@@ -1955,9 +3213,13 @@ class DeFiRiskAssessor:
             score = 5  # Base score
             data_found = False
             
+            # Shared report sections
+            view = self._get_report_cache(risk_report).view
+            defillama = view.defillama
+            
             # Primary market cap analysis
-            try:
-                market_cap = risk_report['market']['coingecko']['market_data']['market_cap'].get('usd', 0)
+            market_cap = view.market_cap
+            if market_cap is not None:
                 if market_cap > 1_000_000_000:
                     score -= 3  # Very high impact
                     data_found = True
@@ -1971,23 +3233,19 @@ class DeFiRiskAssessor:
                     score += 0  # Low impact
                 else:
                     score += 2  # Very low impact
-            except:
-                pass
             
             # Alternative data sources when market cap is limited
             if not data_found:
                 # Use DeFiLlama data for TVL impact
                 try:
-                    defillama_data = risk_report.get('enhanced', {}).get('defillama', {})
-                    if defillama_data.get('price') or defillama_data.get('yields'):
+                    if defillama.get('price') or defillama.get('yields'):
                         score -= 1  # Lower risk if DeFiLlama tracks it
                 except:
                     pass
                 
                 # Use Moralis transfer data for activity impact
                 try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    transfers = moralis_data.get('transfers', [])
+                    transfers = view.moralis_transfers
                     if transfers and len(transfers) > 10:
                         score -= 1  # Lower risk if high transfer activity
                 except:
@@ -1995,32 +3253,21 @@ class DeFiRiskAssessor:
                 
                 # Use holder count as impact indicator
                 try:
-                    holders = risk_report.get('onchain', {}).get('holders', {}).get('total_holders', 0)
-                    if holders > 50000:
-                        score -= 2  # Very high impact
-                    elif holders > 10000:
-                        score -= 1  # High impact
-                    elif holders < 1000:
-                        score += 1  # Low impact
+                    score += HOLDER_DELTAS['industry_impact'][view.holder_bucket][0]
                 except:
                     pass
                 
                 # Use liquidity as impact indicator
                 try:
-                    liquidity = risk_report.get('onchain', {}).get('liquidity', {}).get('total_liquidity_usd', 0)
-                    if liquidity > 10_000_000:
-                        score -= 2  # Very high impact
-                    elif liquidity > 1_000_000:
-                        score -= 1  # High impact
-                    elif liquidity < 100_000:
-                        score += 1  # Low impact
+                    liquidity = view.liquidity_usd
+                    score += _ladder_delta(liquidity, LIQUIDITY_LADDERS['industry_impact'])[0]
                 except:
                     pass
             
-            return max(1, min(10, score))
-        except Exception as e:
-            print(f"Error in industry_impact scoring: {e}")
-            return 7
+            return _clamp_score(score)
+        except Exception:
+            logger.exception("Error in industry_impact scoring")
+            return 7.0
     
     def score_tech_innovation(self, risk_report):
         """Enhanced score based on technological innovation and contract complexity (1-10)"""
@@ -2029,6 +3276,13 @@ class DeFiRiskAssessor:
             data_found = False
             innovation_score = 0
             
+            # Shared report sections
+            view = self._get_report_cache(risk_report).view
+            moralis = view.moralis
+            defillama = view.defillama
+            onchain = view.onchain
+            holders = view.holders
+            
             # Contract verification status
             if risk_report['onchain']['contract_verified'] == 'verified':
                 score -= 2  # Lower risk for verified contracts
@@ -2039,15 +3293,12 @@ class DeFiRiskAssessor:
                 innovation_score -= 2
             
             # Contract complexity analysis
-            contract_source = risk_report.get('onchain', {}).get('contract_source', '')
+            contract_source = onchain.get('contract_source', '')
             if contract_source:
+                src_lower = view.contract_src_lower
                 # Check for advanced DeFi features
-                advanced_features = [
-                    'flashloan', 'liquidation', 'collateral', 'oracle', 'amm', 'curve',
-                    'governance', 'staking', 'yield', 'lending', 'borrowing', 'swap',
-                    'uniswap', 'pancakeswap', 'sushiswap', 'balancer', 'curve'
-                ]
-                feature_count = sum(1 for feature in advanced_features if feature in contract_source.lower())
+                # The original feature list named 'curve' twice, so a curve hit still counts as two features
+                feature_count = len(view.contract_patterns & DEFI_FEATURES) + ('curve' in view.contract_patterns)
                 if feature_count >= 4:
                     score -= 2  # Lower risk for highly innovative contracts
                     data_found = True
@@ -2061,11 +3312,7 @@ class DeFiRiskAssessor:
                     innovation_score -= 2
                 
                 # Check for advanced Solidity patterns
-                advanced_patterns = [
-                    'reentrancyguard', 'pausable', 'ownable', 'accesscontrol',
-                    'erc20', 'erc721', 'erc1155', 'multisig', 'timelock'
-                ]
-                pattern_count = sum(1 for pattern in advanced_patterns if pattern in contract_source.lower())
+                pattern_count = len(view.contract_patterns & INNOVATION_PATTERNS)
                 if pattern_count >= 3:
                     score -= 1  # Lower risk for advanced patterns
                     innovation_score += 2
@@ -2074,13 +3321,13 @@ class DeFiRiskAssessor:
                     innovation_score -= 1
                 
                 # Check for proxy/upgradeable contracts
-                if 'proxy' in contract_source.lower() or 'upgrade' in contract_source.lower():
+                if 'proxy' in src_lower or 'upgrade' in src_lower:
                     score += 1  # Slightly higher risk due to upgradeability
                     innovation_score += 1  # But shows innovation
             
             # Market adoption indicator
-            try:
-                volume_24h = risk_report['market']['coingecko']['market_data']['total_volume'].get('usd', 0)
+            volume_24h = view.volume_24h
+            if volume_24h is not None:
                 if volume_24h > 10_000_000:  # Very high volume suggests successful innovation
                     score -= 2
                     data_found = True
@@ -2092,15 +3339,12 @@ class DeFiRiskAssessor:
                 elif volume_24h < 10_000:  # Very low volume suggests poor adoption
                     score += 2
                     innovation_score -= 2
-            except:
-                pass
             
             # Enhanced data sources for innovation assessment
             if not data_found:
                 # Use Moralis metadata for innovation indicators
                 try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    metadata = moralis_data.get('metadata', {})
+                    metadata = moralis.get('metadata', {})
                     if metadata:
                         # Check for advanced token standards
                         token_type = metadata.get('type', '').lower()
@@ -2117,19 +3361,17 @@ class DeFiRiskAssessor:
                 
                 # Use DeFiLlama data for protocol innovation
                 try:
-                    defillama_data = risk_report.get('enhanced', {}).get('defillama', {})
-                    if defillama_data.get('yields'):
+                    if defillama.get('yields'):
                         score -= 1  # Lower risk if DeFiLlama tracks yields (indicates DeFi innovation)
                         innovation_score += 2
-                    if defillama_data.get('price'):
+                    if defillama.get('price'):
                         innovation_score += 1
                 except:
                     pass
                 
                 # Use transfer patterns as innovation indicator
                 try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    transfers = moralis_data.get('transfers', [])
+                    transfers = view.moralis_transfers
                     if transfers:
                         # Check for complex transfer patterns (indicates smart contract innovation)
                         unique_addresses = len(set(t.get('from_address', '') for t in transfers))
@@ -2146,23 +3388,16 @@ class DeFiRiskAssessor:
                 
                 # Use holder distribution as innovation indicator
                 try:
-                    holders = risk_report.get('onchain', {}).get('holders', {})
                     if holders:
-                        total_holders = holders.get('total_holders', 0)
-                        if total_holders > 50000:
-                            score -= 1  # Lower risk for high adoption
-                            innovation_score += 2
-                        elif total_holders > 10000:
-                            innovation_score += 1
-                        elif total_holders < 1000:
-                            score += 1  # Higher risk for low adoption
-                            innovation_score -= 1
+                        score_delta, innovation_delta, _ = HOLDER_DELTAS['tech_innovation'][view.holder_bucket]
+                        score += score_delta
+                        innovation_score += innovation_delta
                 except:
                     pass
                 
                 # Use market cap as innovation indicator
-                try:
-                    market_cap = risk_report['market']['coingecko']['market_data']['market_cap'].get('usd', 0)
+                market_cap = view.market_cap
+                if market_cap is not None:
                     if market_cap > 1_000_000_000:  # High market cap suggests successful innovation
                         score -= 1
                         innovation_score += 2
@@ -2171,8 +3406,6 @@ class DeFiRiskAssessor:
                     elif market_cap < 1_000_000:
                         score += 1
                         innovation_score -= 1
-                except:
-                    pass
             
             # Apply innovation score adjustment
             if innovation_score >= 5:
@@ -2180,10 +3413,10 @@ class DeFiRiskAssessor:
             elif innovation_score <= -3:
                 score = min(10, score + 1)  # Penalty for low innovation
             
-            return max(1, min(10, score))  # Ensure score is between 1-10
-        except Exception as e:
-            print(f"Error in tech_innovation scoring: {e}")
-            return 7
+            return _clamp_score(score)  # Ensure score is between 1-10
+        except Exception:
+            logger.exception("Error in tech_innovation scoring")
+            return 7.0
     
     def score_whitepaper_quality(self, risk_report):
         """Enhanced score based on whitepaper availability and project documentation (1-10)"""
@@ -2192,8 +3425,14 @@ class DeFiRiskAssessor:
             data_found = False
             documentation_score = 0
             
+            # Shared report sections
+            view = self._get_report_cache(risk_report).view
+            moralis = view.moralis
+            defillama = view.defillama
+            onchain = view.onchain
+            
             # Check for project documentation indicators
-            project_data = risk_report.get('market', {}).get('coingecko', {})
+            project_data = view.project_data
             
             # Website availability
             if project_data.get('links', {}).get('homepage') and len(project_data['links']['homepage']) > 0:
@@ -2223,9 +3462,9 @@ class DeFiRiskAssessor:
                 documentation_score -= 1
             
             # Community links
-            community_links = project_data.get('links', {})
-            social_presence = sum(1 for key in ['twitter_screen_name', 'telegram_channel_identifier', 'subreddit_url'] 
-                                if community_links.get(key))
+            community_links = view.links
+            social_presence = _count_up_to((community_links.get(key) for key in
+                                            ('twitter_screen_name', 'telegram_channel_identifier', 'subreddit_url')), 3)
             if social_presence >= 3:
                 score -= 1  # Lower risk if excellent social presence
                 data_found = True
@@ -2239,7 +3478,7 @@ class DeFiRiskAssessor:
                 documentation_score -= 1
             
             # Project description quality
-            description = project_data.get('description', {}).get('en', '')
+            description = view.description_text
             if description and len(description) > 500:
                 score -= 1  # Lower risk if very detailed description
                 data_found = True
@@ -2255,7 +3494,7 @@ class DeFiRiskAssessor:
             # Enhanced data sources for documentation assessment
             if not data_found:
                 # Check on-chain data for contract complexity (indicator of documentation quality)
-                contract_source = risk_report.get('onchain', {}).get('contract_source', '')
+                contract_source = onchain.get('contract_source', '')
                 if contract_source:
                     # Check for documentation comments in source code
                     comment_lines = contract_source.count('//') + contract_source.count('/*') + contract_source.count('*/')
@@ -2274,8 +3513,8 @@ class DeFiRiskAssessor:
                         documentation_score += 2
                 
                 # Check market data for project maturity
-                try:
-                    market_cap = project_data.get('market_data', {}).get('market_cap', {}).get('usd', 0)
+                market_cap = view.market_cap_or_zero
+                if market_cap is not None:
                     if market_cap > 100_000_000:  # High market cap suggests established project
                         score -= 1
                         documentation_score += 2
@@ -2284,27 +3523,18 @@ class DeFiRiskAssessor:
                     elif market_cap < 100_000:  # Very low market cap suggests new/unknown project
                         score += 1
                         documentation_score -= 1
-                except:
-                    pass
                 
                 # Check holder count as documentation quality indicator
                 try:
-                    holders = risk_report.get('onchain', {}).get('holders', {}).get('total_holders', 0)
-                    if holders > 50000:  # Many holders suggest good documentation/transparency
-                        score -= 1
-                        documentation_score += 2
-                    elif holders > 10000:
-                        documentation_score += 1
-                    elif holders < 1000:  # Few holders suggest poor documentation
-                        score += 1
-                        documentation_score -= 1
+                    score_delta, documentation_delta, _ = HOLDER_DELTAS['whitepaper_quality'][view.holder_bucket]
+                    score += score_delta
+                    documentation_score += documentation_delta
                 except:
                     pass
                 
                 # Use Moralis metadata for documentation indicators
                 try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    metadata = moralis_data.get('metadata', {})
+                    metadata = moralis.get('metadata', {})
                     if metadata:
                         # Check for detailed metadata (indicates good documentation)
                         if metadata.get('name') and metadata.get('symbol') and metadata.get('decimals'):
@@ -2316,15 +3546,13 @@ class DeFiRiskAssessor:
                 
                 # Use DeFiLlama data for protocol documentation
                 try:
-                    defillama_data = risk_report.get('enhanced', {}).get('defillama', {})
-                    if defillama_data.get('price') or defillama_data.get('yields'):
+                    if defillama.get('price') or defillama.get('yields'):
                         documentation_score += 1  # Lower risk if DeFiLlama tracks it (indicates documentation)
                 except:
                     pass
                 
                 # Check for professional links
-                professional_links = ['linkedin', 'medium', 'blog', 'docs', 'documentation']
-                prof_count = sum(1 for link in professional_links if community_links.get(link))
+                prof_count = _count_up_to((community_links.get(link) for link in PROFESSIONAL_LINKS), 2)
                 if prof_count >= 2:
                     score -= 1  # Lower risk for professional documentation
                     documentation_score += 2
@@ -2342,21 +3570,19 @@ class DeFiRiskAssessor:
                 score = min(10, score + 1)  # Penalty for poor documentation
             
             # Additional adjustments based on project maturity
-            try:
-                market_cap = project_data.get('market_data', {}).get('market_cap', {}).get('usd', 0)
+            market_cap = view.market_cap
+            if market_cap is not None:
                 if market_cap > 10_000_000_000:  # Very large projects should have better documentation
                     if score > 7:
                         score = 7  # Cap the score for large projects with poor documentation
                 elif market_cap > 1_000_000_000:  # Large projects should have good documentation
                     if score > 8:
                         score = 8  # Cap the score for large projects with poor documentation
-            except:
-                pass
             
-            return max(1, min(10, score))
-        except Exception as e:
-            print(f"Error in whitepaper_quality scoring: {e}")
-            return 7
+            return _clamp_score(score)
+        except Exception:
+            logger.exception("Error in whitepaper_quality scoring")
+            return 7.0
     
     def score_roadmap_adherence(self, risk_report):
         """Enhanced score based on roadmap adherence and project milestones (1-10)"""
@@ -2365,16 +3591,19 @@ class DeFiRiskAssessor:
             data_found = False
             adherence_score = 0
             
+            # Shared report sections
+            view = self._get_report_cache(risk_report).view
+            defillama = view.defillama
+            
             # Check project age and development progress
-            project_data = risk_report.get('market', {}).get('coingecko', {})
+            project_data = view.project_data
             
             # Project age analysis
             try:
                 genesis_date = project_data.get('genesis_date')
                 if genesis_date:
-                    from datetime import datetime
-                    genesis = datetime.strptime(genesis_date, '%Y-%m-%d')
-                    age_days = (datetime.now() - genesis).days
+                    genesis = datetime.datetime.strptime(genesis_date, '%Y-%m-%d')
+                    age_days = (datetime.datetime.now() - genesis).days
                     
                     if age_days > 1095:  # More than 3 years old
                         score -= 2  # Lower risk for very established projects
@@ -2401,9 +3630,8 @@ class DeFiRiskAssessor:
                 # Check for recent commits or updates
                 last_updated = project_data.get('last_updated')
                 if last_updated:
-                    from datetime import datetime
-                    last_update = datetime.strptime(last_updated, '%Y-%m-%dT%H:%M:%S.%fZ')
-                    days_since_update = (datetime.now() - last_update).days
+                    last_update = datetime.datetime.strptime(last_updated, '%Y-%m-%dT%H:%M:%S.%fZ')
+                    days_since_update = (datetime.datetime.now() - last_update).days
                     
                     if days_since_update < 3:  # Updated in last 3 days
                         score -= 2  # Very active development
@@ -2427,54 +3655,17 @@ class DeFiRiskAssessor:
             except:
                 pass
             
-            # Market performance as roadmap adherence indicator
-            try:
-                price_change_30d = project_data.get('market_data', {}).get('price_change_percentage_30d', 0)
-                if price_change_30d and price_change_30d > 100:  # Very strong positive performance
-                    score -= 2  # Excellent roadmap adherence
-                    data_found = True
-                    adherence_score += 3
-                elif price_change_30d and price_change_30d > 50:  # Strong positive performance
-                    score -= 1  # Good roadmap adherence
-                    data_found = True
-                    adherence_score += 2
-                elif price_change_30d and price_change_30d > 20:  # Positive performance
-                    adherence_score += 1
-                elif price_change_30d and price_change_30d < -50:  # Poor performance
-                    score += 2  # Poor roadmap adherence
-                    adherence_score -= 2
-                elif price_change_30d and price_change_30d < -20:  # Negative performance
-                    score += 1  # Slightly poor roadmap adherence
-                    adherence_score -= 1
-            except:
-                pass
-            
-            # Community growth indicator
-            try:
-                community_score = project_data.get('community_score', 0)
-                if community_score > 80:
-                    score -= 1  # Lower risk if excellent community engagement
-                    data_found = True
-                    adherence_score += 2
-                elif community_score > 50:
-                    score -= 0.5  # Lower risk if good community engagement
-                    data_found = True
-                    adherence_score += 1
-                elif community_score < 10:
-                    score += 1  # Higher risk if poor community engagement
-                    adherence_score -= 1
-            except:
-                pass
+            # Market performance and community threshold ladders (see SCORING_RULES)
+            score, adherence_score, data_found = _roadmap_primary_ladders(risk_report, score, adherence_score, data_found)
             
             # Enhanced data sources for roadmap adherence assessment
             if not data_found:
                 # Use Moralis transfer data for activity indicators
                 try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    transfers = moralis_data.get('transfers', [])
+                    transfers = view.moralis_transfers
                     if transfers:
                         # Check for recent transfer activity (indicates ongoing development)
-                        recent_transfers = len([t for t in transfers if t.get('block_timestamp')])
+                        recent_transfers = _count_up_to((t.get('block_timestamp') for t in transfers), 101)
                         if recent_transfers > 100:
                             score -= 2  # Lower risk for very active project
                             adherence_score += 3
@@ -2494,80 +3685,16 @@ class DeFiRiskAssessor:
                 
                 # Use DeFiLlama data for protocol development
                 try:
-                    defillama_data = risk_report.get('enhanced', {}).get('defillama', {})
-                    if defillama_data.get('yields'):
+                    if defillama.get('yields'):
                         score -= 1  # Lower risk if DeFiLlama tracks yields (indicates active development)
                         adherence_score += 2
-                    if defillama_data.get('price'):
-                        adherence_score += 1
-                except:
-                    pass
-                
-                # Use holder growth as roadmap adherence indicator
-                try:
-                    holders = risk_report.get('onchain', {}).get('holders', {})
-                    if holders:
-                        total_holders = holders.get('total_holders', 0)
-                        if total_holders > 100000:
-                            score -= 1  # Lower risk for very growing community
-                            adherence_score += 2
-                        elif total_holders > 50000:
-                            score -= 0.5  # Lower risk for growing community
-                            adherence_score += 1
-                        elif total_holders < 1000:
-                            score += 2  # Higher risk for stagnant community
-                            adherence_score -= 2
-                        elif total_holders < 5000:
-                            score += 1  # Higher risk for small community
-                            adherence_score -= 1
-                except:
-                    pass
-                
-                # Use liquidity growth as roadmap adherence indicator
-                try:
-                    liquidity = risk_report.get('onchain', {}).get('liquidity', {}).get('total_liquidity_usd', 0)
-                    if liquidity > 10_000_000:
-                        score -= 1  # Lower risk for very high liquidity
-                        adherence_score += 2
-                    elif liquidity > 1_000_000:
-                        score -= 0.5  # Lower risk for high liquidity
-                        adherence_score += 1
-                    elif liquidity < 100_000:
-                        score += 2  # Higher risk for very low liquidity
-                        adherence_score -= 2
-                    elif liquidity < 500_000:
-                        score += 1  # Higher risk for low liquidity
-                        adherence_score -= 1
-                except:
-                    pass
-                
-                # Use trading volume as roadmap adherence indicator
-                try:
-                    volume_24h = project_data.get('market_data', {}).get('total_volume', {}).get('usd', 0)
-                    if volume_24h > 10_000_000:
-                        score -= 1  # Lower risk for high trading activity
-                        adherence_score += 2
-                    elif volume_24h > 1_000_000:
+                    if defillama.get('price'):
                         adherence_score += 1
-                    elif volume_24h < 10_000:
-                        score += 1  # Higher risk for low trading activity
-                        adherence_score -= 1
                 except:
                     pass
                 
-                # Use market cap as roadmap adherence indicator
-                try:
-                    market_cap = project_data.get('market_data', {}).get('market_cap', {}).get('usd', 0)
-                    if market_cap > 1_000_000_000:
-                        score -= 1  # Lower risk for high market cap
-                        adherence_score += 2
-                    elif market_cap > 100_000_000:
-                        adherence_score += 1
-                    elif market_cap < 1_000_000:
-                        score += 1  # Higher risk for low market cap
-                        adherence_score -= 1
-                except:
-                    pass
+                # Holder, liquidity, volume and market cap ladders (see SCORING_RULES)
+                score, adherence_score, data_found = _roadmap_fallback_ladders(risk_report, score, adherence_score, data_found)
             
             # Apply adherence score adjustment
             if adherence_score >= 6:
@@ -2575,10 +3702,10 @@ class DeFiRiskAssessor:
             elif adherence_score <= -4:
                 score = min(10, score + 1)  # Penalty for poor adherence
             
-            return max(1, min(10, score))
-        except Exception as e:
-            print(f"Error in roadmap_adherence scoring: {e}")
-            return 7
+            return _clamp_score(score)
+        except Exception:
+            logger.exception("Error in roadmap_adherence scoring")
+            return 7.0
     
     def score_team_expertise(self, risk_report):
         """Enhanced score based on team expertise and transparency (1-10)"""
@@ -2587,17 +3714,21 @@ class DeFiRiskAssessor:
             data_found = False
             expertise_score = 0
             
-            project_data = risk_report.get('market', {}).get('coingecko', {})
+            # Shared report sections
+            view = self._get_report_cache(risk_report).view
+            moralis = view.moralis
+            defillama = view.defillama
+            onchain = view.onchain
+            
+            project_data = view.project_data
             
             # Team transparency indicators
-            team_data = project_data.get('team', [])
-            if team_data and len(team_data) > 0:
+            n_team, detailed_members = self._get_report_cache(risk_report).team_stats
+            if n_team > 0:
                 score -= 2  # Lower risk if team is public
                 data_found = True
                 expertise_score += 3
                 # Check for team member details
-                detailed_members = sum(1 for member in team_data 
-                                     if member.get('name') and member.get('position'))
                 if detailed_members >= 5:
                     score -= 2  # Lower risk if very detailed team info
                     expertise_score += 3
@@ -2612,7 +3743,7 @@ class DeFiRiskAssessor:
                 expertise_score -= 3
             
             # LinkedIn presence (indicator of professional background)
-            links = project_data.get('links', {})
+            links = view.links
             if links.get('linkedin'):
                 score -= 1  # Lower risk if LinkedIn presence
                 data_found = True
@@ -2636,61 +3767,24 @@ class DeFiRiskAssessor:
             else:
                 expertise_score -= 1
             
-            # Community trust score
-            try:
-                trust_score = project_data.get('trust_score', 0)
-                if trust_score > 9:
-                    score -= 2  # Lower risk if very high trust
-                    data_found = True
-                    expertise_score += 3
-                elif trust_score > 7:
-                    score -= 1  # Lower risk if high trust
-                    data_found = True
+            # Community trust and developer activity ladders (see SCORING_RULES)
+            score, expertise_score, data_found = _team_primary_ladders(risk_report, score, expertise_score, data_found)
+            
+            # Enhanced data sources for expertise assessment
+            if not data_found:
+                # Check contract verification as expertise indicator
+                contract_verified = onchain.get('contract_verified', '')
+                if contract_verified == 'verified':
+                    score -= 1  # Lower risk if verified (indicates competent development)
                     expertise_score += 2
-                elif trust_score < 3:
-                    score += 2  # Higher risk if low trust
-                    expertise_score -= 2
-                elif trust_score < 5:
-                    score += 1  # Higher risk if moderate trust
-                    expertise_score -= 1
-            except:
-                pass
-            
-            # Developer activity as expertise indicator
-            try:
-                dev_score = project_data.get('developer_score', 0)
-                if dev_score > 80:
-                    score -= 2  # Lower risk if very active development
-                    data_found = True
-                    expertise_score += 3
-                elif dev_score > 50:
-                    score -= 1  # Lower risk if active development
-                    data_found = True
-                    expertise_score += 2
-                elif dev_score < 10:
-                    score += 2  # Higher risk if low development activity
-                    expertise_score -= 2
-                elif dev_score < 30:
-                    score += 1  # Higher risk if moderate development activity
-                    expertise_score -= 1
-            except:
-                pass
-            
-            # Enhanced data sources for expertise assessment
-            if not data_found:
-                # Check contract verification as expertise indicator
-                contract_verified = risk_report.get('onchain', {}).get('contract_verified', '')
-                if contract_verified == 'verified':
-                    score -= 1  # Lower risk if verified (indicates competent development)
-                    expertise_score += 2
-                else:
+                else:
                     expertise_score -= 1
                 
                 # Check contract complexity as expertise indicator
-                contract_source = risk_report.get('onchain', {}).get('contract_source', '')
+                contract_source = onchain.get('contract_source', '')
                 if contract_source:
                     # Count function definitions (indicator of development complexity)
-                    function_count = contract_source.lower().count('function ')
+                    function_count = view.function_count
                     if function_count > 30:
                         score -= 2  # Lower risk for very complex contracts (indicates high expertise)
                         expertise_score += 3
@@ -2705,11 +3799,7 @@ class DeFiRiskAssessor:
                         expertise_score -= 1
                     
                     # Check for advanced Solidity patterns (indicates expertise)
-                    advanced_patterns = [
-                        'reentrancyguard', 'pausable', 'ownable', 'accesscontrol',
-                        'multisig', 'timelock', 'governance', 'dao'
-                    ]
-                    pattern_count = sum(1 for pattern in advanced_patterns if pattern in contract_source.lower())
+                    pattern_count = len(view.contract_patterns & ADVANCED_PATTERNS)
                     if pattern_count >= 3:
                         score -= 1  # Lower risk for advanced patterns
                         expertise_score += 2
@@ -2717,46 +3807,12 @@ class DeFiRiskAssessor:
                         score += 1  # Higher risk for basic patterns
                         expertise_score -= 1
                 
-                # Check liquidity as expertise indicator
-                try:
-                    liquidity = risk_report.get('onchain', {}).get('liquidity', {}).get('total_liquidity_usd', 0)
-                    if liquidity > 10_000_000:  # Very high liquidity suggests highly competent team
-                        score -= 2
-                        expertise_score += 3
-                    elif liquidity > 1_000_000:  # High liquidity suggests competent team
-                        score -= 1
-                        expertise_score += 2
-                    elif liquidity < 10_000:  # Very low liquidity suggests inexperienced team
-                        score += 2
-                        expertise_score -= 2
-                    elif liquidity < 100_000:  # Low liquidity suggests inexperienced team
-                        score += 1
-                        expertise_score -= 1
-                except:
-                    pass
-                
-                # Check market performance as expertise indicator
-                try:
-                    price_change_24h = project_data.get('market_data', {}).get('price_change_percentage_24h', 0)
-                    if price_change_24h and abs(price_change_24h) < 10:  # Very stable price suggests competent management
-                        score -= 2
-                        expertise_score += 3
-                    elif price_change_24h and abs(price_change_24h) < 20:  # Stable price suggests competent management
-                        score -= 1
-                        expertise_score += 2
-                    elif price_change_24h and abs(price_change_24h) > 50:  # Volatile price suggests poor management
-                        score += 2
-                        expertise_score -= 2
-                    elif price_change_24h and abs(price_change_24h) > 30:  # Volatile price suggests poor management
-                        score += 1
-                        expertise_score -= 1
-                except:
-                    pass
+                # Liquidity and price stability ladders (see SCORING_RULES)
+                score, expertise_score, data_found = _team_fallback_ladders(risk_report, score, expertise_score, data_found)
                 
                 # Use Moralis metadata for expertise indicators
                 try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    metadata = moralis_data.get('metadata', {})
+                    metadata = moralis.get('metadata', {})
                     if metadata:
                         # Check for detailed metadata (indicates professional development)
                         if metadata.get('name') and metadata.get('symbol') and metadata.get('decimals'):
@@ -2768,42 +3824,11 @@ class DeFiRiskAssessor:
                 
                 # Use DeFiLlama data for protocol expertise
                 try:
-                    defillama_data = risk_report.get('enhanced', {}).get('defillama', {})
-                    if defillama_data.get('yields'):
+                    if defillama.get('yields'):
                         score -= 1  # Lower risk if DeFiLlama tracks yields (indicates expertise)
                         expertise_score += 2
-                    if defillama_data.get('price'):
-                        expertise_score += 1
-                except:
-                    pass
-                
-                # Use holder count as expertise indicator
-                try:
-                    holders = risk_report.get('onchain', {}).get('holders', {})
-                    if holders:
-                        total_holders = holders.get('total_holders', 0)
-                        if total_holders > 100000:  # Many holders suggest competent team
-                            score -= 1
-                            expertise_score += 2
-                        elif total_holders > 50000:
-                            expertise_score += 1
-                        elif total_holders < 1000:  # Few holders suggest inexperienced team
-                            score += 1
-                            expertise_score -= 1
-                except:
-                    pass
-                
-                # Use market cap as expertise indicator
-                try:
-                    market_cap = project_data.get('market_data', {}).get('market_cap', {}).get('usd', 0)
-                    if market_cap > 1_000_000_000:  # High market cap suggests competent team
-                        score -= 1
-                        expertise_score += 2
-                    elif market_cap > 100_000_000:
+                    if defillama.get('price'):
                         expertise_score += 1
-                    elif market_cap < 1_000_000:  # Low market cap suggests inexperienced team
-                        score += 1
-                        expertise_score -= 1
                 except:
                     pass
             
@@ -2817,10 +3842,10 @@ class DeFiRiskAssessor:
             elif expertise_score <= -3:
                 score = min(10, score + 1)  # Penalty for low expertise
             
-            return max(1, min(10, score))
-        except Exception as e:
-            print(f"Error in team_expertise scoring: {e}")
-            return 7
+            return _clamp_score(score)
+        except Exception:
+            logger.exception("Error in team_expertise scoring")
+            return 7.0
     
     def score_management_strategy(self, risk_report):
         """Enhanced score based on management strategy and governance (1-10)"""
@@ -2828,13 +3853,21 @@ class DeFiRiskAssessor:
             score = 5  # Base score
             data_found = False
             
-            project_data = risk_report.get('market', {}).get('coingecko', {})
+            # Shared report sections
+            view = self._get_report_cache(risk_report).view
+            enhanced = view.enhanced
+            zapper = enhanced.get('zapper') or EMPTY
+            debank = enhanced.get('debank') or EMPTY
+            onchain = view.onchain
+            holders = view.holders
+            
+            project_data = view.project_data
             
             # Governance indicators
-            links = project_data.get('links', {})
+            links = view.links
             
             # Governance token/DAO presence
-            if links.get('governance') or 'dao' in project_data.get('description', {}).get('en', '').lower():
+            if links.get('governance') or self._get_report_cache(risk_report).has_dao:
                 score -= 1  # Lower risk if decentralized governance
                 data_found = True
             
@@ -2855,10 +3888,9 @@ class DeFiRiskAssessor:
             
             # Token distribution analysis (indicator of management strategy)
             try:
-                holders = risk_report.get('onchain', {}).get('holders', {})
                 if holders:
-                    total_holders = holders.get('total_holders', 0)
-                    top10_concentration = holders.get('top10_concentration', 100)
+                    total_holders = view.total_holders
+                    top10_concentration = view.top10_concentration
                     
                     if total_holders > 10000 and top10_concentration < 50:
                         score -= 1  # Lower risk if well-distributed
@@ -2869,28 +3901,22 @@ class DeFiRiskAssessor:
                 pass
             
             # Market strategy indicators
-            try:
-                volume_24h = project_data.get('market_data', {}).get('total_volume', {}).get('usd', 0)
-                market_cap = project_data.get('market_data', {}).get('market_cap', {}).get('usd', 0)
-                
-                if volume_24h > 0 and market_cap > 0:
-                    volume_market_cap_ratio = volume_24h / market_cap
-                    if volume_market_cap_ratio > 0.1:  # High trading activity
-                        score -= 1
-                        data_found = True
-                    elif volume_market_cap_ratio < 0.01:  # Low trading activity
-                        score += 1
-            except:
-                pass
-            
-            # Liquidity management
-            try:
-                liquidity = risk_report.get('onchain', {}).get('liquidity', {}).get('total_liquidity_usd', 0)
-                if liquidity > 1_000_000:  # High liquidity
+            volume_24h = view.volume_24h
+            market_cap = view.market_cap
+            if volume_24h is not None and market_cap is not None and volume_24h > 0 and market_cap > 0:
+                volume_market_cap_ratio = volume_24h / market_cap
+                if volume_market_cap_ratio > 0.1:  # High trading activity
                     score -= 1
                     data_found = True
-                elif liquidity < 100_000:  # Low liquidity
+                elif volume_market_cap_ratio < 0.01:  # Low trading activity
                     score += 1
+            
+            # Liquidity management
+            try:
+                liquidity = view.liquidity_usd
+                score_delta, _, found = _ladder_delta(liquidity, LIQUIDITY_LADDERS['management_strategy'])
+                score += score_delta
+                data_found = data_found or found
             except:
                 pass
             
@@ -2898,50 +3924,46 @@ class DeFiRiskAssessor:
             if not data_found:
                 # Use Zapper data for portfolio management indicators
                 try:
-                    zapper_data = risk_report.get('enhanced', {}).get('zapper', {})
-                    if zapper_data.get('portfolio') or zapper_data.get('protocol'):
+                    if zapper.get('portfolio') or zapper.get('protocol'):
                         score -= 1  # Lower risk if Zapper tracks it (indicates professional management)
                 except:
                     pass
                 
                 # Use DeBank data for financial management indicators
                 try:
-                    debank_data = risk_report.get('enhanced', {}).get('debank', {})
-                    if debank_data.get('portfolio') or debank_data.get('tokens'):
+                    if debank.get('portfolio') or debank.get('tokens'):
                         score -= 1  # Lower risk if DeBank tracks it (indicates financial management)
                 except:
                     pass
                 
                 # Use Moralis transfer patterns for management strategy
                 try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    transfers = moralis_data.get('transfers', [])
+                    transfers = view.moralis_transfers
                     if transfers:
                         # Check for large transfers (indicates institutional management)
-                        large_transfers = [t for t in transfers if float(t.get('value', 0)) > 10000]
-                        if len(large_transfers) > 5:
+                        large_transfers = _count_up_to((float(t.get('value', 0)) > 10000 for t in transfers), 6)
+                        if large_transfers > 5:
                             score -= 1  # Lower risk for institutional management
-                        elif len(large_transfers) == 0:
+                        elif large_transfers == 0:
                             score += 1  # Higher risk for retail-only management
                 except:
                     pass
                 
                 # Use contract complexity as management strategy indicator
                 try:
-                    contract_source = risk_report.get('onchain', {}).get('contract_source', '')
+                    contract_source = onchain.get('contract_source', '')
                     if contract_source:
                         # Check for governance functions
-                        governance_functions = ['vote', 'proposal', 'governance', 'dao']
-                        gov_count = sum(1 for func in governance_functions if func in contract_source.lower())
+                        gov_count = len(view.contract_patterns & GOV_FUNCS)
                         if gov_count >= 2:
                             score -= 1  # Lower risk for governance-focused management
                 except:
                     pass
             
-            return max(1, min(10, score))
-        except Exception as e:
-            print(f"Error in management_strategy scoring: {e}")
-            return 7
+            return _clamp_score(score)
+        except Exception:
+            logger.exception("Error in management_strategy scoring")
+            return 7.0
     
     def score_code_security(self, risk_report):
         """Enhanced score based on code security and audit status (1-10)"""
@@ -2949,8 +3971,14 @@ class DeFiRiskAssessor:
             score = 5  # Base score
             data_found = False
             
+            # Shared report sections
+            view = self._get_report_cache(risk_report).view
+            moralis = view.moralis
+            onchain = view.onchain
+            holders = view.holders
+            
             # Contract verification status
-            contract_verified = risk_report.get('onchain', {}).get('contract_verified', '')
+            contract_verified = onchain.get('contract_verified', '')
             if contract_verified == 'verified':
                 score -= 2  # Lower risk for verified contracts
                 data_found = True
@@ -2971,14 +3999,10 @@ class DeFiRiskAssessor:
                     score += 2  # Higher risk for no audits
             
             # Contract complexity and security patterns
-            contract_source = risk_report.get('onchain', {}).get('contract_source', '')
+            contract_source = onchain.get('contract_source', '')
             if contract_source:
                 # Check for security best practices
-                security_patterns = [
-                    'reentrancyguard', 'pausable', 'ownable', 'accesscontrol',
-                    'safemath', 'erc20', 'erc721', 'erc1155'
-                ]
-                security_count = sum(1 for pattern in security_patterns if pattern in contract_source.lower())
+                security_count = len(view.contract_patterns & SECURITY_PATTERNS)
                 if security_count >= 3:
                     score -= 1  # Lower risk for security-conscious code
                     data_found = True
@@ -2986,11 +4010,7 @@ class DeFiRiskAssessor:
                     score += 1  # Higher risk for no security patterns
                 
                 # Check for potential vulnerabilities
-                vulnerability_patterns = [
-                    'delegatecall', 'selfdestruct', 'suicide', 'assembly',
-                    'inline', 'low-level', 'unchecked'
-                ]
-                vuln_count = sum(1 for pattern in vulnerability_patterns if pattern in contract_source.lower())
+                vuln_count = len(view.contract_patterns & VULN_PATTERNS)
                 if vuln_count >= 2:
                     score += 1  # Higher risk for potential vulnerabilities
             
@@ -3006,8 +4026,7 @@ class DeFiRiskAssessor:
                 
                 # Use Moralis metadata for security indicators
                 try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    metadata = moralis_data.get('metadata', {})
+                    metadata = moralis.get('metadata', {})
                     if metadata:
                         # Check for standard token types (indicates security)
                         token_type = metadata.get('type', '').lower()
@@ -3018,21 +4037,19 @@ class DeFiRiskAssessor:
                 
                 # Use transfer patterns for security analysis
                 try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    transfers = moralis_data.get('transfers', [])
+                    transfers = view.moralis_transfers
                     if transfers:
                         # Check for suspicious transfer patterns
-                        suspicious_transfers = [t for t in transfers if float(t.get('value', 0)) > 1000000]
-                        if len(suspicious_transfers) > 10:
+                        suspicious_transfers = _count_up_to((float(t.get('value', 0)) > 1000000 for t in transfers), 11)
+                        if suspicious_transfers > 10:
                             score += 1  # Higher risk for many large transfers
                 except:
                     pass
                 
                 # Use holder distribution for security analysis
                 try:
-                    holders = risk_report.get('onchain', {}).get('holders', {})
                     if holders:
-                        top10_concentration = holders.get('top10_concentration', 100)
+                        top10_concentration = view.top10_concentration
                         if top10_concentration > 90:
                             score += 1  # Higher risk for highly concentrated holdings
                 except:
@@ -3040,198 +4057,168 @@ class DeFiRiskAssessor:
                 
                 # Use liquidity for security analysis
                 try:
-                    liquidity = risk_report.get('onchain', {}).get('liquidity', {}).get('total_liquidity_usd', 0)
-                    if liquidity < 50_000:
-                        score += 1  # Higher risk for very low liquidity
+                    liquidity = view.liquidity_usd
+                    score += _ladder_delta(liquidity, LIQUIDITY_LADDERS['code_security'])[0]
                 except:
                     pass
             
-            return max(1, min(10, score))
-        except Exception as e:
-            print(f"Error in code_security scoring: {e}")
-            return 7
+            return _clamp_score(score)
+        except Exception:
+            logger.exception("Error in code_security scoring")
+            return 7.0
     
-    def score_dev_activity(self, risk_report):
+    def score_dev_activity(self, risk_report, verbose=True):
         """Enhanced score based on development activity and code commits (1-10)
         Uses Santiment, CoinGecko GitHub metrics, on-chain data, and protocol integrations for precision.
+        With verbose=False (bulk scoring) the indicator messages are neither formatted nor stored.
         """
         try:
             score = 5  # Base score
             data_found = False
-            activity_indicators = []
+            activity_indicators = _IndicatorLog(verbose)
+
+            # Shared report sections
+            view = self._get_report_cache(risk_report).view
+            onchain = view.onchain
 
             # 1. Santiment development activity data (Primary source)
             santiment_dev = risk_report.get('santiment', {}).get('dev', [])
             avg_activity = None
             recent_activity = None
             if santiment_dev:
-                valid_values = [point['value'] for point in santiment_dev 
-                              if isinstance(point, dict) and 'value' in point and point['value'] is not None]
-                if valid_values:
-                    avg_activity = sum(valid_values) / len(valid_values)
-                    recent_activity = valid_values[-1] if valid_values else 0
+                values = _santiment_values(santiment_dev)
+                if values.size:
+                    avg_activity, recent_activity = _series_mean_last(values)
                     # Enhanced scoring based on activity levels
-                    if avg_activity > 150 and recent_activity > 75:
-                        score -= 3
-                        activity_indicators.append(f"Exceptional dev activity: {avg_activity:.1f} avg, {recent_activity} recent")
-                        data_found = True
-                    elif avg_activity > 100 and recent_activity > 50:
-                        score -= 2
-                        activity_indicators.append(f"Very high dev activity: {avg_activity:.1f} avg, {recent_activity} recent")
-                        data_found = True
-                    elif avg_activity > 50 and recent_activity > 20:
-                        score -= 1
-                        activity_indicators.append(f"High dev activity: {avg_activity:.1f} avg, {recent_activity} recent")
-                        data_found = True
-                    elif avg_activity < 5 or recent_activity < 2:
-                        score += 3
-                        activity_indicators.append(f"Very low dev activity: {avg_activity:.1f} avg, {recent_activity} recent")
-                    elif avg_activity < 15 or recent_activity < 8:
-                        score += 2
-                        activity_indicators.append(f"Low dev activity: {avg_activity:.1f} avg, {recent_activity} recent")
-                    elif avg_activity < 30:
-                        score += 1
-                        activity_indicators.append(f"Moderate dev activity: {avg_activity:.1f} avg, {recent_activity} recent")
+                    tier = DEV_ACTIVITY_TIERS[_dev_activity_tier(avg_activity, recent_activity) + 3]
+                    if tier:
+                        delta, template, found = tier
+                        score += delta
+                        # Report the raw latest value so integer counts read "60", not "60.0"
+                        activity_indicators.add(template, avg_activity, _santiment_last(santiment_dev))
+                        data_found = data_found or found
                     # Trend analysis: penalize sharp drops
                     if avg_activity and recent_activity is not None and recent_activity < avg_activity * 0.3:
                         score += 1
-                        activity_indicators.append(f"Recent dev activity dropped sharply vs. average")
+                        activity_indicators.add("Recent dev activity dropped sharply vs. average")
 
             # 2. CoinGecko GitHub metrics
-            project_data = risk_report.get('market', {}).get('coingecko', {})
-            links = project_data.get('links', {})
-            github_metrics = project_data.get('github', {})
-            # If not present, try to extract from links
-            if not github_metrics and links.get('repos_url', {}).get('github'):
-                github_metrics = links.get('repos_url', {}).get('github')
+            links = view.links
+            github_metrics = view.github_metrics
             # Use developer_score as before
-            dev_score = project_data.get('developer_score', 0)
-            if dev_score > 80:
-                score -= 2
-                activity_indicators.append(f"Exceptional developer score: {dev_score}")
-                data_found = True
-            elif dev_score > 50:
-                score -= 1
-                activity_indicators.append(f"Good developer score: {dev_score}")
-                data_found = True
-            elif dev_score < 5:
-                score += 2
-                activity_indicators.append(f"Very poor developer score: {dev_score}")
-            elif dev_score < 15:
-                score += 1
-                activity_indicators.append(f"Poor developer score: {dev_score}")
+            dev_score = view.dev_score
+            delta, template, found = DEV_SCORE_TIERS[_bucket_index(DEV_SCORE_THRESHOLDS, dev_score)]
+            if template:
+                score += delta
+                activity_indicators.add(template, dev_score)
+                data_found = data_found or found
             # Use additional GitHub metrics if available
-            for metric, label, boost, penalty, high, low in [
-                ('commit_count_4_weeks', 'commits (4w)', -1, 1, 50, 5),
-                ('stars', 'stars', -0.5, 0.5, 1000, 10),
-                ('forks', 'forks', -0.5, 0.5, 500, 5),
-                ('open_issues', 'open issues', 0.5, -0.5, 100, 0),
-                ('contributors', 'contributors', -1, 1, 20, 1),
-            ]:
+            for metric, low, high, outcomes in GITHUB_METRIC_TIERS:
                 val = github_metrics.get(metric)
                 if val is not None:
-                    if val >= high:
-                        score += boost
-                        activity_indicators.append(f"High {label}: {val}")
-                        data_found = True
-                    elif val <= low:
-                        score += penalty
-                        activity_indicators.append(f"Low {label}: {val}")
+                    outcome = outcomes[(val > low) + (val >= high)]
+                    if outcome:
+                        delta, template, found = outcome
+                        score += delta
+                        activity_indicators.add(template, val)
+                        data_found = data_found or found
             # Open source check
             if links.get('repos_url', {}).get('github'):
                 score -= 1
-                activity_indicators.append("Open source project (GitHub)")
+                activity_indicators.add("Open source project (GitHub)")
                 data_found = True
                 if links.get('source_code'):
                     score -= 0.5
-                    activity_indicators.append("Source code available")
+                    activity_indicators.add("Source code available")
 
             # 3. On-chain contract activity
-            onchain = risk_report.get('onchain', {})
             contract_age = onchain.get('contract_age_days', None)
             if contract_age is not None:
                 if contract_age < 60:
                     score -= 0.5
-                    activity_indicators.append(f"New contract: {contract_age} days old")
+                    activity_indicators.add("New contract: {} days old", contract_age)
                 elif contract_age > 1000:
                     score += 0.5
-                    activity_indicators.append(f"Very old contract: {contract_age} days old")
+                    activity_indicators.add("Very old contract: {} days old", contract_age)
             # Proxy/upgrade pattern
             if onchain.get('proxy_contract') or onchain.get('upgradeable_contract'):
                 score -= 0.5
-                activity_indicators.append("Proxy/upgradeable contract: ongoing dev possible")
+                activity_indicators.add("Proxy/upgradeable contract: ongoing dev possible")
 
-            # 4. Moralis transfer data (fallback)
+            # 4. Moralis transfer data (fallback; skipped when primary sources already gave enough signal)
             if not data_found or len(activity_indicators) < 2:
                 try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    transfers = moralis_data.get('transfers', [])
+                    transfers = view.moralis_transfers
                     if transfers:
-                        recent_transfers = len([t for t in transfers if t.get('block_timestamp')])
-                        transfer_volume = sum(float(t.get('value', 0)) for t in transfers if t.get('value'))
+                        recent_transfers, transfer_volume = _transfer_stats(transfers)
                         if recent_transfers > 100 and transfer_volume > 1000000:
                             score -= 1
-                            activity_indicators.append(f"High on-chain transfer activity: {recent_transfers} txs, {transfer_volume} volume")
+                            activity_indicators.add("High on-chain transfer activity: {} txs, {} volume", recent_transfers, transfer_volume)
                         elif recent_transfers < 5:
                             score += 1
-                            activity_indicators.append(f"Very low on-chain transfer activity: {recent_transfers} txs")
+                            activity_indicators.add("Very low on-chain transfer activity: {} txs", recent_transfers)
                 except:
                     pass
 
             # 5. Protocol integrations (Zapper, DeBank, DefiLlama)
-            integrations = []
-            for proto in ['zapper', 'debank', 'defillama']:
-                pdata = risk_report.get('enhanced', {}).get(proto, {})
-                if pdata:
-                    integrations.append(proto)
+            integrations = view.integrations
             if integrations:
                 score -= 1
-                activity_indicators.append(f"Integrated in DeFi protocols: {', '.join(integrations)}")
+                activity_indicators.add("Integrated in DeFi protocols: {}", ', '.join(integrations))
                 data_found = True
             else:
                 score += 0.5
-                activity_indicators.append("Not integrated in major DeFi protocols")
+                activity_indicators.add("Not integrated in major DeFi protocols")
 
             # Clamp score and set defaults
             if not data_found:
                 score = max(score, 7)  # If no data, set to mid/high risk
-                activity_indicators.append("Insufficient dev activity data; defaulting to higher risk")
-            score = max(1, min(9, round(score)))  # Never give 10/10, max is 9
-            risk_report['dev_activity_indicators'] = activity_indicators
-            return score
-        except Exception as e:
-            print(f"Error in dev_activity scoring: {e}")
-            return 7
+                activity_indicators.add("Insufficient dev activity data; defaulting to higher risk")
+            score = _rounded_score(score)  # Never give 10/10, max is 9
+            if verbose:
+                risk_report['dev_activity_indicators'] = activity_indicators.messages
+            return float(score)
+        except Exception:
+            logger.exception("Error in dev_activity scoring")
+            return 7.0
     
     
+    @staticmethod
+    def _apply_certik(report):
+        """Return (score_delta, indicator) for a CertiK security report"""
+        certik_score = report.get('score')
+        audit_status = report.get('audit_status', '').lower()
+        if audit_status == 'audited' and certik_score and certik_score >= CERTIK_STRONG_SCORE:
+            return -3, f"CertiK: Audited, score {certik_score}"
+        if audit_status == 'audited':
+            return -2, "CertiK: Audited"
+        if audit_status == 'unaudited' or (certik_score and certik_score < CERTIK_WEAK_SCORE):
+            return 3, f"CertiK: Unaudited or low score ({certik_score})"
+        return 0, f"CertiK: Status {audit_status}, score {certik_score}"
+    
     def score_aml_data(self, risk_report, token_address, chain):
         """Score based on AML data from CertiK, Scorechain, TRM Labs, Elliptic (if available)"""
         indicators = []
         score = 10
+        # Fire the three provider lookups together; results are consumed in the original order
+        futures = submit_provider_calls({
+            'certik': (self.fetch_security_reports, token_address, chain),
+            'scorechain': (fetch_scorechain_aml, token_address, chain),
+            'trmlabs': (fetch_trmlabs_aml, token_address, chain),
+        })
         # CertiK
-        certik_reports = self.fetch_security_reports(token_address, chain)
-        certik_score = None
+        certik_reports = futures['certik'].result()
         if certik_reports:
-            for report in certik_reports:
-                if report.get('source') == 'CertiK':
-                    certik_score = report.get('score')
-                    audit_status = report.get('audit_status', '').lower()
-                    if audit_status == 'audited' and certik_score and certik_score >= 80:
-                        score -= 3
-                        indicators.append(f"CertiK: Audited, score {certik_score}")
-                    elif audit_status == 'audited':
-                        score -= 2
-                        indicators.append("CertiK: Audited")
-                    elif audit_status == 'unaudited' or (certik_score and certik_score < 60):
-                        score += 3
-                        indicators.append(f"CertiK: Unaudited or low score ({certik_score})")
-                    else:
-                        indicators.append(f"CertiK: Status {audit_status}, score {certik_score}")
+            certik = {report.get('source'): report for report in certik_reports}.get('CertiK')
+            if certik:
+                score_delta, indicator = self._apply_certik(certik)
+                score += score_delta
+                indicators.append(indicator)
         else:
             indicators.append("No CertiK audit data")
         # Scorechain
         try:
-            scorechain_result = fetch_scorechain_aml(token_address, chain)
+            scorechain_result = futures['scorechain'].result()
             if scorechain_result:
                 indicators.append(f"Scorechain: {scorechain_result['summary']}")
                 score += scorechain_result['score_delta']
@@ -3239,16 +4226,16 @@ class DeFiRiskAssessor:
             indicators.append(f"Scorechain error: {e}")
         # TRM Labs
         try:
-            trm_result = fetch_trmlabs_aml(token_address, chain)
+            trm_result = futures['trmlabs'].result()
             if trm_result:
                 indicators.append(f"TRM Labs: {trm_result['summary']}")
                 score += trm_result['score_delta']
         except Exception as e:
             indicators.append(f"TRM Labs error: {e}")
         # Clamp score
-        score = max(1, min(9, round(score)))
+        score = _rounded_score(score)
         risk_report['aml_data_indicators'] = indicators
-        return score
+        return float(score)
 
     def score_compliance_data(self, risk_report, token_address, chain):
         """Score based on compliance data (Breadcrumbs, exchange, KYC/AML, red flags, OpenSanctions, Lukka, Alchemy, DeFiSafety)"""
@@ -3256,6 +4243,16 @@ class DeFiRiskAssessor:
             score = 5
             data_found = False
             compliance_indicators = []
+            # Start the external compliance lookups now so they overlap with the local checks below
+            futures = submit_provider_calls({
+                'opensanctions': (fetch_opensanctions_compliance, token_address, chain),
+                'lukka': (fetch_lukka_compliance, token_address, chain),
+                'alchemy': (fetch_alchemy_compliance, token_address, chain),
+                'defisafety': (fetch_defisafety_compliance, token_address, chain),
+            })
+            # Shared report sections
+            view = self._get_report_cache(risk_report).view
+            onchain = view.onchain
             # Breadcrumbs risk and sanctions
             breadcrumbs_risk = risk_report.get('breadcrumbs_risk')
             if breadcrumbs_risk:
@@ -3278,18 +4275,18 @@ class DeFiRiskAssessor:
             else:
                 compliance_indicators.append("No Breadcrumbs risk data")
             # Exchange listings (regulated vs unregulated)
-            project_data = risk_report.get('market', {}).get('coingecko', {})
-            tickers = project_data.get('tickers', [])
-            regulated_exchanges = ['coinbase', 'kraken', 'gemini']
-            major_exchanges = ['binance', 'coinbase', 'kraken', 'gemini', 'bitfinex', 'huobi']
+            project_data = view.project_data
+            tickers = view.tickers
             found_regulated = False
             found_major = False
             for t in tickers:
                 ex = t.get('market', {}).get('name', '').lower()
-                if ex in regulated_exchanges:
-                    found_regulated = True
-                if ex in major_exchanges:
+                if ex in MAJOR_EXCHANGES:
                     found_major = True
+                    # Every regulated exchange is also a major one, so nothing later can change the outcome
+                    if ex in REGULATED_EXCHANGES:
+                        found_regulated = True
+                        break
             if found_regulated:
                 score -= 2
                 compliance_indicators.append("Listed on regulated exchange")
@@ -3302,13 +4299,8 @@ class DeFiRiskAssessor:
                 score += 1
                 compliance_indicators.append("Not listed on major/regulated exchanges")
             # KYC/AML/Regulatory language in description or website
-            description = project_data.get('description', {}).get('en', '')
-            website = ''
-            links = project_data.get('links', {})
-            if isinstance(links, dict):
-                website = links.get('homepage', [''])[0]
-            kyc_keywords = ['kyc', 'aml', 'compliant', 'regulatory', 'regulated', 'license', 'governance', 'oversight', 'audit', 'transparency']
-            kyc_matches = [kw for kw in kyc_keywords if kw in description.lower() or kw in website.lower()]
+            links = view.links
+            kyc_matches = view.kyc_matches
             if len(kyc_matches) >= 2:
                 score -= 2
                 compliance_indicators.append(f"KYC/AML language: {', '.join(kyc_matches)}")
@@ -3321,15 +4313,8 @@ class DeFiRiskAssessor:
                 score += 1
                 compliance_indicators.append("No KYC/AML language found")
             # Penalize for critical red flags
-            onchain = risk_report.get('onchain', {})
-            red_flags = onchain.get('red_flags', [])
-            critical_flags = [
-                'eu_unlicensed_stablecoin',
-                'eu_regulatory_issues',
-                'mica_non_compliant',
-                'mica_no_whitepaper'
-            ]
-            for flag in critical_flags:
+            red_flags = set(onchain.get('red_flags', []))
+            for flag in CRITICAL_COMPLIANCE_FLAGS:
                 if flag in red_flags:
                     score += 3
                     compliance_indicators.append(f"Red flag: {flag}")
@@ -3356,8 +4341,7 @@ class DeFiRiskAssessor:
                 compliance_indicators.append("No professional legal presence")
             # Platform/chain
             token_type = project_data.get('asset_platform_id', '')
-            established_platforms = ['ethereum', 'binance-smart-chain', 'polygon-pos', 'avalanche', 'solana']
-            if token_type in established_platforms:
+            if token_type in ESTABLISHED_PLATFORMS:
                 score -= 0.5
                 compliance_indicators.append(f"Established platform: {token_type}")
                 data_found = True
@@ -3368,7 +4352,7 @@ class DeFiRiskAssessor:
                 compliance_indicators.append(f"Platform: {token_type}")
             # Liquidity (regulatory scrutiny)
             try:
-                liquidity = risk_report.get('onchain', {}).get('liquidity', {}).get('total_liquidity_usd', 0)
+                liquidity = view.liquidity_usd
                 if liquidity > 100_000_000:
                     score -= 1
                     compliance_indicators.append(f"Very high liquidity: ${liquidity:,.0f}")
@@ -3387,7 +4371,7 @@ class DeFiRiskAssessor:
                 pass
             # OpenSanctions integration
             try:
-                opensanctions_result = fetch_opensanctions_compliance(token_address, chain)
+                opensanctions_result = futures['opensanctions'].result()
                 if opensanctions_result:
                     compliance_indicators.append(f"OpenSanctions: {opensanctions_result['summary']}")
                     score += opensanctions_result['score_delta']
@@ -3395,7 +4379,7 @@ class DeFiRiskAssessor:
                 compliance_indicators.append(f"OpenSanctions error: {e}")
             # Lukka integration
             try:
-                lukka_result = fetch_lukka_compliance(token_address, chain)
+                lukka_result = futures['lukka'].result()
                 if lukka_result:
                     compliance_indicators.append(f"Lukka: {lukka_result['summary']}")
                     score += lukka_result['score_delta']
@@ -3403,7 +4387,7 @@ class DeFiRiskAssessor:
                 compliance_indicators.append(f"Lukka error: {e}")
             # Alchemy integration
             try:
-                alchemy_result = fetch_alchemy_compliance(token_address, chain)
+                alchemy_result = futures['alchemy'].result()
                 if alchemy_result:
                     compliance_indicators.append(f"Alchemy: {alchemy_result['summary']}")
                     score += alchemy_result['score_delta']
@@ -3411,7 +4395,7 @@ class DeFiRiskAssessor:
                 compliance_indicators.append(f"Alchemy error: {e}")
             # DeFiSafety scraping
             try:
-                defisafety_result = fetch_defisafety_compliance(token_address, chain)
+                defisafety_result = futures['defisafety'].result()
                 if defisafety_result:
                     compliance_indicators.append(f"DeFiSafety: {defisafety_result['summary']}")
                     score += defisafety_result['score_delta']
@@ -3420,387 +4404,79 @@ class DeFiRiskAssessor:
             if not data_found:
                 score = max(score, 7)
                 compliance_indicators.append("Insufficient compliance data; defaulting to higher risk")
-            score = max(1, min(9, round(score)))
+            score = _rounded_score(score)
             risk_report['compliance_data_indicators'] = compliance_indicators
-            return score
-        except Exception as e:
-            print(f"Error in compliance_data scoring: {e}")
-            return 7
+            return float(score)
+        except Exception:
+            logger.exception("Error in compliance_data scoring")
+            return 7.0
 
     def score_marketing_demand(self, risk_report):
         """Enhanced score based on marketing demand and social activity (1-10)"""
         try:
-            score = 5  # Base score
-            data_found = False
-            
-            # Santiment social activity data
+            # Shared report sections
+            cache = self._get_report_cache(risk_report)
+            view = cache.view
+            defillama = view.defillama
+            holders = view.holders
+            
+            # Santiment social activity data (NaN when unavailable)
+            avg_volume = recent_volume = float('nan')
             santiment_social = risk_report.get('santiment', {}).get('social', [])
             if santiment_social:
-                valid_values = [point['value'] for point in santiment_social 
-                              if isinstance(point, dict) and 'value' in point and point['value'] is not None]
-                if valid_values:
-                    avg_volume = sum(valid_values) / len(valid_values)
-                    recent_volume = valid_values[-1] if valid_values else 0
-                    
-                    if avg_volume > 10000 and recent_volume > 5000:
-                        score -= 2  # Very high social activity
-                        data_found = True
-                    elif avg_volume > 1000 and recent_volume > 500:
-                        score -= 1  # High social activity
-                        data_found = True
-                    elif avg_volume < 100 or recent_volume < 50:
-                        score += 2  # Low social activity
-                    elif avg_volume < 500:
-                        score += 1  # Moderate social activity
+                values = _santiment_values(santiment_social)
+                if values.size:
+                    avg_volume, recent_volume = _series_mean_last(values)
             
             # Social media presence
-            project_data = risk_report.get('market', {}).get('coingecko', {})
-            links = project_data.get('links', {})
-            
-            social_platforms = [
-                'twitter_screen_name', 'telegram_channel_identifier', 
-                'subreddit_url', 'discord', 'medium', 'reddit'
-            ]
-            social_presence = sum(1 for platform in social_platforms if links.get(platform))
-            if social_presence >= 3:
-                score -= 1  # Lower risk if strong social presence
-                data_found = True
-            elif social_presence == 0:
-                score += 2  # Higher risk if no social presence
-            elif social_presence == 1:
-                score += 1  # Higher risk if minimal social presence
-            
-            # Trading volume as demand indicator
-            try:
-                volume_24h = project_data.get('market_data', {}).get('total_volume', {}).get('usd', 0)
-                if volume_24h > 10_000_000:  # Very high volume
-                    score -= 2  # Very high demand
-                    data_found = True
-                elif volume_24h > 1_000_000:  # High volume
-                    score -= 1  # High demand
-                    data_found = True
-                elif volume_24h < 10_000:  # Very low volume
-                    score += 2  # Very low demand
-                elif volume_24h < 100_000:  # Low volume
-                    score += 1  # Low demand
-            except:
-                pass
-            
-            # Price performance as demand indicator
-            try:
-                price_change_24h = project_data.get('market_data', {}).get('price_change_percentage_24h', 0)
-                if price_change_24h and price_change_24h > 20:  # Strong positive performance
-                    score -= 1  # High demand
-                    data_found = True
-                elif price_change_24h and price_change_24h < -20:  # Poor performance
-                    score += 1  # Low demand
-            except:
-                pass
-            
-            # Alternative data sources when primary data is limited
-            if not data_found:
-                # Use Moralis transfer data for demand indicators
-                try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    transfers = moralis_data.get('transfers', [])
-                    if transfers:
-                        # Check for high transfer activity (indicates demand)
-                        if len(transfers) > 100:
-                            score -= 1  # Lower risk for high demand
-                        elif len(transfers) < 10:
-                            score += 1  # Higher risk for low demand
-                except:
-                    pass
-                
-                # Use holder count as demand indicator
-                try:
-                    holders = risk_report.get('onchain', {}).get('holders', {})
-                    if holders:
-                        total_holders = holders.get('total_holders', 0)
-                        if total_holders > 50000:
-                            score -= 2  # Very high demand
-                        elif total_holders > 10000:
-                            score -= 1  # High demand
-                        elif total_holders < 1000:
-                            score += 1  # Low demand
-                except:
-                    pass
-                
-                # Use liquidity as demand indicator
-                try:
-                    liquidity = risk_report.get('onchain', {}).get('liquidity', {}).get('total_liquidity_usd', 0)
-                    if liquidity > 5_000_000:
-                        score -= 1  # Lower risk for high demand
-                    elif liquidity < 100_000:
-                        score += 1  # Higher risk for low demand
-                except:
-                    pass
-                
-                # Use DeFiLlama data for protocol demand
-                try:
-                    defillama_data = risk_report.get('enhanced', {}).get('defillama', {})
-                    if defillama_data.get('price') or defillama_data.get('yields'):
-                        score -= 1  # Lower risk if DeFiLlama tracks it (indicates demand)
-                except:
-                    pass
-            
-            return max(1, min(10, score))
-        except Exception as e:
-            print(f"Error in marketing_demand scoring: {e}")
-            return 7
+            links = view.links
+            social_presence = sum(1 for platform in SOCIAL_PLATFORMS if links.get(platform))
+            
+            # Fallback-source inputs, only applied by the kernel when primary data is limited
+            holder_delta = 0
+            if holders and view.holder_bucket is not None:
+                holder_delta = HOLDER_DELTAS['marketing_demand'][view.holder_bucket][0]
+            liquidity_delta = 0
+            if view.liquidity_usd is not None:
+                liquidity_delta = _ladder_delta(view.liquidity_usd, LIQUIDITY_LADDERS['marketing_demand'])[0]
+            tracked_by_defillama = bool(isinstance(defillama, (dict, MappingProxyType))
+                                        and (defillama.get('price') or defillama.get('yields')))
+            
+            return float(_marketing_demand_kernel(
+                avg_volume, recent_volume, social_presence,
+                _nan_if_none(view.volume_24h_or_zero), _nan_if_none(view.price_change_24h),
+                len(view.moralis_transfers), holder_delta, liquidity_delta, tracked_by_defillama))
+        except Exception:
+            logger.exception("Error in marketing_demand scoring")
+            return 7.0
     
     def score_esg_impact(self, risk_report):
         """Enhanced score based on Environmental, Social, and Governance impact (1-10)"""
         try:
-            score = 5  # Base score
-            data_found = False
-            esg_score = 0
-            
-            project_data = risk_report.get('market', {}).get('coingecko', {})
-            
-            # Environmental Impact Assessment
-            description = project_data.get('description', {}).get('en', '').lower()
-            
-            # Environmental keywords
-            environmental_keywords = [
-                'carbon', 'green', 'sustainable', 'renewable', 'energy', 'climate',
-                'environmental', 'eco', 'clean', 'zero-emission', 'carbon-neutral',
-                'solar', 'wind', 'hydro', 'geothermal', 'biomass', 'recycling'
-            ]
-            env_count = sum(1 for keyword in environmental_keywords if keyword in description)
-            if env_count >= 3:
-                score -= 2  # Lower risk for strong environmental focus
-                data_found = True
-                esg_score += 3
-            elif env_count >= 2:
-                score -= 1  # Lower risk for environmental focus
-                data_found = True
-                esg_score += 2
-            elif env_count >= 1:
-                esg_score += 1
-            else:
-                score += 1  # Higher risk for no environmental focus
-                esg_score -= 1
-            
-            # Social Impact Assessment
-            social_keywords = [
-                'social', 'community', 'inclusive', 'equality', 'diversity',
-                'education', 'healthcare', 'charity', 'donation', 'philanthropy',
-                'microfinance', 'banking', 'financial inclusion', 'unbanked',
-                'developing', 'emerging markets', 'accessibility'
-            ]
-            social_count = sum(1 for keyword in social_keywords if keyword in description)
-            if social_count >= 3:
-                score -= 2  # Lower risk for strong social impact
-                data_found = True
-                esg_score += 3
-            elif social_count >= 2:
-                score -= 1  # Lower risk for social impact
-                data_found = True
-                esg_score += 2
-            elif social_count >= 1:
-                esg_score += 1
-            else:
-                score += 1  # Higher risk for no social impact
-                esg_score -= 1
-            
-            # Governance Impact Assessment
-            governance_keywords = [
-                'governance', 'dao', 'democratic', 'transparent', 'accountable',
-                'voting', 'proposal', 'community-driven', 'decentralized',
-                'open source', 'audit', 'compliance', 'regulation', 'legal'
-            ]
-            gov_count = sum(1 for keyword in governance_keywords if keyword in description)
-            if gov_count >= 3:
-                score -= 2  # Lower risk for strong governance
-                data_found = True
-                esg_score += 3
-            elif gov_count >= 2:
-                score -= 1  # Lower risk for governance focus
-                data_found = True
-                esg_score += 2
-            elif gov_count >= 1:
-                esg_score += 1
-            else:
-                score += 1  # Higher risk for poor governance
-                esg_score -= 1
-            
-            # Community engagement as ESG indicator
-            try:
-                community_score = project_data.get('community_score', 0)
-                if community_score > 80:
-                    score -= 1  # Lower risk for excellent community engagement
-                    data_found = True
-                    esg_score += 2
-                elif community_score > 50:
-                    score -= 0.5  # Lower risk for good community engagement
-                    data_found = True
-                    esg_score += 1
-                elif community_score < 10:
-                    score += 1  # Higher risk for poor community engagement
-                    esg_score -= 1
-            except:
-                pass
-            
-            # Developer activity as ESG indicator
+            inputs = _esg_kernel_inputs(self._get_report_cache(risk_report))
+            if inputs is ESG_EMPTY_INPUTS:
+                return ESG_EMPTY_REPORT_SCORE
+            return float(_esg_impact_kernel(*inputs))
+        except Exception:
+            logger.exception("Error in esg_impact scoring")
+            return 5.0
+    
+    def score_esg_impact_batch(self, reports):
+        """score_esg_impact for many reports: gather each report's inputs, then score them in one kernel pass"""
+        features = np.full((len(reports), len(ESG_EMPTY_INPUTS)), np.nan)
+        failed = np.zeros(len(reports), dtype=bool)
+        for i, report in enumerate(reports):
             try:
-                dev_score = project_data.get('developer_score', 0)
-                if dev_score > 80:
-                    score -= 1  # Lower risk for very active development
-                    data_found = True
-                    esg_score += 2
-                elif dev_score > 50:
-                    score -= 0.5  # Lower risk for active development
-                    data_found = True
-                    esg_score += 1
-                elif dev_score < 10:
-                    score += 1  # Higher risk for low development activity
-                    esg_score -= 1
-            except:
-                pass
-            
-            # Enhanced data sources for ESG assessment
-            if not data_found:
-                # Check contract verification as governance indicator
-                contract_verified = risk_report.get('onchain', {}).get('contract_verified', '')
-                if contract_verified == 'verified':
-                    score -= 1  # Lower risk if verified (indicates transparency)
-                    esg_score += 2
-                else:
-                    esg_score -= 1
-                
-                # Check contract complexity as governance indicator
-                contract_source = risk_report.get('onchain', {}).get('contract_source', '')
-                if contract_source:
-                    # Check for governance functions
-                    governance_functions = [
-                        'vote', 'proposal', 'governance', 'dao', 'multisig',
-                        'timelock', 'accesscontrol', 'ownable'
-                    ]
-                    gov_func_count = sum(1 for func in governance_functions if func in contract_source.lower())
-                    if gov_func_count >= 2:
-                        score -= 1  # Lower risk for governance functions
-                        esg_score += 2
-                    elif gov_func_count >= 1:
-                        esg_score += 1
-                    else:
-                        score += 1  # Higher risk for no governance functions
-                        esg_score -= 1
-                    
-                    # Check for transparency features
-                    transparency_features = [
-                        'public', 'view', 'external', 'event', 'emit'
-                    ]
-                    trans_count = sum(1 for feature in transparency_features if feature in contract_source.lower())
-                    if trans_count >= 5:
-                        score -= 1  # Lower risk for transparency
-                        esg_score += 2
-                    elif trans_count >= 3:
-                        esg_score += 1
-                    else:
-                        score += 1  # Higher risk for lack of transparency
-                        esg_score -= 1
-                
-                # Use holder distribution as social impact indicator
-                try:
-                    holders = risk_report.get('onchain', {}).get('holders', {})
-                    if holders:
-                        total_holders = holders.get('total_holders', 0)
-                        top10_concentration = holders.get('top10_concentration', 100)
-                        
-                        if total_holders > 100000 and top10_concentration < 30:
-                            score -= 2  # Lower risk for broad distribution (social impact)
-                            esg_score += 3
-                        elif total_holders > 50000 and top10_concentration < 50:
-                            score -= 1  # Lower risk for good distribution
-                            esg_score += 2
-                        elif total_holders > 10000:
-                            esg_score += 1
-                        elif total_holders < 1000 or top10_concentration > 80:
-                            score += 2  # Higher risk for concentrated holdings
-                            esg_score -= 2
-                        elif total_holders < 5000 or top10_concentration > 60:
-                            score += 1  # Higher risk for poor distribution
-                            esg_score -= 1
-                except:
-                    pass
-                
-                # Use liquidity as environmental/social indicator
-                try:
-                    liquidity = risk_report.get('onchain', {}).get('liquidity', {}).get('total_liquidity_usd', 0)
-                    if liquidity > 10_000_000:
-                        score -= 1  # Lower risk for high liquidity (indicates sustainable project)
-                        esg_score += 2
-                    elif liquidity > 1_000_000:
-                        esg_score += 1
-                    elif liquidity < 100_000:
-                        score += 1  # Higher risk for very low liquidity
-                        esg_score -= 1
-                except:
-                    pass
-                
-                # Use market cap as ESG indicator
-                try:
-                    market_cap = project_data.get('market_data', {}).get('market_cap', {}).get('usd', 0)
-                    if market_cap > 1_000_000_000:
-                        score -= 1  # Lower risk for high market cap (indicates sustainable project)
-                        esg_score += 2
-                    elif market_cap > 100_000_000:
-                        esg_score += 1
-                    elif market_cap < 1_000_000:
-                        score += 1  # Higher risk for low market cap
-                        esg_score -= 1
-                except:
-                    pass
-                
-                # Use Moralis metadata for ESG indicators
-                try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    metadata = moralis_data.get('metadata', {})
-                    if metadata:
-                        # Check for detailed metadata (indicates transparency)
-                        if metadata.get('name') and metadata.get('symbol') and metadata.get('decimals'):
-                            esg_score += 1
-                        if metadata.get('description') and len(metadata.get('description', '')) > 100:
-                            esg_score += 1
-                except:
-                    pass
-                
-                # Use DeFiLlama data for ESG indicators
-                try:
-                    defillama_data = risk_report.get('enhanced', {}).get('defillama', {})
-                    if defillama_data.get('yields') or defillama_data.get('price'):
-                        esg_score += 1  # Lower risk if DeFiLlama tracks it (indicates sustainability)
-                except:
-                    pass
-                
-                # Check for professional links as governance indicator
-                links = project_data.get('links', {})
-                professional_links = ['linkedin', 'medium', 'blog', 'docs', 'documentation']
-                prof_count = sum(1 for link in professional_links if links.get(link))
-                if prof_count >= 2:
-                    score -= 1  # Lower risk for professional documentation
-                    esg_score += 2
-                elif prof_count >= 1:
-                    esg_score += 1
-                else:
-                    score += 1  # Higher risk for lack of professional documentation
-                    esg_score -= 1
-            
-            # Apply ESG score adjustment
-            if esg_score >= 8:
-                score = max(1, score - 2)  # Bonus for excellent ESG
-            elif esg_score >= 5:
-                score = max(1, score - 1)  # Bonus for good ESG
-            elif esg_score <= -6:
-                score = min(10, score + 2)  # Penalty for poor ESG
-            elif esg_score <= -3:
-                score = min(10, score + 1)  # Penalty for moderate ESG
-            
-            return max(1, min(10, score))
-        except Exception as e:
-            print(f"Error in esg_impact scoring: {e}")
-            return 5
+                # Reuse a live per-report cache, but don't leave new ones behind for reports not being assessed
+                entry = self._report_caches.get(id(report))
+                cache = entry[1] if entry is not None and entry[0] is report and entry[1] is not None else _ReportCache(report)
+                features[i] = _esg_kernel_inputs(cache)
+            except Exception:
+                logger.exception("Error in esg_impact scoring")
+                failed[i] = True
+        scores = _esg_impact_batch_kernel(features)
+        scores[failed] = 5.0
+        return scores
 
     
         
@@ -3846,18 +4522,22 @@ class DeFiRiskAssessor:
         
         # 2. Check liquidity against minimum threshold
         min_liquidity = self.CHAIN_CONFIG[chain]['min_liquidity']
-        liquidity = risk_report['onchain']['liquidity'] or 0
+        liquidity = risk_report['onchain'].get('liquidity')
+        if isinstance(liquidity, dict):
+            # Provider-shaped liquidity block rather than the plain USD figure fetch_onchain_data stores
+            liquidity = liquidity.get('total_liquidity_usd', 0)
+        liquidity = liquidity or 0
         if liquidity < min_liquidity:
-            risk_report['onchain']['red_flags'].append('low_liquidity')
+            risk_report['onchain']['red_flags'].append(RF_LOW_LIQUIDITY)
         
         # 3. Check contract verification status
         if risk_report['onchain']['contract_verified'] != 'verified':
-            risk_report['onchain']['red_flags'].append('unverified_contract')
+            risk_report['onchain']['red_flags'].append(RF_UNVERIFIED_CONTRACT)
         
         # 4. Check holder concentration
         holders = risk_report['onchain']['holders']
         if holders['top10_concentration'] > 50 or holders['total_holders'] < 1000:
-            risk_report['onchain']['red_flags'].append('high_concentration')
+            risk_report['onchain']['red_flags'].append(RF_HIGH_CONCENTRATION)
     
     def apply_eu_regulatory_checks(self, risk_report):
         """Apply EU regulatory compliance checks (MiCA, etc.)
@@ -3885,7 +4565,7 @@ class DeFiRiskAssessor:
         """
         try:
             # Get token information
-            token_address = risk_report.get('token', '').lower()
+            stablecoin = self.detect_stablecoin(risk_report)
             symbol = risk_report.get('symbol', '').upper()
             project_data = risk_report.get('market', {}).get('coingecko', {})
             
@@ -3900,54 +4580,10 @@ class DeFiRiskAssessor:
                 }
             
             # 1. Unlicensed Stablecoin Detection (CRITICAL)
-            unlicensed_stablecoins = {
-                # USDT - Not MiCA compliant, major EU regulatory issue
-                "0xdac17f958d2ee523a2206206994597c13d831ec7": {
-                    "symbol": "USDT",
-                    "name": "Tether USD",
-                    "issue": "Not MiCA compliant - major EU regulatory risk",
-                    "eu_status": "Unlicensed",
-                    "restrictions": "Cannot be offered to EU retail investors"
-                },
-                # USDC - Not fully MiCA compliant
-                "0xa0b86a33e6441b8c4c8c0b8c4c8c0b8c4c8c0b8c": {
-                    "symbol": "USDC",
-                    "name": "USD Coin",
-                    "issue": "Limited MiCA compliance",
-                    "eu_status": "Restricted",
-                    "restrictions": "Limited EU availability"
-                },
-                # DAI - Decentralized stablecoin, regulatory uncertainty
-                "0x6b175474e89094c44da98b954eedeac495271d0f": {
-                    "symbol": "DAI",
-                    "name": "Dai",
-                    "issue": "Decentralized stablecoin - regulatory uncertainty",
-                    "eu_status": "Unclear",
-                    "restrictions": "May face regulatory challenges"
-                },
-                # BUSD - Binance USD, regulatory issues
-                "0x4fabb145d64652a948d72533023f6e7a623c7c53": {
-                    "symbol": "BUSD",
-                    "name": "Binance USD",
-                    "issue": "Binance regulatory issues in EU",
-                    "eu_status": "Restricted",
-                    "restrictions": "Limited EU availability"
-                },
-                # FRAX - Algorithmic stablecoin, regulatory concerns
-                "0x853d955acef822db058eb8505911ed77f175b99e": {
-                    "symbol": "FRAX",
-                    "name": "Frax",
-                    "issue": "Algorithmic stablecoin - regulatory concerns",
-                    "eu_status": "Unclear",
-                    "restrictions": "May face regulatory challenges"
-                }
-            }
-            
             # Check if token is an unlicensed stablecoin
-            if token_address in unlicensed_stablecoins:
-                stablecoin_info = unlicensed_stablecoins[token_address]
-                if 'eu_unlicensed_stablecoin' not in risk_report['onchain']['red_flags']:
-                    risk_report['onchain']['red_flags'].append('eu_unlicensed_stablecoin')
+            if stablecoin.unlicensed is not None:
+                stablecoin_info = stablecoin.unlicensed
+                _add_red_flag(risk_report, RF_EU_UNLICENSED_STABLECOIN)
                 risk_report['eu_compliance'] = {
                     'status': stablecoin_info['eu_status'],
                     'issue': stablecoin_info['issue'],
@@ -3955,14 +4591,12 @@ class DeFiRiskAssessor:
                     'mica_compliant': False,
                     'eu_trading_allowed': False
                 }
-                print(f"[EU COMPLIANCE] {symbol} flagged as unlicensed stablecoin: {stablecoin_info['issue']}")
+                logger.debug("[EU COMPLIANCE] %s flagged as unlicensed stablecoin: %s", symbol, stablecoin_info['issue'])
                 return  # Force Extreme Risk classification
             
             # Additional check by symbol for major stablecoins
-            major_unlicensed_stablecoins = ['USDT', 'USDC', 'DAI', 'BUSD', 'FRAX']
-            if symbol in major_unlicensed_stablecoins:
-                if 'eu_unlicensed_stablecoin' not in risk_report['onchain']['red_flags']:
-                    risk_report['onchain']['red_flags'].append('eu_unlicensed_stablecoin')
+            if stablecoin.major_symbol:
+                _add_red_flag(risk_report, RF_EU_UNLICENSED_STABLECOIN)
                 risk_report['eu_compliance'] = {
                     'status': 'Unlicensed',
                     'issue': f'{symbol} - Not MiCA compliant - major EU regulatory risk',
@@ -3970,31 +4604,14 @@ class DeFiRiskAssessor:
                     'mica_compliant': False,
                     'eu_trading_allowed': False
                 }
-                print(f"[EU COMPLIANCE] {symbol} flagged as unlicensed stablecoin by symbol check")
+                logger.debug("[EU COMPLIANCE] %s flagged as unlicensed stablecoin by symbol check", symbol)
                 return  # Force Extreme Risk classification
             
             # 2. EU Regulatory Issues Database
-            eu_regulatory_issues = {
-                # Tokens with known EU regulatory problems
-                "0x1f9840a85d5af5bf1d1762f925bdaddc4201f984": {  # UNI
-                    "symbol": "UNI",
-                    "issue": "Uniswap regulatory uncertainty in EU",
-                    "eu_status": "Restricted",
-                    "restrictions": "DeFi governance token - regulatory concerns"
-                },
-                "0x6b3595068778dd592e39a122f4f5a5cf09c90fe2": {  # SUSHI
-                    "symbol": "SUSHI",
-                    "issue": "DeFi governance token - regulatory uncertainty",
-                    "eu_status": "Restricted",
-                    "restrictions": "May face regulatory challenges"
-                }
-            }
-            
-            # Check for EU regulatory issues
-            if token_address in eu_regulatory_issues:
-                issue_info = eu_regulatory_issues[token_address]
-                if 'eu_regulatory_issues' not in risk_report['onchain']['red_flags']:
-                    risk_report['onchain']['red_flags'].append('eu_regulatory_issues')
+            address_key = _address_key(risk_report.get('token', ''))
+            if address_key in EU_REGULATORY_ISSUES:
+                issue_info = EU_REGULATORY_ISSUES[address_key]
+                _add_red_flag(risk_report, RF_EU_REGULATORY_ISSUES)
                 risk_report['eu_compliance'] = {
                     'status': issue_info['eu_status'],
                     'issue': issue_info['issue'],
@@ -4002,13 +4619,13 @@ class DeFiRiskAssessor:
                     'mica_compliant': False,
                     'eu_trading_allowed': False
                 }
-                print(f"[EU COMPLIANCE] {symbol} flagged for EU regulatory issues: {issue_info['issue']}")
+                logger.debug("[EU COMPLIANCE] %s flagged for EU regulatory issues: %s", symbol, issue_info['issue'])
             
             # 3. MiCA Compliance Assessment
             self.assess_mica_compliance(risk_report, symbol, project_data)
             
-        except Exception as e:
-            print(f"[EU COMPLIANCE] Error in regulatory checks: {e}")
+        except Exception:
+            logger.exception("[EU COMPLIANCE] Error in regulatory checks")
     
     def assess_mica_compliance(self, risk_report, symbol, project_data):
         """Assess MiCA (Markets in Crypto-Assets) compliance
@@ -4024,19 +4641,17 @@ class DeFiRiskAssessor:
             project_data (dict): CoinGecko project data
         """
         try:
-            # Check if token is a stablecoin (potential ART/EMT)
-            stablecoin_indicators = [
-                'stablecoin', 'stable', 'usd', 'eur', 'gbp', 'jpy', 'chf',
-                'tether', 'usdc', 'dai', 'busd', 'frax', 'gusd', 'husd'
-            ]
+            # A description without a string 'en' entry has always ended the assessment here,
+            # before any category or MiCA red flag is recorded
+            description = project_data.get('description', {})
+            if not isinstance(description, dict) or not isinstance(description.get('en', ''), str):
+                logger.debug("[MiCA] %s has a malformed description, skipping compliance assessment", symbol)
+                return
             
-            description = project_data.get('description', {}).get('en', '').lower()
-            symbol_lower = symbol.lower()
-            
-            is_stablecoin = any(indicator in symbol_lower for indicator in stablecoin_indicators) or \
-                           any(indicator in description for indicator in stablecoin_indicators)
+            # Check if token is a stablecoin (potential ART/EMT)
+            stablecoin = self.detect_stablecoin(risk_report)
             
-            if is_stablecoin:
+            if stablecoin.mica_indicator:
                 # Stablecoins require full MiCA compliance
                 risk_report['mica_category'] = 'Asset-Referenced Token (ART)'
                 risk_report['mica_requirements'] = [
@@ -4048,13 +4663,13 @@ class DeFiRiskAssessor:
                 ]
                 
                 # Check if already flagged as unlicensed
-                if 'eu_unlicensed_stablecoin' not in risk_report['onchain']['red_flags']:
+                if RF_EU_UNLICENSED_STABLECOIN not in risk_report['onchain']['red_flags']:
                     # Check for MiCA compliance indicators
-                    has_eu_establishment = self.check_eu_establishment(project_data)
-                    has_authorization = self.check_mica_authorization(project_data)
+                    has_eu_establishment = stablecoin.eu_establishment
+                    has_authorization = stablecoin.mica_authorization
                     
                     if not has_eu_establishment or not has_authorization:
-                        risk_report['onchain']['red_flags'].append('mica_non_compliant')
+                        risk_report['onchain']['red_flags'].append(RF_MICA_NON_COMPLIANT)
                         risk_report['eu_compliance'] = {
                             'status': 'Non-Compliant',
                             'issue': 'Stablecoin without MiCA authorization',
@@ -4062,7 +4677,7 @@ class DeFiRiskAssessor:
                             'mica_compliant': False,
                             'eu_trading_allowed': False
                         }
-                        print(f"[MiCA] {symbol} flagged as non-compliant stablecoin")
+                        logger.debug("[MiCA] %s flagged as non-compliant stablecoin", symbol)
             else:
                 # Utility tokens have lighter requirements
                 risk_report['mica_category'] = 'Utility Token'
@@ -4075,91 +4690,59 @@ class DeFiRiskAssessor:
                 # Check for basic compliance
                 has_whitepaper = project_data.get('links', {}).get('whitepaper')
                 if not has_whitepaper:
-                    risk_report['onchain']['red_flags'].append('mica_no_whitepaper')
-                    print(f"[MiCA] {symbol} missing required whitepaper")
+                    risk_report['onchain']['red_flags'].append(RF_MICA_NO_WHITEPAPER)
+                    logger.debug("[MiCA] %s missing required whitepaper", symbol)
         
-        except Exception as e:
-            print(f"[MiCA] Error in compliance assessment: {e}")
+        except Exception:
+            logger.exception("[MiCA] Error in compliance assessment")
     
-    def check_eu_establishment(self, project_data):
+    def check_eu_establishment(self, project_data, description=None):
         """Check if project has EU establishment for MiCA compliance"""
         try:
             # Check for EU company registration, offices, etc.
-            description = project_data.get('description', {}).get('en', '').lower()
-            eu_indicators = [
-                'european union', 'eu', 'europe', 'germany', 'france', 'italy',
-                'spain', 'netherlands', 'belgium', 'luxembourg', 'ireland',
-                'malta', 'cyprus', 'estonia', 'lithuania', 'latvia'
-            ]
-            
-            return any(indicator in description for indicator in eu_indicators)
+            if description is None:
+                description = _description_text(project_data)
+            
+            return _has_eu_indicator(description)
         except:
             return False
     
-    def check_mica_authorization(self, project_data):
+    def check_mica_authorization(self, project_data, description=None):
         """Check if project has MiCA authorization"""
         try:
             # Check for regulatory compliance indicators
-            description = project_data.get('description', {}).get('en', '').lower()
-            compliance_indicators = [
-                'mica', 'mica compliant', 'eu authorized', 'eu licensed',
-                'regulated', 'authorization', 'license', 'compliance'
-            ]
+            if description is None:
+                description = _description_text(project_data)
             
-            return any(indicator in description for indicator in compliance_indicators)
+            return _has_mica_indicator(description)
         except:
             return False
     
     def is_stablecoin(self, token_address, symbol, project_data):
-        """Detect if a token is a stablecoin"""
+        """Detect if a token is a stablecoin (by address, symbol or project description)"""
         try:
-            # Check by address for known stablecoins
-            stablecoin_addresses = {
-                "0xdac17f958d2ee523a2206206994597c13d831ec7": "USDT",
-                "0xa0b86a33e6441b8c4c8c0b8c4c8c0b8c4c8c0b8c": "USDC",  # Placeholder address
-                "0x6b175474e89094c44da98b954eedeac495271d0f": "DAI",
-                "0x4fabb145d64652a948d72533023f6e7a623c7c53": "BUSD",
-                "0x853d955acef822db058eb8505911ed77f175b99e": "FRAX"
-            }
-            
-            if token_address.lower() in stablecoin_addresses:
-                return True
-            
-            # Check by symbol
-            stablecoin_symbols = ['USDT', 'USDC', 'DAI', 'BUSD', 'FRAX', 'TUSD', 'USDP', 'GUSD', 'LUSD', 'SUSD']
-            if symbol.upper() in stablecoin_symbols:
-                return True
-            
-            # Check by project description
-            try:
-                description = project_data.get('description', {}).get('en', '').lower()
-                stablecoin_keywords = [
-                    'stablecoin', 'stable coin', 'pegged', 'backed by', 'collateralized',
-                    'usd stable', 'dollar stable', 'price stable'
-                ]
-                if any(keyword in description for keyword in stablecoin_keywords):
-                    return True
-            except:
-                pass
-            
-            return False
+            description = _description_text(project_data)
+        except:
+            description = ''
+        try:
+            return _is_stablecoin(token_address, symbol, description)
         except:
             return False
     
     def get_eu_compliance_status(self, risk_report):
         """Get EU compliance status based on red flags and compliance data"""
         try:
-            red_flags = risk_report.get('onchain', {}).get('red_flags', [])
+            red_flags = set(risk_report.get('onchain', {}).get('red_flags', []))
             eu_compliance = risk_report.get('eu_compliance', {})
             
             # Check for critical EU compliance issues
-            if 'eu_unlicensed_stablecoin' in red_flags:
+            if RF_EU_UNLICENSED_STABLECOIN in red_flags:
                 return "Non-Compliant (Unlicensed Stablecoin)"
-            elif 'eu_regulatory_issues' in red_flags:
+            elif RF_EU_REGULATORY_ISSUES in red_flags:
                 return "Non-Compliant (Regulatory Issues)"
-            elif 'mica_non_compliant' in red_flags:
+            elif RF_MICA_NON_COMPLIANT in red_flags:
                 return "Non-Compliant (MiCA)"
-            elif 'mica_no_whitepaper' in red_flags:
+            elif RF_MICA_NO_WHITEPAPER in red_flags:
                 return "Limited Compliance (No Whitepaper)"
             
             # Check EU compliance data
@@ -4209,32 +4792,17 @@ class DeFiRiskAssessor:
         """
         # EU Compliance Override - CRITICAL
         if risk_report:
-            red_flags = risk_report.get('onchain', {}).get('red_flags', [])
-            
-            # Unlicensed stablecoins = IMMEDIATE Extreme Risk
-            if 'eu_unlicensed_stablecoin' in red_flags:
-                print(f"[EU COMPLIANCE] {risk_report.get('symbol', 'Unknown')} classified as Extreme Risk due to unlicensed stablecoin status")
-                return "Extreme Risk"
-            
-            # EU regulatory issues = Extreme Risk
-            if 'eu_regulatory_issues' in red_flags:
-                print(f"[EU COMPLIANCE] {risk_report.get('symbol', 'Unknown')} classified as Extreme Risk due to EU regulatory issues")
-                return "Extreme Risk"
-            
-            # MiCA non-compliance for stablecoins = Extreme Risk
-            if 'mica_non_compliant' in red_flags:
-                print(f"[EU COMPLIANCE] {risk_report.get('symbol', 'Unknown')} classified as Extreme Risk due to MiCA non-compliance")
-                return "Extreme Risk"
+            red_flags = set(risk_report.get('onchain', {}).get('red_flags', []))
+            
+            # Unlicensed stablecoins, EU regulatory issues and MiCA non-compliance = IMMEDIATE Extreme Risk
+            for flag, reason in EU_EXTREME_RISK_FLAGS:
+                if flag in red_flags:
+                    logger.debug("[EU COMPLIANCE] %s classified as Extreme Risk due to %s",
+                                 risk_report.get('symbol', 'Unknown'), reason)
+                    return "Extreme Risk"
         
-        # Standard risk classification
-        if score <= 50:
-            return "Low Risk"
-        elif score <= 100:
-            return "Medium Risk"
-        elif score <= 120:
-            return "High Risk"
-        else:
-            return "Extreme Risk"
+        # Standard risk classification (bounds are inclusive, hence bisect_left)
+        return RISK_LEVELS[bisect_left(RISK_LEVEL_THRESHOLDS, score)]
     
     def score_business_model(self, risk_report):
         """Enhanced score based on business model sustainability (1-10)"""
@@ -4242,13 +4810,13 @@ class DeFiRiskAssessor:
             score = 5  # Base score
             data_found = False
             
-            # Check for clear business model indicators
-            project_data = risk_report.get('market', {}).get('coingecko', {})
-            description = project_data.get('description', {}).get('en', '').lower()
+            # Shared report sections
+            view = self._get_report_cache(risk_report).view
+            defillama = view.defillama
+            onchain = view.onchain
             
             # Business model keywords
-            business_keywords = ['utility', 'governance', 'staking', 'yield', 'lending', 'swap', 'amm', 'dex']
-            model_count = sum(1 for keyword in business_keywords if keyword in description)
+            model_count = view.keyword_counts['business']
             if model_count >= 2:
                 score -= 1  # Lower risk if clear business model
                 data_found = True
@@ -4258,38 +4826,27 @@ class DeFiRiskAssessor:
             # Alternative data sources when primary data is limited
             if not data_found:
                 # Use DeFiLlama data for business model indicators
-                try:
-                    defillama_data = risk_report.get('enhanced', {}).get('defillama', {})
-                    if defillama_data.get('yields'):
-                        score -= 1  # Lower risk if DeFiLlama tracks yields (indicates business model)
-                except:
-                    pass
+                if isinstance(defillama, (dict, MappingProxyType)) and defillama.get('yields'):
+                    score -= 1  # Lower risk if DeFiLlama tracks yields (indicates business model)
                 
                 # Use contract complexity as business model indicator
-                try:
-                    contract_source = risk_report.get('onchain', {}).get('contract_source', '')
-                    if contract_source:
-                        business_functions = ['stake', 'yield', 'lend', 'borrow', 'swap', 'govern']
-                        func_count = sum(1 for func in business_functions if func in contract_source.lower())
-                        if func_count >= 2:
-                            score -= 1  # Lower risk for complex business model
-                except:
-                    pass
+                if onchain.get('contract_source'):
+                    func_count = len(view.contract_patterns & BUSINESS_FUNCS)
+                    if func_count >= 2:
+                        score -= 1  # Lower risk for complex business model
                 
                 # Use market cap as business model indicator
-                try:
-                    market_cap = project_data.get('market_data', {}).get('market_cap', {}).get('usd', 0)
+                market_cap = view.market_cap_or_zero
+                if market_cap is not None:
                     if market_cap > 10_000_000:
                         score -= 1  # Lower risk for established business model
                     elif market_cap < 100_000:
                         score += 1  # Higher risk for unproven business model
-                except:
-                    pass
             
-            return max(1, min(10, score))
-        except Exception as e:
-            print(f"Error in business_model scoring: {e}")
-            return 7
+            return _clamp_score(score)
+        except Exception:
+            logger.exception("Error in business_model scoring")
+            return 7.0
     
     def score_global_reach(self, risk_report):
         """Enhanced score based on global reach and adoption (1-10)"""
@@ -4297,13 +4854,21 @@ class DeFiRiskAssessor:
             score = 5  # Base score
             data_found = False
             
+            # Shared report sections
+            cache = self._get_report_cache(risk_report)
+            view = cache.view
+            
             # Check exchange listings for global reach
-            project_data = risk_report.get('market', {}).get('coingecko', {})
-            tickers = project_data.get('tickers', [])
+            tickers = view.tickers
             
             if tickers:
-                # Count unique exchanges
-                unique_exchanges = len(set(ticker.get('market', {}).get('name', '') for ticker in tickers))
+                # Count unique exchanges, stopping at the top tier
+                exchanges = set()
+                for ticker in tickers:
+                    exchanges.add((ticker.get('market') or EMPTY).get('name', ''))
+                    if len(exchanges) >= 5:
+                        break
+                unique_exchanges = len(exchanges)
                 if unique_exchanges >= 5:
                     score -= 2  # Very high global reach
                     data_found = True
@@ -4318,47 +4883,35 @@ class DeFiRiskAssessor:
             # Alternative data sources when primary data is limited
             if not data_found:
                 # Use holder count as global reach indicator
-                try:
-                    holders = risk_report.get('onchain', {}).get('holders', {})
-                    if holders:
-                        total_holders = holders.get('total_holders', 0)
-                        if total_holders > 100000:
-                            score -= 2  # Very high global reach
-                        elif total_holders > 20000:
-                            score -= 1  # High global reach
-                        elif total_holders < 1000:
-                            score += 1  # Limited global reach
-                except:
-                    pass
+                if view.holders and view.holder_bucket is not None:
+                    score += HOLDER_DELTAS['global_reach'][view.holder_bucket][0]
                 
                 # Use trading volume as global reach indicator
-                try:
-                    volume_24h = project_data.get('market_data', {}).get('total_volume', {}).get('usd', 0)
+                volume_24h = view.volume_24h_or_zero
+                if volume_24h is not None:
                     if volume_24h > 5_000_000:
                         score -= 1  # Lower risk for high global trading
                     elif volume_24h < 10_000:
                         score += 1  # Higher risk for low global trading
-                except:
-                    pass
                 
                 # Use Moralis transfer data for global reach
-                try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    transfers = moralis_data.get('transfers', [])
-                    if transfers:
-                        # Check for diverse transfer patterns (indicates global usage)
-                        unique_addresses = len(set(t.get('from_address', '') for t in transfers))
-                        if unique_addresses > 50:
-                            score -= 1  # Lower risk for global usage
-                        elif unique_addresses < 10:
-                            score += 1  # Higher risk for limited usage
-                except:
-                    pass
-            
-            return max(1, min(10, score))
-        except Exception as e:
-            print(f"Error in global_reach scoring: {e}")
-            return 7
+                transfers = view.moralis_transfers
+                if transfers:
+                    # Check for diverse transfer patterns (indicates global usage);
+                    # fewer than 10 transfers cannot have 10 distinct senders
+                    if len(transfers) < 10:
+                        unique_addresses = 0
+                    else:
+                        unique_addresses = len({t.get('from_address', '') for t in transfers if isinstance(t, dict)})
+                    if unique_addresses > 50:
+                        score -= 1  # Lower risk for global usage
+                    elif unique_addresses < 10:
+                        score += 1  # Higher risk for limited usage
+            
+            return _clamp_score(score)
+        except Exception:
+            logger.exception("Error in global_reach scoring")
+            return 7.0
     
     def score_market_dynamics(self, risk_report):
         """Enhanced score based on market dynamics and volatility (1-10)"""
@@ -4366,120 +4919,180 @@ class DeFiRiskAssessor:
             score = 5  # Base score
             data_found = False
             
+            # Shared report sections
+            cache = self._get_report_cache(risk_report)
+            view = cache.view
+            
             # Check price volatility
-            project_data = risk_report.get('market', {}).get('coingecko', {})
-            try:
-                price_change_24h = project_data.get('market_data', {}).get('price_change_percentage_24h', 0)
-                if price_change_24h:
-                    if abs(price_change_24h) < 10:  # Low volatility
-                        score -= 1  # Lower risk for stable price
-                        data_found = True
-                    elif abs(price_change_24h) > 50:  # High volatility
-                        score += 2  # Higher risk for volatile price
-                    elif abs(price_change_24h) > 20:  # Moderate volatility
-                        score += 1  # Slightly higher risk
-            except:
-                pass
+            price_change_24h = view.price_change_24h
+            if price_change_24h:
+                # Stable prices lower the risk, moves above 20% / 50% raise it
+                delta, _, found = _market_dynamics_delta('volatility', abs(price_change_24h))
+                score += delta
+                data_found = data_found or found
             
             # Check market cap to volume ratio
-            try:
-                volume_24h = project_data.get('market_data', {}).get('total_volume', {}).get('usd', 0)
-                market_cap = project_data.get('market_data', {}).get('market_cap', {}).get('usd', 0)
-                
-                if volume_24h > 0 and market_cap > 0:
-                    volume_market_cap_ratio = volume_24h / market_cap
-                    if volume_market_cap_ratio > 0.5:  # Very high trading activity
-                        score += 1  # Higher risk for excessive trading
-                    elif volume_market_cap_ratio < 0.01:  # Very low trading activity
-                        score += 1  # Higher risk for low liquidity
-                    elif 0.01 <= volume_market_cap_ratio <= 0.1:  # Healthy trading activity
-                        score -= 1  # Lower risk for healthy dynamics
-                        data_found = True
-            except:
-                pass
+            volume_24h = view.volume_24h
+            market_cap = view.market_cap
+            if volume_24h is not None and market_cap is not None and volume_24h > 0 and market_cap > 0:
+                # Excessive or very thin trading raises the risk, 1-10% turnover is healthy
+                delta, _, found = _market_dynamics_delta('volume_ratio', volume_24h / market_cap)
+                score += delta
+                data_found = data_found or found
             
             # Alternative data sources when primary data is limited
             if not data_found:
                 # Use Moralis transfer data for market dynamics
-                try:
-                    moralis_data = risk_report.get('enhanced', {}).get('moralis', {})
-                    transfers = moralis_data.get('transfers', [])
-                    if transfers:
-                        # Check for transfer frequency (indicates market activity)
-                        if len(transfers) > 200:
-                            score += 1  # Higher risk for excessive activity
-                        elif len(transfers) < 10:
-                            score += 1  # Higher risk for low activity
-                        elif 20 <= len(transfers) <= 100:
-                            score -= 1  # Lower risk for healthy activity
-                except:
-                    pass
+                transfer_count = len(view.moralis_transfers)
+                if transfer_count:
+                    # Transfer frequency indicates market activity; 20-100 is healthy
+                    score += _market_dynamics_delta('transfer_count', transfer_count)[0]
                 
                 # Use liquidity for market dynamics
-                try:
-                    liquidity = risk_report.get('onchain', {}).get('liquidity', {}).get('total_liquidity_usd', 0)
-                    if liquidity > 10_000_000:
-                        score -= 1  # Lower risk for high liquidity
-                    elif liquidity < 100_000:
-                        score += 1  # Higher risk for low liquidity
-                except:
-                    pass
+                if view.liquidity_usd is not None:
+                    score += _ladder_delta(view.liquidity_usd, LIQUIDITY_LADDERS['market_dynamics'])[0]
                 
                 # Use holder distribution for market dynamics
-                try:
-                    holders = risk_report.get('onchain', {}).get('holders', {})
-                    if holders:
-                        top10_concentration = holders.get('top10_concentration', 100)
-                        if top10_concentration > 80:
-                            score += 1  # Higher risk for concentrated holdings
-                        elif top10_concentration < 30:
-                            score -= 1  # Lower risk for distributed holdings
-                except:
-                    pass
-            
-            return max(1, min(10, score))
-        except Exception as e:
-            print(f"Error in market_dynamics scoring: {e}")
-            return 7
+                top10_concentration = _number_or_none(view.top10_concentration)
+                if view.holders and top10_concentration is not None:
+                    # Concentrated holdings raise the risk, distributed ones lower it
+                    score += _market_dynamics_delta('top10_concentration', top10_concentration)[0]
+            
+            return _clamp_score(score)
+        except Exception:
+            logger.exception("Error in market_dynamics scoring")
+            return 7.0
 
 
 # --- Data Quality: Validate input addresses and check for duplicates ---
+def _read_token_rows(input_file):
+    """Return the CSV rows as dicts of strings, parsed by Arrow's C++ reader when it is installed"""
+    if PYARROW_AVAILABLE:
+        with open(input_file, 'r', newline='') as f:
+            header = next(csv.reader(f), [])
+        try:
+            # Every column as text, empty cells as '' - the same values csv.DictReader yields
+            table = pa_csv.read_csv(input_file, convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in header}, strings_can_be_null=False))
+            return table.to_pylist()
+        except pa.ArrowInvalid:
+            pass  # empty file or ragged rows; csv.DictReader is more lenient
+    with open(input_file, 'r') as f:
+        return list(csv.DictReader(f))
+
 def validate_tokens_csv(input_file):
-    seen = set()
+    # Lowercased address -> checksummed form (None if invalid); one Keccak hash per distinct address
+    checksummed = {}
     duplicates = []
     invalid = []
     tokens = []
-    with open(input_file, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            addr = row['address']
-            if not is_checksum_address(addr):
-                try:
-                    addr = to_checksum_address(addr)
-                except Exception:
-                    invalid.append(row['address'])
-            if addr.lower() in seen:
-                duplicates.append(addr)
-            seen.add(addr.lower())
-            tokens.append(row)
+    for row in _read_token_rows(input_file):
+        raw = row['address']
+        key = raw.lower()
+        if key in checksummed:
+            addr = checksummed[key]
+            if addr is None:
+                invalid.append(raw)
+            duplicates.append(addr or raw)
+        else:
+            # to_checksum_address returns an already-checksummed address unchanged,
+            # so the separate is_checksum_address check would only hash it twice
+            try:
+                checksummed[key] = to_checksum_address(raw)
+            except Exception:
+                checksummed[key] = None
+                invalid.append(raw)
+        tokens.append(row)
     if duplicates:
         print(f"Duplicate tokens found: {duplicates}")
         logging.warning(f"Duplicate tokens found: {duplicates}")
     if invalid:
         print(f"Invalid addresses found: {invalid}")
         logging.warning(f"Invalid addresses found: {invalid}")
-    return tokens
+    return tokens, len(duplicates)
+
+def write_json_report(path, data):
+    """Write data to path as indented JSON, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                                   | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them
+        else:
+            with open(path, 'wb') as f:
+                f.write(payload)
+            return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
 
 # --- Parallelized token processing ---
+def process_one_token(analyzer, token, token_index, total_tokens):
+    """Assess one tokens.csv row; returns (result, summary or None, used_fallback, has_api_error)"""
+    chain = token.get("chain", "eth").strip().lower()
+    address = token["address"].strip()
+    
+    logging.info(f"Processing {address} on {chain}")
+    
+    try:
+        result = analyzer.assess_token(
+            address, chain,
+            token_index=token_index,
+            total_tokens=total_tokens
+        )
+        # Bind the report sections once; a missing section fails here exactly as the summary would
+        details = result['details']
+        onchain = details['onchain']
+        
+        # Count fallback usage
+        holders_count = onchain.get('holders', {}).get('total_holders', 0)
+        liquidity = onchain.get('liquidity', 0)
+        used_fallback = holders_count == 0 or liquidity == 0
+        has_api_error = 'error' in details
+
+        # Build summary for this token
+        red_flags = onchain['red_flags']
+        market_data = details['market']['coingecko']['market_data']
+        summary = {
+            "token": address,
+            "chain": chain,
+            "symbol": analyzer.symbol_by_address.get(address.lower(), ''),
+            "risk_score": result['risk_score'],
+            "risk_category": result['risk_category'],
+            "red_flags": red_flags,
+            "is_stablecoin": details.get('is_stablecoin', False),
+            "eu_compliance_status": details.get('eu_compliance_status', 'Unknown'),
+            "key_metrics": {
+                "market_cap": market_data['market_cap'].get('usd', 0),
+                "volume_24h": market_data['total_volume'].get('usd', 0),
+                "holders": onchain['holders']['total_holders'],
+                "liquidity": onchain['liquidity']
+            },
+            "component_scores": result['component_scores']
+        }
+        print(f"  Score: {result['risk_score']} - {result['risk_category']}")
+        logging.info(f"  Score: {result['risk_score']} - {result['risk_category']}")
+        return result, summary, used_fallback, has_api_error
+    except Exception as e:
+        print(f"[process_token_batch] Error processing {address} on {chain}: {str(e)}")
+        logging.error(f"[process_token_batch] Error processing {address} on {chain}: {str(e)}")
+        error_result = {
+            "token": address,
+            "chain": chain,
+            "risk_score": 150,
+            "risk_category": "Extreme Risk",
+            "error": str(e)
+        }
+        return error_result, None, False, False
+
 def process_token_batch(input_file="tokens.csv", output_file="risk_report.csv", json_output_file="risk_report.json"):
     global progress_bar
-    tokens = validate_tokens_csv(input_file)
+    tokens, duplicate_count = validate_tokens_csv(input_file)
     analyzer = DeFiRiskAssessor()
     results = []
     summaries = []
     fallback_count = 0
     api_error_count = 0
-    counters_lock = threading.Lock()
     total = len(tokens)
     
     # Initialize the progress bar system
@@ -4493,73 +5106,29 @@ def process_token_batch(input_file="tokens.csv", output_file="risk_report.csv",
     
     print(f"Starting risk assessment for {total} tokens...")
     logging.info(f"Starting risk assessment for {total} tokens...")
-    def process_one(token, token_index, total_tokens):
-        nonlocal fallback_count, api_error_count
+    # One batched DeFiLlama price request per DEFILLAMA_PRICE_BATCH tokens; the per-token lookups
+    # (raw chain name in fetch_enhanced_data, DeFiLlama chain name in the market-data fallback) then hit the cache
+    price_pairs = []
+    for token in tokens:
         chain = token.get("chain", "eth").strip().lower()
         address = token["address"].strip()
-        
-        # Remove per-token progress bar update from here
-        logging.info(f"Processing {address} on {chain}")
-        
-        try:
-            result = analyzer.assess_token(
-                address, chain,
-                token_index=token_index,
-                total_tokens=total_tokens
-            )
-            # Count fallback usage
-            onchain_details = result.get('details', {}).get('onchain', {})
-            holders_count = onchain_details.get('holders', {}).get('total_holders', 0)
-            liquidity = onchain_details.get('liquidity', 0)
-            used_fallback = holders_count == 0 or liquidity == 0
-            has_api_error = 'error' in result.get('details', {})
-
-            # Build summary for this token
-            red_flags = result['details']['onchain']['red_flags']
-            summary = {
-                "token": address,
-                "chain": chain,
-                "symbol": analyzer.cmc_symbol_map.get(address.lower(), {}).get('symbol', ''),
-                "risk_score": result['risk_score'],
-                "risk_category": result['risk_category'],
-                "red_flags": red_flags,
-                "is_stablecoin": result['details'].get('is_stablecoin', False),
-                "eu_compliance_status": result['details'].get('eu_compliance_status', 'Unknown'),
-                "key_metrics": {
-                    "market_cap": result['details']['market']['coingecko']['market_data']['market_cap'].get('usd', 0),
-                    "volume_24h": result['details']['market']['coingecko']['market_data']['total_volume'].get('usd', 0),
-                    "holders": result['details']['onchain']['holders']['total_holders'],
-                    "liquidity": result['details']['onchain']['liquidity']
-                },
-                "component_scores": result['component_scores']
-            }
-            with counters_lock:
-                if used_fallback:
-                    fallback_count += 1
-                if has_api_error:
-                    api_error_count += 1
-                results.append(result)
-                summaries.append(summary)
-            print(f"  Score: {result['risk_score']} - {result['risk_category']}")
-            logging.info(f"  Score: {result['risk_score']} - {result['risk_category']}")
-        except Exception as e:
-            print(f"[process_token_batch] Error processing {address} on {chain}: {str(e)}")
-            logging.error(f"[process_token_batch] Error processing {address} on {chain}: {str(e)}")
-            with counters_lock:
-                results.append({
-                    "token": address,
-                    "chain": chain,
-                    "risk_score": 150,
-                    "risk_category": "Extreme Risk",
-                    "error": str(e)
-                })
+        price_pairs += [(chain, address), (_defillama_chain(chain), address)]
+    prefetch_defillama_prices(price_pairs)
     # Parallel execution
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {executor.submit(process_one, token, idx, total): (token, idx) for idx, token in enumerate(tokens)}
+    with ThreadPoolExecutor(max_workers=TOKEN_WORKERS) as executor:
+        futures = {executor.submit(process_one_token, analyzer, token, idx, total): (token, idx)
+                   for idx, token in enumerate(tokens)}
         completed = 0
         for future in as_completed(futures):
             completed += 1
             token, idx = futures[future]
+            # Workers only return their outcome; all aggregation happens here on the main thread
+            result, summary, used_fallback, has_api_error = future.result()
+            results.append(result)
+            if summary is not None:
+                summaries.append(summary)
+            fallback_count += used_fallback
+            api_error_count += has_api_error
             address = token["address"].strip()
             chain = token.get("chain", "eth").strip().lower()
             # Update progress bar with current token info (main thread, after token is truly done)
@@ -4572,12 +5141,10 @@ def process_token_batch(input_file="tokens.csv", output_file="risk_report.csv",
                     complete_phase_progress(f"Analysis complete for {address[:8]}...")
                 except Exception as e:
                     print(f"[ProgressBar] Error updating progress bar: {e}")
-                import time
-                time.sleep(0.3)  # Throttle updates to avoid browser/file conflicts
+                # No extra sleep here: the progress bar writes its HTML atomically and throttles itself
             elif progress_bar:
+                # ConsoleProgressBar only records this; its render thread redraws every update_interval
                 progress_bar.update(completed, f"Completed: {address} on {chain}")
-                import time
-                time.sleep(0.3)
     # Phase 3: Generate final reports (only after all tokens are processed)
     if PROGRESS_AVAILABLE:
         complete_phase_progress("Analysis complete")
@@ -4586,40 +5153,21 @@ def process_token_batch(input_file="tokens.csv", output_file="risk_report.csv",
     elif progress_bar:
         progress_bar.update(completed, "Generating final reports...")
     
-    # Save results (full details)
-    df = pd.DataFrame(results)
-    
-    # Reorder columns to move component_scores next to red_flags
-    if not df.empty:
-        # Get all column names
-        all_columns = list(df.columns)
-        
-        # Find positions of key columns
-        details_idx = None
-        component_scores_idx = None
-        
-        for i, col in enumerate(all_columns):
-            if col == 'details':
-                details_idx = i
-            elif col == 'component_scores':
-                component_scores_idx = i
-        
-        # If we found both, reorder to put component_scores next to details (which contains red_flags)
-        if details_idx is not None and component_scores_idx is not None:
-            # Remove component_scores from its current position
-            all_columns.pop(component_scores_idx)
-            # Insert it after details (which contains red_flags)
-            all_columns.insert(details_idx + 1, 'component_scores')
-            # Reorder the DataFrame
-            df = df[all_columns]
-    
-    df.to_csv(output_file, index=False)
+    # Save results (full details), streamed row by row. Columns follow first appearance across
+    # results, with component_scores moved next to details (which contains red_flags)
+    fieldnames = list(dict.fromkeys(key for result in results for key in result))
+    if 'details' in fieldnames and 'component_scores' in fieldnames:
+        fieldnames.remove('component_scores')
+        fieldnames.insert(fieldnames.index('details') + 1, 'component_scores')
+    with open(output_file, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(results)
     print(f"Report saved to {output_file}")
     logging.info(f"Report saved to {output_file}")
     
     # Save summary report (JSON)
-    with open(json_output_file, "w") as jf:
-        json.dump(summaries, jf, indent=2)
+    write_json_report(json_output_file, summaries)
     print(f"Summary report saved to {json_output_file}")
     logging.info(f"Summary report saved to {json_output_file}")
     
@@ -4629,7 +5177,6 @@ def process_token_batch(input_file="tokens.csv", output_file="risk_report.csv",
         f.write(f"Total tokens processed: {total}\n")
         f.write(f"Tokens using fallback data: {fallback_count}\n")
         f.write(f"Tokens with API errors: {api_error_count}\n")
-        duplicate_count = len(tokens) - len({t['address'].lower() for t in tokens})
         f.write(f"Duplicates found: {duplicate_count}\n")
     print("Summary report saved to risk_assessment_summary.txt")
     logging.info("Summary report saved to risk_assessment_summary.txt")
@@ -4643,21 +5190,22 @@ def process_token_batch(input_file="tokens.csv", output_file="risk_report.csv",
     if PROGRESS_AVAILABLE:
         complete_phase_progress("Reports generated successfully")
         finish_progress_bar("Risk assessment complete!")
-        import time
         time.sleep(2)  # Give browser time to refresh and show the final message
     elif progress_bar:
         progress_bar.finish("Risk assessment complete!")
-        import time
-        time.sleep(2)  # Give browser time to refresh and show the final message
     
-    # Wait for progress bar to close, then show completion dialog
-    import time
-    time.sleep(4)  # Wait for progress bar countdown to complete
+    # Printed before the dialog: it runs in the background, so its exit status is never seen here
+    print("✅ Risk assessment completed successfully!")
+    print(f"📊 Check the 'data/' directory for results")
+    print(f"📝 Check the 'logs/' directory for detailed logs")
     
-    # Show completion dialog with disclaimer
+    # Completion dialog (macOS only); fired in the background so the batch returns right away
+    if sys.platform != 'darwin':
+        return
     try:
-        import subprocess
+        # The dialog waits out the progress bar's closing countdown itself
         completion_script = f'''
+        delay 4
         tell application "System Events"
             display dialog "✅ Update Completed!
 
@@ -4676,12 +5224,10 @@ This tool provides automated risk assessment based on available data and should
 Market data provided by CoinGecko (https://www.coingecko.com)" with title "DeFi Risk Assessment - Complete" buttons {{"OK"}} default button "OK" with icon note
         end tell
         '''
-        subprocess.run(['osascript', '-e', completion_script], check=True)
+        subprocess.Popen(['osascript', '-e', completion_script], start_new_session=True,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     except Exception as e:
         print(f"Could not show completion dialog: {e}")
-        print("✅ Risk assessment completed successfully!")
-        print(f"📊 Check the 'data/' directory for results")
-        print(f"📝 Check the 'logs/' directory for detailed logs")
 
 # Update logging setup
 logging.basicConfig(filename=VERBOSE_LOG, level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
@@ -4695,348 +5241,218 @@ logging.basicConfig(filename=VERBOSE_LOG, level=logging.INFO, format='%(asctime)
 # ... existing code ...
 # In all places where 'fallbacks.json', 'cmc_symbol_map.json', 'tokens.csv', etc. are opened, replace with the corresponding variable.
 
-# --- Breadcrumbs API Integration ---
-_breadcrumbs_blocked = False
+# --- Shared GET + cache path for the provider helpers below ---
+# Services that answered 403 / a Cloudflare page; they are skipped for the rest of the run
+_blocked_services = set()
 
-def fetch_breadcrumbs_risk_score(address):
-    global _breadcrumbs_blocked
-    if _breadcrumbs_blocked:
-        return None
-    api_key = os.getenv("BREADCRUMBS_API_KEY")
-    if not api_key:
-        logging.warning("Breadcrumbs API key not set.")
-        return None
-    url = f"https://api.breadcrumbs.app/api/v1/addresses/{address}/risk-score"
-    headers = {"Authorization": f"Bearer {api_key}"}
+# Env vars already reported as missing; each is warned about once per run, not once per token
+_warned_missing_keys = set()
+
+def _api_key_or_warn(env_var, service):
+    """Return the API key in env_var, or None after warning (once per run) that it is not set"""
+    api_key = os.getenv(env_var)
+    if not api_key and env_var not in _warned_missing_keys:
+        _warned_missing_keys.add(env_var)
+        logging.warning(f"{service} API key not set.")
+    return api_key
+
+def _get_json(url, api_name, ttl, headers=None, blockable_service=None, decode=None):
+    """GET url through api_cache and return the decoded JSON, or None on any failure
+
+    With blockable_service set, a 403 or Cloudflare answer adds that service to _blocked_services.
+    With decode set, the response is streamed and decode(resp) replaces the full JSON decode.
+    """
     cache_key = get_cache_key(url, None, headers)
     cached = api_cache.get(cache_key)
     if cached:
         return cached
     try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        elif resp.status_code == 403 or ("cloudflare" in resp.text.lower()):
-            logging.warning("Breadcrumbs API blocked by Cloudflare or returned 403. Skipping Breadcrumbs for this run.")
-            _breadcrumbs_blocked = True
-            return None
-        else:
-            logging.warning(f"Breadcrumbs API error: {resp.status_code} {resp.text}")
+        # The with block releases the connection even when a streamed body is not read to the end
+        with _http_session.get(url, headers=headers, timeout=20, stream=decode is not None) as resp:
+            if resp.status_code == 200:
+                data = decode(resp) if decode else _response_json(resp)
+                api_cache.set(cache_key, data, expire=ttl)
+                return data
+            elif blockable_service and (resp.status_code == 403 or "cloudflare" in resp.text.lower()):
+                logging.warning(f"{api_name} API blocked by Cloudflare or returned 403. "
+                                f"Skipping {blockable_service} for this run.")
+                _blocked_services.add(blockable_service)
+            else:
+                logging.warning(f"{api_name} API error: {resp.status_code} {resp.text}")
     except Exception as e:
-        logging.error(f"Breadcrumbs API exception: {e}")
+        logging.error(f"{api_name} API exception: {e}")
     return None
 
+# --- Breadcrumbs API Integration ---
+@single_flight
+def fetch_breadcrumbs_risk_score(address):
+    if 'Breadcrumbs' in _blocked_services:
+        return None
+    api_key = _api_key_or_warn("BREADCRUMBS_API_KEY", "Breadcrumbs")
+    if not api_key:
+        return None
+    return _get_json(f"https://api.breadcrumbs.app/api/v1/addresses/{address}/risk-score", "Breadcrumbs",
+                     CACHE_TTL_METADATA, {"Authorization": f"Bearer {api_key}"}, blockable_service='Breadcrumbs')
+
+@single_flight
 def fetch_breadcrumbs_token_info(address):
-    global _breadcrumbs_blocked
-    if _breadcrumbs_blocked:
+    if 'Breadcrumbs' in _blocked_services:
         return None
-    api_key = os.getenv("BREADCRUMBS_API_KEY")
+    api_key = _api_key_or_warn("BREADCRUMBS_API_KEY", "Breadcrumbs")
     if not api_key:
-        logging.warning("Breadcrumbs API key not set.")
         return None
-    url = f"https://api.breadcrumbs.app/api/v1/tokens/{address}"
-    headers = {"Authorization": f"Bearer {api_key}"}
-    cache_key = get_cache_key(url, None, headers)
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-    try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        elif resp.status_code == 403 or ("cloudflare" in resp.text.lower()):
-            logging.warning("Breadcrumbs Token API blocked by Cloudflare or returned 403. Skipping Breadcrumbs for this run.")
-            _breadcrumbs_blocked = True
-            return None
-        else:
-            logging.warning(f"Breadcrumbs Token API error: {resp.status_code} {resp.text}")
-    except Exception as e:
-        logging.error(f"Breadcrumbs Token API exception: {e}")
-    return None
+    return _get_json(f"https://api.breadcrumbs.app/api/v1/tokens/{address}", "Breadcrumbs Token",
+                     CACHE_TTL_METADATA, {"Authorization": f"Bearer {api_key}"}, blockable_service='Breadcrumbs')
 
 # --- Ethplorer API Integration ---
+@single_flight
 def fetch_ethplorer_token_info(address):
     api_key = os.getenv("ETHPLORER_API_KEY", "freekey")
-    url = f"https://api.ethplorer.io/getTokenInfo/{address}?apiKey={api_key}"
-    cache_key = get_cache_key(url)
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-    try:
-        resp = requests.get(url, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        else:
-            logging.warning(f"Ethplorer API error: {resp.status_code} {resp.text}")
-    except Exception as e:
-        logging.error(f"Ethplorer API exception: {e}")
-    return None
+    return _get_json(f"https://api.ethplorer.io/getTokenInfo/{address}?apiKey={api_key}", "Ethplorer",
+                     CACHE_TTL_METADATA)
 
+@single_flight
 def fetch_ethplorer_address_info(address):
     api_key = os.getenv("ETHPLORER_API_KEY", "freekey")
-    url = f"https://api.ethplorer.io/getAddressInfo/{address}?apiKey={api_key}"
-    cache_key = get_cache_key(url)
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-    try:
-        resp = requests.get(url, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        else:
-            logging.warning(f"Ethplorer Address API error: {resp.status_code} {resp.text}")
-    except Exception as e:
-        logging.error(f"Ethplorer Address API exception: {e}")
-    return None
+    return _get_json(f"https://api.ethplorer.io/getAddressInfo/{address}?apiKey={api_key}", "Ethplorer Address",
+                     CACHE_TTL_METADATA)
 
 # --- Zapper API Integration ---
+@single_flight
 def fetch_zapper_portfolio_data(address):
     """Fetch portfolio data from Zapper API"""
-    api_key = os.getenv("ZAPPER_API_KEY")
+    api_key = _api_key_or_warn("ZAPPER_API_KEY", "Zapper")
     if not api_key:
-        logging.warning("Zapper API key not set.")
         return None
-    url = f"https://api.zapper.xyz/v2/portfolio/{address}"
-    headers = {"Authorization": f"Basic {api_key}"}
-    cache_key = get_cache_key(url, None, headers)
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-    try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        else:
-            logging.warning(f"Zapper API error: {resp.status_code} {resp.text}")
-    except Exception as e:
-        logging.error(f"Zapper API exception: {e}")
-    return None
+    return _get_json(f"https://api.zapper.xyz/v2/portfolio/{address}", "Zapper",
+                     CACHE_TTL_PRICE, {"Authorization": f"Basic {api_key}"})
 
+@single_flight
 def fetch_zapper_protocol_data(protocol):
     """Fetch protocol data from Zapper API"""
-    api_key = os.getenv("ZAPPER_API_KEY")
+    api_key = _api_key_or_warn("ZAPPER_API_KEY", "Zapper")
     if not api_key:
-        logging.warning("Zapper API key not set.")
         return None
-    url = f"https://api.zapper.xyz/v2/protocols/{protocol}"
-    headers = {"Authorization": f"Basic {api_key}"}
-    cache_key = get_cache_key(url, None, headers)
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-    try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        else:
-            logging.warning(f"Zapper Protocol API error: {resp.status_code} {resp.text}")
-    except Exception as e:
-        logging.error(f"Zapper Protocol API exception: {e}")
-    return None
+    return _get_json(f"https://api.zapper.xyz/v2/protocols/{protocol}", "Zapper Protocol",
+                     CACHE_TTL_METADATA, {"Authorization": f"Basic {api_key}"})
 
 # --- DeBank API Integration ---
+@single_flight
 def fetch_debank_portfolio(address):
     """Fetch portfolio data from DeBank API"""
-    api_key = os.getenv("DEBANK_API_KEY")
+    api_key = _api_key_or_warn("DEBANK_API_KEY", "DeBank")
     if not api_key:
-        logging.warning("DeBank API key not set.")
         return None
-    url = f"https://pro-openapi.debank.com/v1/user/portfolio_list?id={address}"
-    headers = {"AccessKey": api_key}
-    cache_key = get_cache_key(url, None, headers)
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-    try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        else:
-            logging.warning(f"DeBank API error: {resp.status_code} {resp.text}")
-    except Exception as e:
-        logging.error(f"DeBank API exception: {e}")
-    return None
+    return _get_json(f"https://pro-openapi.debank.com/v1/user/portfolio_list?id={address}", "DeBank",
+                     CACHE_TTL_PRICE, {"AccessKey": api_key})
 
+@single_flight
 def fetch_debank_token_list(chain_id):
     """Fetch token list from DeBank API"""
-    api_key = os.getenv("DEBANK_API_KEY")
+    api_key = _api_key_or_warn("DEBANK_API_KEY", "DeBank")
     if not api_key:
-        logging.warning("DeBank API key not set.")
         return None
-    url = f"https://pro-openapi.debank.com/v1/user/token_list?id={chain_id}"
-    headers = {"AccessKey": api_key}
-    cache_key = get_cache_key(url, None, headers)
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-    try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        else:
-            logging.warning(f"DeBank Token List API error: {resp.status_code} {resp.text}")
-    except Exception as e:
-        logging.error(f"DeBank Token List API exception: {e}")
-    return None
+    return _get_json(f"https://pro-openapi.debank.com/v1/user/token_list?id={chain_id}", "DeBank Token List",
+                     CACHE_TTL_METADATA, {"AccessKey": api_key})
 
 # --- DeFiLlama API Integration ---
+def _defillama_headers():
+    """Authorization header for DeFiLlama when a (optional) API key is configured"""
+    api_key = os.getenv("DEFILLAMA_API_KEY")
+    return {"Authorization": f"Bearer {api_key}"} if api_key else {}
+
+@single_flight
 def fetch_defillama_protocol_tvl(protocol):
     """Fetch protocol TVL data from DeFiLlama API"""
-    api_key = os.getenv("DEFILLAMA_API_KEY")
-    url = f"https://api.llama.fi/protocol/{protocol}"
-    headers = {}
-    if api_key:
-        headers["Authorization"] = f"Bearer {api_key}"
-    cache_key = get_cache_key(url, None, headers)
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-    try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        else:
-            logging.warning(f"DeFiLlama API error: {resp.status_code} {resp.text}")
-    except Exception as e:
-        logging.error(f"DeFiLlama API exception: {e}")
-    return None
+    return _get_json(f"https://api.llama.fi/protocol/{protocol}", "DeFiLlama",
+                     CACHE_TTL_PRICE, _defillama_headers())
 
+@single_flight
 def fetch_defillama_token_price(token_address, chain="ethereum"):
     """Fetch token price data from DeFiLlama API"""
-    api_key = os.getenv("DEFILLAMA_API_KEY")
-    url = f"https://coins.llama.fi/prices/current/{chain}:{token_address}"
-    headers = {}
-    if api_key:
-        headers["Authorization"] = f"Bearer {api_key}"
-    cache_key = get_cache_key(url, None, headers)
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-    try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        else:
-            logging.warning(f"DeFiLlama Token Price API error: {resp.status_code} {resp.text}")
-    except Exception as e:
-        logging.error(f"DeFiLlama Token Price API exception: {e}")
-    return None
+    return _get_json(f"https://coins.llama.fi/prices/current/{chain}:{token_address}", "DeFiLlama Token Price",
+                     CACHE_TTL_PRICE, _defillama_headers())
+
+def _defillama_chain(chain):
+    """Map an internal chain name to DeFiLlama's"""
+    return "bsc" if chain == "bsc" else "ethereum"
+
+DEFILLAMA_PRICE_BATCH = 100  # chain:address pairs per request; keeps the URL well under common length limits
 
+def prefetch_defillama_prices(pairs):
+    """Warm the fetch_defillama_token_price cache for (chain, address) pairs with batched requests"""
+    headers = _defillama_headers()
+    pending = []
+    for chain, address in dict.fromkeys(pairs):
+        url = f"https://coins.llama.fi/prices/current/{chain}:{address}"
+        if not api_cache.get(get_cache_key(url, None, headers)):
+            pending.append((chain, address, url))
+    for start in range(0, len(pending), DEFILLAMA_PRICE_BATCH):
+        batch = pending[start:start + DEFILLAMA_PRICE_BATCH]
+        joined = ",".join(f"{chain}:{address}" for chain, address, _ in batch)
+        try:
+            resp = _http_session.get(f"https://coins.llama.fi/prices/current/{joined}", headers=headers, timeout=20)
+            if resp.status_code != 200:
+                logging.warning(f"DeFiLlama batch price API error: {resp.status_code} {resp.text[:200]}")
+                continue
+            coins = _response_json(resp).get('coins', {})
+        except Exception as e:
+            logging.error(f"DeFiLlama batch price API exception: {e}")
+            continue
+        # Store each coin exactly as the single-token endpoint would have answered ({"coins": {}} if unknown)
+        by_key = {key.lower(): (key, coin) for key, coin in coins.items()}
+        for chain, address, url in batch:
+            found = by_key.get(f"{chain}:{address}".lower())
+            api_cache.set(get_cache_key(url, None, headers), {'coins': dict([found]) if found else {}},
+                          expire=CACHE_TTL_PRICE)
+
+# Per-pool fields kept from yields.llama.fi/pools (the full list is several MB)
+YIELD_POOL_FIELDS = ('pool', 'chain', 'project', 'symbol', 'tvlUsd', 'apy')
+
+def _decode_yield_pools(resp):
+    """Decode a streamed yields.llama.fi/pools response into {'data': [pool]} keeping YIELD_POOL_FIELDS"""
+    if IJSON_AVAILABLE:
+        resp.raw.decode_content = True
+        pools = ijson.items(resp.raw, 'data.item', use_float=True)
+    else:
+        pools = _response_json(resp).get('data') or []
+    return {'data': [{field: pool.get(field) for field in YIELD_POOL_FIELDS} for pool in pools]}
+
+@single_flight
 def fetch_defillama_yield_pools(protocol):
     """Fetch yield pool data from DeFiLlama API"""
-    api_key = os.getenv("DEFILLAMA_API_KEY")
-    url = f"https://yields.llama.fi/pools?protocol={protocol}"
-    headers = {}
-    if api_key:
-        headers["Authorization"] = f"Bearer {api_key}"
-    cache_key = get_cache_key(url, None, headers)
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-    try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        else:
-            logging.warning(f"DeFiLlama Yield API error: {resp.status_code} {resp.text}")
-    except Exception as e:
-        logging.error(f"DeFiLlama Yield API exception: {e}")
-    return None
+    return _get_json(f"https://yields.llama.fi/pools?protocol={protocol}", "DeFiLlama Yield",
+                     CACHE_TTL_PRICE, _defillama_headers(), decode=_decode_yield_pools)
 
 # --- Moralis API Integration ---
+MORALIS_ERC20_URL = "https://deep-index.moralis.io/api/v2/erc20"
+
+@single_flight
 def fetch_moralis_token_metadata(address, chain="eth"):
     """Fetch token metadata from Moralis API"""
-    api_key = os.getenv("MORALIS_API_KEY")
+    api_key = _api_key_or_warn("MORALIS_API_KEY", "Moralis")
     if not api_key:
-        logging.warning("Moralis API key not set.")
         return None
-    url = f"https://deep-index.moralis.io/api/v2/erc20/{address}?chain={chain}"
-    headers = {"X-API-Key": api_key}
-    cache_key = get_cache_key(url, None, headers)
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-    try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        else:
-            logging.warning(f"Moralis Token Metadata API error: {resp.status_code} {resp.text}")
-    except Exception as e:
-        logging.error(f"Moralis Token Metadata API exception: {e}")
-    return None
+    return _get_json(f"{MORALIS_ERC20_URL}/{address}?chain={chain}", "Moralis Token Metadata",
+                     CACHE_TTL_METADATA, {"X-API-Key": api_key})
 
+@single_flight
 def fetch_moralis_token_price(address, chain="eth"):
     """Fetch token price from Moralis API"""
-    api_key = os.getenv("MORALIS_API_KEY")
+    api_key = _api_key_or_warn("MORALIS_API_KEY", "Moralis")
     if not api_key:
-        logging.warning("Moralis API key not set.")
         return None
-    url = f"https://deep-index.moralis.io/api/v2/erc20/{address}/price?chain={chain}"
-    headers = {"X-API-Key": api_key}
-    cache_key = get_cache_key(url, None, headers)
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-    try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        else:
-            logging.warning(f"Moralis Token Price API error: {resp.status_code} {resp.text}")
-    except Exception as e:
-        logging.error(f"Moralis Token Price API exception: {e}")
-    return None
+    return _get_json(f"{MORALIS_ERC20_URL}/{address}/price?chain={chain}", "Moralis Token Price",
+                     CACHE_TTL_PRICE, {"X-API-Key": api_key})
 
+@single_flight
 def fetch_moralis_token_transfers(address, chain="eth", limit=100):
     """Fetch token transfers from Moralis API"""
-    api_key = os.getenv("MORALIS_API_KEY")
+    api_key = _api_key_or_warn("MORALIS_API_KEY", "Moralis")
     if not api_key:
-        logging.warning("Moralis API key not set.")
         return None
-    url = f"https://deep-index.moralis.io/api/v2/erc20/{address}/transfers?chain={chain}&limit={limit}"
-    headers = {"X-API-Key": api_key}
-    cache_key = get_cache_key(url, None, headers)
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-    try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            data = resp.json()
-            api_cache.set(cache_key, data)
-            return data
-        else:
-            logging.warning(f"Moralis Token Transfers API error: {resp.status_code} {resp.text}")
-    except Exception as e:
-        logging.error(f"Moralis Token Transfers API exception: {e}")
-    return None
+    return _get_json(f"{MORALIS_ERC20_URL}/{address}/transfers?chain={chain}&limit={limit}", "Moralis Token Transfers",
+                     CACHE_TTL_PRICE, {"X-API-Key": api_key})
 
 # Import the working progress bar system
 try:
@@ -5059,47 +5475,64 @@ class ConsoleProgressBar:
         self.total_items = total_items
         self.description = description
         self.completed = 0
-        self.lock = threading.Lock()
-        self.start_time = time.time()
-        self.last_update = 0
+        self._counter = count(1)  # Implicit increments; see update() for why there is no lock
+        self._message = ""
+        self._drawn = None  # (completed, message) of the last frame written
+        self.start_time = time.monotonic()
         self.update_interval = 0.5  # Update every 0.5 seconds
+        # Workers only record progress; a single render thread does all terminal writes
+        self._done = threading.Event()
+        self._render_thread = threading.Thread(target=self._render_loop, name='console-progress', daemon=True)
+        self._render_thread.start()
         
     def update(self, completed=None, message=""):
-        with self.lock:
-            if completed is not None:
-                self.completed = completed
-            else:
-                self.completed += 1
-                
-            now = time.time()
-            if now - self.last_update < self.update_interval and self.completed < self.total_items:
-                return  # Skip update if too soon and not final
-            self.last_update = now
-            
-            percent = int((self.completed / self.total_items) * 100)
-            elapsed = now - self.start_time
-            
-            # Calculate ETA
-            if self.completed > 0:
-                eta = (elapsed / self.completed) * (self.total_items - self.completed)
-                eta_str = f"ETA: {eta:.1f}s"
-            else:
-                eta_str = "ETA: --"
-            
-            # Create progress bar
-            bar_length = 30
-            filled_length = int(bar_length * self.completed // self.total_items)
-            bar = '█' * filled_length + '-' * (bar_length - filled_length)
-            
-            # Clear line and print progress
-            sys.stdout.write(f'\r{self.description}: [{bar}] {percent}% ({self.completed}/{self.total_items}) {eta_str} {message}')
-            sys.stdout.flush()
-            
-            if self.completed >= self.total_items:
-                print()  # New line when complete
+        """Record progress; the render thread draws it on its next tick"""
+        if completed is not None:
+            self.completed = completed
+            self._counter = count(completed + 1)
+        else:
+            # Not thread-safe: only the main thread calls update(), the render thread just reads the fields
+            self.completed = next(self._counter)
+        self._message = message
+    
+    def _render_loop(self):
+        while not self._done.wait(self.update_interval):
+            self._draw()
+    
+    def _draw(self):
+        """Render the current state unless it is the frame already on screen"""
+        frame = (self.completed, self._message)
+        if frame != self._drawn:
+            self._drawn = frame
+            self._render(frame[0], time.monotonic(), frame[1])
+    
+    def _render(self, completed, now, message):
+        """Write one progress line for completed items"""
+        percent = int((completed / self.total_items) * 100)
+        elapsed = now - self.start_time
+        
+        # Calculate ETA
+        if completed > 0:
+            eta = (elapsed / completed) * (self.total_items - completed)
+            eta_str = f"ETA: {eta:.1f}s"
+        else:
+            eta_str = "ETA: --"
+        
+        # Create progress bar
+        bar_length = 30
+        filled_length = int(bar_length * completed // self.total_items)
+        bar = '█' * filled_length + '-' * (bar_length - filled_length)
+        
+        # Clear line and print progress as one write (new line when complete)
+        end = '\n' if completed >= self.total_items else ''
+        sys.stdout.write(f'\r{self.description}: [{bar}] {percent}% ({completed}/{self.total_items}) {eta_str} {message}{end}')
+        sys.stdout.flush()
     
     def finish(self, message="Complete!"):
+        self._done.set()
+        self._render_thread.join()
         self.update(self.total_items, message)
+        self._draw()
         print()
 
 # Global progress bar instance
@@ -5118,141 +5551,133 @@ def update_progress_bar(percent, message):
         completed = int((percent / 100) * progress_bar.total_items)
         progress_bar.update(completed, message)
 
+def _sorted_json_bytes(value):
+    """Serialize value to JSON bytes with sorted keys, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass  # non-str keys or exotic types; the stdlib encoder handles them
+    return json.dumps(value, sort_keys=True).encode()
+
 def get_cache_key(url, params=None, headers=None, data=None):
-    key = url
-    if params:
-        key += json.dumps(params, sort_keys=True)
-    if headers:
-        key += json.dumps(headers, sort_keys=True)
-    if data:
-        key += json.dumps(data, sort_keys=True)
-    return hashlib.sha256(key.encode()).hexdigest()
+    # Keys never leave the local cache, so a fast 128-bit BLAKE2 digest is enough (no need for SHA-256)
+    key = [url.encode()]
+    for tag, value in ((b'|p', params), (b'|h', headers), (b'|d', data)):
+        if value:
+            key.append(tag + _sorted_json_bytes(value))
+    return hashlib.blake2b(b''.join(key), digest_size=16).hexdigest()
 
-def fetch_1inch_quote(from_token_address, to_token_address, amount, chain_id=1):
-    """
-    Fetch a quote from the 1inch API for swapping from_token to to_token.
-    :param from_token_address: str, address of the token to swap from
-    :param to_token_address: str, address of the token to swap to
-    :param amount: int or str, amount in minimal units (wei for ETH, etc.)
-    :param chain_id: int, 1 for Ethereum mainnet, 56 for BSC, etc.
-    :return: dict, quote data
-    """
-    # Check if API key is available
-    api_key = os.getenv('1INCH_API_KEY')
-    if not api_key:
-        print("Warning: 1INCH_API_KEY not found. Skipping 1inch API calls.")
-        return {}
-    
-    url = f"https://api.1inch.dev/swap/v5.2/{chain_id}/quote"
-    params = {
-        "fromTokenAddress": from_token_address,
-        "toTokenAddress": to_token_address,
-        "amount": str(amount)
-    }
-    headers = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
-    try:
-        response = requests.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching 1inch quote: {e}")
-        return {}
+# --- Fetcher response cache ---
+# Module-level fetchers are called once per token with mostly the same arguments (chain-wide gas price,
+# shared token lists, provider verdicts); their results are cached in api_cache for a per-endpoint TTL
+PROVIDER_CACHE_TTL = 300  # seconds; AML verdicts change hourly at most
+SANCTIONS_CACHE_TTL = 86400  # sanctions/compliance listings change daily at most
+ONEINCH_PRICE_TTL = 60  # 1inch spot/gas prices and orderbook
+ONEINCH_WALLET_TTL = 300  # 1inch wallet balances/portfolio/history (independent of the token being assessed)
+_fetch_cache_stats = {'hits': 0, 'misses': 0}
+_fetch_cache_stats_lock = threading.Lock()
 
-if __name__ == "__main__":
-    # At the start of main execution (before processing tokens)
-    try:
-        process_token_batch(input_file=TOKENS_CSV, output_file=RISK_REPORT_CSV, json_output_file=RISK_REPORT_JSON)
-    finally:
-        # Close progress bar and cleanup
-        if PROGRESS_AVAILABLE:
-            close_progress_bar()
-        time.sleep(0.5)
-        api_cache.close()
+def ttl_cached(ttl):
+    """Cache a fetch_X(*args) result in api_cache for ttl seconds; empty results are not stored"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            parts = [str(a).lower() for a in args] + [f"{k}={str(v).lower()}" for k, v in sorted(kwargs.items())]
+            cache_key = f"{func.__name__}_{'_'.join(parts)}"
+            cached = api_cache.get(cache_key)
+            with _fetch_cache_stats_lock:
+                _fetch_cache_stats['hits' if cached is not None else 'misses'] += 1
+            if cached is not None:
+                return cached
+            result = func(*args, **kwargs)
+            if result:
+                api_cache.set(cache_key, result, expire=ttl)
+            return result
+        return wrapper
+    return decorator
+
+provider_cached = ttl_cached(PROVIDER_CACHE_TTL)
 
 # --- 1inch API Integration ---
 
 ONEINCH_BASE = "https://api.1inch.dev"
+# api.1inch.dev speaks HTTP/2: with httpx the concurrent endpoint calls share one multiplexed connection
+if HTTPX_AVAILABLE:
+    _oneinch_client = httpx.Client(http2=True, timeout=20.0, headers={'Accept': 'application/json'},
+                                   limits=httpx.Limits(max_connections=HOST_LIMITS['api.1inch.dev'],
+                                                       max_keepalive_connections=HOST_LIMITS['api.1inch.dev']))
+else:
+    _oneinch_client = _http_session
 
-# 1. Token Metadata
-
-def fetch_1inch_token_metadata(token_address, chain_id=1):
-    # Check if API key is available
+def _oneinch_get(path, what, params=None):
+    """GET ONEINCH_BASE + path with the 1inch key and return the JSON; {} without a key or on failure"""
     api_key = os.getenv('1INCH_API_KEY')
     if not api_key:
         return {}
-    
-    url = f"{ONEINCH_BASE}/token/v1.2/{chain_id}/tokens"
-    headers = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
+    url = ONEINCH_BASE + path
     try:
-        response = requests.get(url, headers=headers)
+        if HTTPX_AVAILABLE:
+            # The requests session paces and caps each host in HostLimitedAdapter; the httpx client does it here
+            _wait_for_host_rate(url)
+            with _host_semaphore(url):
+                response = _oneinch_client.get(url, params=params, headers=_bearer_headers(api_key), timeout=20)
+        else:
+            response = _oneinch_client.get(url, params=params, headers=_bearer_headers(api_key), timeout=20)
         response.raise_for_status()
-        tokens = response.json().get("tokens", {})
-        return tokens.get(token_address.lower())
+        return _response_json(response)
     except Exception as e:
-        print(f"Error fetching 1inch token metadata: {e}")
+        print(f"Error fetching 1inch {what}: {e}")
         return {}
 
+# 1. Token Metadata
+
+# The /tokens endpoint returns the whole (multi-MB) token list for a chain; it is downloaded once per
+# chain_id and every per-token lookup is served from memory
+_oneinch_tokens = {}
+
+@single_flight
+def _oneinch_token_list(chain_id):
+    """Return the 1inch {address: metadata} token list for chain_id (fetched on first use), or None on failure"""
+    # single_flight makes concurrent callers for the same chain wait for one download, without
+    # holding up lookups on other chains
+    tokens = _oneinch_tokens.get(chain_id)
+    if tokens is None:
+        data = _oneinch_get(f"/token/v1.2/{chain_id}/tokens", "token metadata")
+        if not data:
+            return None
+        tokens = _oneinch_tokens[chain_id] = data.get("tokens", {})
+    return tokens
+
+@single_flight
+@ttl_cached(CACHE_TTL_METADATA)
+def fetch_1inch_token_metadata(token_address, chain_id=1):
+    tokens = _oneinch_token_list(chain_id)
+    if tokens is None:
+        # The bulk list could not be loaded; ask the per-address endpoint for just this token
+        return _oneinch_get(f"/token/v1.2/{chain_id}/custom/{token_address}", "token metadata")
+    return tokens.get(token_address.lower())
+
 # 2. Spot Price
 
+@single_flight
+@ttl_cached(ONEINCH_PRICE_TTL)
 def fetch_1inch_spot_price(token_address, chain_id=1):
-    # Check if API key is available
-    api_key = os.getenv('1INCH_API_KEY')
-    if not api_key:
-        return {}
-    
-    url = f"{ONEINCH_BASE}/spot-price/v1.0/{chain_id}/tokens/{token_address}"
-    headers = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching 1inch spot price: {e}")
-        return {}
+    return _oneinch_get(f"/spot-price/v1.0/{chain_id}/tokens/{token_address}", "spot price")
+
+# 3. Swap Quote
 
-# 3. Swap Quote (already present, but refactored for consistency)
 def fetch_1inch_quote(from_token_address, to_token_address, amount, chain_id=1):
-    # Check if API key is available
-    api_key = os.getenv('1INCH_API_KEY')
-    if not api_key:
-        return {}
-    
-    url = f"{ONEINCH_BASE}/swap/v5.2/{chain_id}/quote"
     params = {
         "fromTokenAddress": from_token_address,
         "toTokenAddress": to_token_address,
         "amount": str(amount)
     }
-    headers = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
-    try:
-        response = requests.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching 1inch quote: {e}")
-        return {}
+    return _oneinch_get(f"/swap/v5.2/{chain_id}/quote", "quote", params)
 
 # 4. Swap Route
 
 def fetch_1inch_swap(from_token_address, to_token_address, amount, wallet_address, chain_id=1, slippage=1):
-    # Check if API key is available
-    api_key = os.getenv('1INCH_API_KEY')
-    if not api_key:
-        return {}
-    
-    url = f"{ONEINCH_BASE}/swap/v5.2/{chain_id}/swap"
     params = {
         "fromTokenAddress": from_token_address,
         "toTokenAddress": to_token_address,
@@ -5260,181 +5685,91 @@ def fetch_1inch_swap(from_token_address, to_token_address, amount, wallet_addres
         "fromAddress": wallet_address,
         "slippage": slippage
     }
-    headers = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
-    try:
-        response = requests.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching 1inch swap: {e}")
-        return {}
+    return _oneinch_get(f"/swap/v5.2/{chain_id}/swap", "swap", params)
 
 # 5. Wallet Balances
 
+@single_flight
+@ttl_cached(ONEINCH_WALLET_TTL)
 def fetch_1inch_balances(wallet_address, chain_id=1):
-    # Check if API key is available
-    api_key = os.getenv('1INCH_API_KEY')
-    if not api_key:
-        return {}
-    
-    url = f"{ONEINCH_BASE}/balance/v1.2/{chain_id}/balances/{wallet_address}"
-    headers = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching 1inch balances: {e}")
-        return {}
+    return _oneinch_get(f"/balance/v1.2/{chain_id}/balances/{wallet_address}", "balances")
 
 # 6. Gas Price
 
+@single_flight
+@ttl_cached(ONEINCH_PRICE_TTL)
 def fetch_1inch_gas_price(chain_id=1):
-    # Check if API key is available
-    api_key = os.getenv('1INCH_API_KEY')
-    if not api_key:
-        return {}
-    
-    url = f"{ONEINCH_BASE}/gas-price/v1.4/{chain_id}"
-    headers = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching 1inch gas price: {e}")
-        return {}
+    return _oneinch_get(f"/gas-price/v1.4/{chain_id}", "gas price")
 
 # 7. Orderbook
 
+@single_flight
+@ttl_cached(ONEINCH_PRICE_TTL)
 def fetch_1inch_orderbook(chain_id=1):
-    # Check if API key is available
-    api_key = os.getenv('1INCH_API_KEY')
-    if not api_key:
-        return {}
-    
-    url = f"{ONEINCH_BASE}/orderbook/v1.1/{chain_id}/orders"
-    headers = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching 1inch orderbook: {e}")
-        return {}
+    return _oneinch_get(f"/orderbook/v1.1/{chain_id}/orders", "orderbook")
 
 # 8. Portfolio
 
+@single_flight
+@ttl_cached(ONEINCH_WALLET_TTL)
 def fetch_1inch_portfolio(wallet_address, chain_id=1):
-    # Check if API key is available
-    api_key = os.getenv('1INCH_API_KEY')
-    if not api_key:
-        return {}
-    
-    url = f"{ONEINCH_BASE}/portfolio/v1.0/{chain_id}/portfolio/{wallet_address}"
-    headers = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching 1inch portfolio: {e}")
-        return {}
+    return _oneinch_get(f"/portfolio/v1.0/{chain_id}/portfolio/{wallet_address}", "portfolio")
 
 # 9. History
 
+@single_flight
+@ttl_cached(ONEINCH_WALLET_TTL)
 def fetch_1inch_history(wallet_address, chain_id=1):
-    # Check if API key is available
-    api_key = os.getenv('1INCH_API_KEY')
-    if not api_key:
-        return {}
-    
-    url = f"{ONEINCH_BASE}/history/v1.0/{chain_id}/history/{wallet_address}"
-    headers = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching 1inch history: {e}")
-        return {}
+    return _oneinch_get(f"/history/v1.0/{chain_id}/history/{wallet_address}", "history")
 
 # --- Enrichment function ---
+def _oneinch_calls(token_address, chain_id, wallet_address=None, to_token_address=None, amount=None):
+    """Return the {name: (func, *args)} 1inch endpoint calls that apply to the given arguments"""
+    calls = {
+        'token_metadata': (fetch_1inch_token_metadata, token_address, chain_id),
+        'spot_price': (fetch_1inch_spot_price, token_address, chain_id),
+    }
+    if to_token_address and amount:
+        calls['swap_quote'] = (fetch_1inch_quote, token_address, to_token_address, amount, chain_id)
+        if wallet_address:
+            calls['swap_route'] = (fetch_1inch_swap, token_address, to_token_address, amount, wallet_address, chain_id)
+    if wallet_address:
+        calls['balances'] = (fetch_1inch_balances, wallet_address, chain_id)
+        calls['portfolio'] = (fetch_1inch_portfolio, wallet_address, chain_id)
+        calls['history'] = (fetch_1inch_history, wallet_address, chain_id)
+    calls['gas_price'] = (fetch_1inch_gas_price, chain_id)
+    calls['orderbook'] = (fetch_1inch_orderbook, chain_id)
+    return calls
+
 def enrich_with_1inch_data(token_address, chain_id=1, wallet_address=None, to_token_address=None, amount=None):
     """
     Enrich a token's risk assessment with 1inch data. Optionally provide wallet_address, to_token_address, and amount for swap/portfolio endpoints.
     """
+    calls = _oneinch_calls(token_address, chain_id, wallet_address, to_token_address, amount)
+    if not _api_key_or_warn('1INCH_API_KEY', '1inch'):
+        # Every endpoint answers {} without a key; skip the provider pool round-trip
+        return {name: {} for name in calls}
+    # The endpoints are independent, so they run concurrently on the provider pool
+    futures = submit_provider_calls(calls)
     data = {}
-    try:
-        data['token_metadata'] = fetch_1inch_token_metadata(token_address, chain_id)
-    except Exception as e:
-        data['token_metadata'] = f"Error: {e}"
-    try:
-        data['spot_price'] = fetch_1inch_spot_price(token_address, chain_id)
-    except Exception as e:
-        data['spot_price'] = f"Error: {e}"
-    if to_token_address and amount:
-        try:
-            data['swap_quote'] = fetch_1inch_quote(token_address, to_token_address, amount, chain_id)
-        except Exception as e:
-            data['swap_quote'] = f"Error: {e}"
-        if wallet_address:
-            try:
-                data['swap_route'] = fetch_1inch_swap(token_address, to_token_address, amount, wallet_address, chain_id)
-            except Exception as e:
-                data['swap_route'] = f"Error: {e}"
-    if wallet_address:
+    for name, future in futures.items():
         try:
-            data['balances'] = fetch_1inch_balances(wallet_address, chain_id)
+            data[name] = future.result()
         except Exception as e:
-            data['balances'] = f"Error: {e}"
-        try:
-            data['portfolio'] = fetch_1inch_portfolio(wallet_address, chain_id)
-        except Exception as e:
-            data['portfolio'] = f"Error: {e}"
-        try:
-            data['history'] = fetch_1inch_history(wallet_address, chain_id)
-        except Exception as e:
-            data['history'] = f"Error: {e}"
-    try:
-        data['gas_price'] = fetch_1inch_gas_price(chain_id)
-    except Exception as e:
-        data['gas_price'] = f"Error: {e}"
-    try:
-        data['orderbook'] = fetch_1inch_orderbook(chain_id)
-    except Exception as e:
-        data['orderbook'] = f"Error: {e}"
+            data[name] = f"Error: {e}"
     return data
 
+@single_flight
+@provider_cached
 def fetch_scorechain_aml(token_address, chain):
     """Fetch AML risk data from Scorechain API"""
-    import os, requests
     api_key = os.getenv("SCORECHAIN_API_KEY")
     if not api_key:
         raise Exception("Missing SCORECHAIN_API_KEY")
     url = f"https://api.scorechain.com/v1/aml/{chain}/address/{token_address}"
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = requests.get(url, headers=headers, timeout=20)
+    resp = _http_session.get(url, headers=_bearer_headers(api_key), timeout=20)
     resp.raise_for_status()
-    data = resp.json()
+    data = _response_json(resp)
     risk_level = data.get('riskLevel', 'unknown')
     if risk_level == 'high':
         return {"summary": "High AML risk", "score_delta": 3}
@@ -5445,17 +5780,17 @@ def fetch_scorechain_aml(token_address, chain):
     else:
         return {"summary": "Unknown AML risk", "score_delta": 0}
 
+@single_flight
+@provider_cached
 def fetch_trmlabs_aml(token_address, chain):
     """Fetch AML risk data from TRM Labs API"""
-    import os, requests
     api_key = os.getenv("TRMLABS_API_KEY")
     if not api_key:
         raise Exception("Missing TRMLABS_API_KEY")
     url = f"https://api.trmlabs.com/v1/addresses/{token_address}/risk"
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = requests.get(url, headers=headers, timeout=20)
+    resp = _http_session.get(url, headers=_bearer_headers(api_key), timeout=20)
     resp.raise_for_status()
-    data = resp.json()
+    data = _response_json(resp)
     risk_score = data.get('riskScore', 0)
     if risk_score >= 80:
         return {"summary": f"TRM risk score {risk_score} (high)", "score_delta": 3}
@@ -5466,62 +5801,63 @@ def fetch_trmlabs_aml(token_address, chain):
     else:
         return {"summary": "No TRM risk data", "score_delta": 0}
 
+@single_flight
+@ttl_cached(SANCTIONS_CACHE_TTL)
 def fetch_opensanctions_compliance(token_address, chain):
     """Fetch compliance data from OpenSanctions API"""
-    import os, requests
     api_key = os.getenv("OPENSANCTIONS_API_KEY")
     if not api_key:
         raise Exception("Missing OPENSANCTIONS_API_KEY")
     url = f"https://api.opensanctions.org/v1/entities/{token_address}"
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = requests.get(url, headers=headers, timeout=20)
+    resp = _http_session.get(url, headers=_bearer_headers(api_key), timeout=20)
     resp.raise_for_status()
-    data = resp.json()
+    data = _response_json(resp)
     # Example logic
     if data.get('sanctioned', False):
         return {"summary": "Sanctioned entity", "score_delta": 3}
     else:
         return {"summary": "Not sanctioned", "score_delta": -1}
 
+@single_flight
+@ttl_cached(SANCTIONS_CACHE_TTL)
 def fetch_lukka_compliance(token_address, chain):
     """Fetch compliance data from Lukka API"""
-    import os, requests
     api_key = os.getenv("LUKKA_API_KEY")
     if not api_key:
         raise Exception("Missing LUKKA_API_KEY")
     url = f"https://api.lukka.tech/v1/compliance/{chain}/address/{token_address}"
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = requests.get(url, headers=headers, timeout=20)
+    resp = _http_session.get(url, headers=_bearer_headers(api_key), timeout=20)
     resp.raise_for_status()
-    data = resp.json()
+    data = _response_json(resp)
     # Example logic
     if data.get('compliant', False):
         return {"summary": "Lukka compliant", "score_delta": -2}
     else:
         return {"summary": "Lukka non-compliant", "score_delta": 2}
 
+@single_flight
+@provider_cached
 def fetch_alchemy_compliance(token_address, chain):
     """Fetch compliance data from Alchemy API"""
-    import os, requests
     api_key = os.getenv("ALCHEMY_API_KEY")
     if not api_key:
         raise Exception("Missing ALCHEMY_API_KEY")
     url = f"https://dashboard.alchemyapi.io/api/compliance/{chain}/address/{token_address}"
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = requests.get(url, headers=headers, timeout=20)
+    resp = _http_session.get(url, headers=_bearer_headers(api_key), timeout=20)
     resp.raise_for_status()
-    data = resp.json()
+    data = _response_json(resp)
     # Example logic
     if data.get('complianceStatus', '') == 'compliant':
         return {"summary": "Alchemy compliant", "score_delta": -2}
     else:
         return {"summary": "Alchemy non-compliant", "score_delta": 2}
 
+@single_flight
+@provider_cached
 def fetch_defisafety_compliance(token_address, chain):
     """Fetch compliance data from DeFiSafety (web scraping or API)"""
-    import requests
     url = f"https://www.defisafety.com/app/project/{token_address}"
-    resp = requests.get(url, timeout=20)
+    resp = _http_session.get(url, headers={'Accept': '*/*'}, timeout=20)
     if resp.status_code == 200 and 'score' in resp.text:
         # Example: parse score from HTML (real logic may require BeautifulSoup)
         score = 80  # Placeholder
@@ -5545,181 +5881,148 @@ def get_coingecko_base_and_headers():
     else:
         return 'https://api.coingecko.com/api/v3', {}
 
+# --- Multi-endpoint probes (fetch_*_all) ---
+# The endpoints probed by each fetch_*_all are independent, so they run concurrently on the provider pool
+def _probe_json(label, method, url, request_kwargs=EMPTY, ttl=0, decode=None):
+    """Request url, print a ✓/✗ line for label, and return the decoded JSON or None
+
+    With ttl set, a successful (HTTP 200) result is kept in api_cache and reused for ttl seconds.
+    With decode set, the response is streamed and decode(resp) replaces the full JSON decode.
+    """
+    cache_key = None
+    if ttl:
+        headers = request_kwargs.get('headers')
+        cache_key = get_cache_key(f"{method} {url}", request_kwargs.get('params'),
+                                  dict(headers) if headers else None, request_kwargs.get('json'))
+        cached = api_cache.get(cache_key)
+        if cached is not None:
+            print(f"✓ {label}: Success (cached)")
+            return cached
+    try:
+        with _http_session.request(method, url, timeout=20, stream=decode is not None, **request_kwargs) as resp:
+            if resp.status_code == 200:
+                data = decode(resp) if decode else _response_json(resp)
+                print(f"✓ {label}: Success")
+                if cache_key is not None:
+                    api_cache.set(cache_key, data, expire=ttl)
+                return data
+            print(f"✗ {label}: {resp.text[:100]}")
+    except Exception as e:
+        print(f"✗ {label} error: {e}")
+    return None
+
+def _gather_probes(calls):
+    """Run {key: (func, *args)} probes concurrently and return {key: result} for those that returned a value"""
+    results = {}
+    for key, future in submit_provider_calls(calls).items():
+        value = future.result()
+        if value is not None:
+            results[key] = value
+    return results
+
 # --- Enhanced Etherscan Integration ---
 def fetch_etherscan_all(token_address, etherscan_key, chain='eth'):
     """Try all relevant Etherscan endpoints for contract verification, token info, supply, holders, etc."""
-    results = {}
     scan_urls = {
         'eth': 'https://api.etherscan.io/api',
         'bsc': 'https://api.bscscan.com/api',
         'polygon': 'https://api.polygonscan.com/api',
     }
     scan_url = scan_urls.get(chain, scan_urls['eth'])
+    def scan_json(params):
+        """GET scan_url with params plus the API key; return the response and its JSON (None unless HTTP 200)"""
+        resp = _http_session.get(scan_url, params={**params, 'apikey': etherscan_key}, timeout=20)
+        return resp, (_response_json(resp) if resp.status_code == 200 else None)
     # 1. Contract verification
-    try:
-        params = {'module': 'contract', 'action': 'getabi', 'address': token_address, 'apikey': etherscan_key}
-        resp = requests.get(scan_url, params=params, timeout=20)
-        if resp.status_code == 200 and resp.json().get('status') == '1':
-            results['is_verified'] = True
-            print(f"✓ Etherscan getabi: Contract verified")
-        else:
-            results['is_verified'] = False
+    def is_verified():
+        try:
+            resp, data = scan_json({'module': 'contract', 'action': 'getabi', 'address': token_address})
+            if data is not None and data.get('status') == '1':
+                print(f"✓ Etherscan getabi: Contract verified")
+                return True
             print(f"✗ Etherscan getabi: Not verified or error")
-    except Exception as e:
-        print(f"✗ Etherscan getabi error: {e}")
+            return False
+        except Exception as e:
+            print(f"✗ Etherscan getabi error: {e}")
     # 2. Token info
-    try:
-        params = {'module': 'token', 'action': 'tokeninfo', 'contractaddress': token_address, 'apikey': etherscan_key}
-        resp = requests.get(scan_url, params=params, timeout=20)
-        if resp.status_code == 200 and resp.json().get('status') == '1':
-            results['tokeninfo'] = resp.json()['result'][0]
-            print(f"✓ Etherscan tokeninfo: Success")
-        else:
+    def tokeninfo():
+        try:
+            resp, data = scan_json({'module': 'token', 'action': 'tokeninfo', 'contractaddress': token_address})
+            if data is not None and data.get('status') == '1':
+                info = data['result'][0]
+                print(f"✓ Etherscan tokeninfo: Success")
+                return info
             print(f"✗ Etherscan tokeninfo: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Etherscan tokeninfo error: {e}")
+        except Exception as e:
+            print(f"✗ Etherscan tokeninfo error: {e}")
     # 3. Total supply
-    try:
-        params = {'module': 'proxy', 'action': 'eth_call', 'to': token_address, 'data': '0x18160ddd', 'apikey': etherscan_key}
-        resp = requests.get(scan_url, params=params, timeout=20)
-        if resp.status_code == 200 and resp.json().get('result'):
-            results['total_supply'] = int(resp.json()['result'], 16)
-            print(f"✓ Etherscan eth_call: totalSupply {results['total_supply']}")
-        else:
+    def total_supply():
+        try:
+            resp, data = scan_json({'module': 'proxy', 'action': 'eth_call', 'to': token_address, 'data': '0x18160ddd'})
+            if data is not None and data.get('result'):
+                supply = int(data['result'], 16)
+                print(f"✓ Etherscan eth_call: totalSupply {supply}")
+                return supply
             print(f"✗ Etherscan eth_call: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Etherscan eth_call error: {e}")
-    return results
+        except Exception as e:
+            print(f"✗ Etherscan eth_call error: {e}")
+    return _gather_probes({
+        'is_verified': (is_verified,),
+        'tokeninfo': (tokeninfo,),
+        'total_supply': (total_supply,),
+    })
 
 # --- Enhanced Ethplorer Integration ---
 def fetch_ethplorer_all(token_address, ethplorer_key):
     """Try all relevant Ethplorer endpoints for token info, bulk, and address info."""
-    results = {}
-    # 1. getTokenInfo
-    try:
-        url = f"https://api.ethplorer.io/getTokenInfo/{token_address}?apiKey={ethplorer_key}"
-        resp = requests.get(url, timeout=20)
-        if resp.status_code == 200:
-            results['getTokenInfo'] = resp.json()
-            print(f"✓ Ethplorer getTokenInfo: Success")
-        else:
-            print(f"✗ Ethplorer getTokenInfo: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Ethplorer getTokenInfo error: {e}")
-    # 2. bulkMonitor (single address)
-    try:
-        url = f"https://api.ethplorer.io/bulkMonitor?apiKey={ethplorer_key}"
-        resp = requests.post(url, json={"addresses": [token_address]}, timeout=20)
-        if resp.status_code == 200:
-            results['bulkMonitor'] = resp.json()
-            print(f"✓ Ethplorer bulkMonitor: Success")
-        else:
-            print(f"✗ Ethplorer bulkMonitor: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Ethplorer bulkMonitor error: {e}")
-    # 3. getAddressInfo
-    try:
-        url = f"https://api.ethplorer.io/getAddressInfo/{token_address}?apiKey={ethplorer_key}"
-        resp = requests.get(url, timeout=20)
-        if resp.status_code == 200:
-            results['getAddressInfo'] = resp.json()
-            print(f"✓ Ethplorer getAddressInfo: Success")
-        else:
-            print(f"✗ Ethplorer getAddressInfo: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Ethplorer getAddressInfo error: {e}")
-    return results
+    return _gather_probes({
+        # 1. getTokenInfo
+        'getTokenInfo': (_probe_json, "Ethplorer getTokenInfo", 'GET',
+                         f"https://api.ethplorer.io/getTokenInfo/{token_address}?apiKey={ethplorer_key}"),
+        # 2. bulkMonitor (single address)
+        'bulkMonitor': (_probe_json, "Ethplorer bulkMonitor", 'POST',
+                        f"https://api.ethplorer.io/bulkMonitor?apiKey={ethplorer_key}",
+                        {'json': {"addresses": [token_address]}}),
+        # 3. getAddressInfo
+        'getAddressInfo': (_probe_json, "Ethplorer getAddressInfo", 'GET',
+                           f"https://api.ethplorer.io/getAddressInfo/{token_address}?apiKey={ethplorer_key}"),
+    })
 
 # --- Enhanced 1inch Integration ---
 def fetch_1inch_all(token_address, chain_id=1, wallet_address=None, to_token_address=None, amount=None):
     """Try all relevant 1inch endpoints for token metadata, spot price, quote, swap, balances, gas price, orderbook, portfolio, history."""
-    api_key = os.getenv('1INCH_API_KEY')
-    if not api_key:
-        print("Warning: 1INCH_API_KEY not found. Skipping 1inch API calls.")
+    if not _api_key_or_warn('1INCH_API_KEY', '1inch'):
         return {}
+    futures = submit_provider_calls(_oneinch_calls(token_address, chain_id, wallet_address, to_token_address, amount))
     data = {}
-    try:
-        data['token_metadata'] = fetch_1inch_token_metadata(token_address, chain_id)
-        print("✓ 1inch token_metadata: Success")
-    except Exception as e:
-        print(f"✗ 1inch token_metadata error: {e}")
-    try:
-        data['spot_price'] = fetch_1inch_spot_price(token_address, chain_id)
-        print("✓ 1inch spot_price: Success")
-    except Exception as e:
-        print(f"✗ 1inch spot_price error: {e}")
-    if to_token_address and amount:
-        try:
-            data['swap_quote'] = fetch_1inch_quote(token_address, to_token_address, amount, chain_id)
-            print("✓ 1inch swap_quote: Success")
-        except Exception as e:
-            print(f"✗ 1inch swap_quote error: {e}")
-        if wallet_address:
-            try:
-                data['swap_route'] = fetch_1inch_swap(token_address, to_token_address, amount, wallet_address, chain_id)
-                print("✓ 1inch swap_route: Success")
-            except Exception as e:
-                print(f"✗ 1inch swap_route error: {e}")
-    if wallet_address:
-        try:
-            data['balances'] = fetch_1inch_balances(wallet_address, chain_id)
-            print("✓ 1inch balances: Success")
-        except Exception as e:
-            print(f"✗ 1inch balances error: {e}")
+    for name, future in futures.items():
         try:
-            data['portfolio'] = fetch_1inch_portfolio(wallet_address, chain_id)
-            print("✓ 1inch portfolio: Success")
+            data[name] = future.result()
+            print(f"✓ 1inch {name}: Success")
         except Exception as e:
-            print(f"✗ 1inch portfolio error: {e}")
-        try:
-            data['history'] = fetch_1inch_history(wallet_address, chain_id)
-            print("✓ 1inch history: Success")
-        except Exception as e:
-            print(f"✗ 1inch history error: {e}")
-    try:
-        data['gas_price'] = fetch_1inch_gas_price(chain_id)
-        print("✓ 1inch gas_price: Success")
-    except Exception as e:
-        print(f"✗ 1inch gas_price error: {e}")
-    try:
-        data['orderbook'] = fetch_1inch_orderbook(chain_id)
-        print("✓ 1inch orderbook: Success")
-    except Exception as e:
-        print(f"✗ 1inch orderbook error: {e}")
+            print(f"✗ 1inch {name} error: {e}")
     return data
 
 # --- Enhanced CoinMarketCap Integration ---
 def fetch_coinmarketcap_all(token_address, cmc_key):
     """Try all relevant CoinMarketCap endpoints for token data."""
-    results = {}
     headers = {'X-CMC_PRO_API_KEY': cmc_key}
-    # 1. By contract address
-    try:
-        url = 'https://pro-api.coinmarketcap.com/v2/cryptocurrency/info'
-        params = {'address': token_address}
-        resp = requests.get(url, headers=headers, params=params, timeout=20)
-        if resp.status_code == 200:
-            results['info_by_address'] = resp.json()
-            print(f"✓ CoinMarketCap info by address: Success")
-        else:
-            print(f"✗ CoinMarketCap info by address: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ CoinMarketCap info by address error: {e}")
-    # 2. By symbol (if available)
-    try:
-        url = 'https://pro-api.coinmarketcap.com/v1/cryptocurrency/quotes/latest'
-        params = {'symbol': token_address}
-        resp = requests.get(url, headers=headers, params=params, timeout=20)
-        if resp.status_code == 200:
-            results['quotes_by_symbol'] = resp.json()
-            print(f"✓ CoinMarketCap quotes by symbol: Success")
-        else:
-            print(f"✗ CoinMarketCap quotes by symbol: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ CoinMarketCap quotes by symbol error: {e}")
-    return results
+    return _gather_probes({
+        # 1. By contract address
+        'info_by_address': (_probe_json, "CoinMarketCap info by address", 'GET',
+                            'https://pro-api.coinmarketcap.com/v2/cryptocurrency/info',
+                            {'headers': headers, 'params': {'address': token_address}}),
+        # 2. By symbol (if available)
+        'quotes_by_symbol': (_probe_json, "CoinMarketCap quotes by symbol", 'GET',
+                             'https://pro-api.coinmarketcap.com/v1/cryptocurrency/quotes/latest',
+                             {'headers': headers, 'params': {'symbol': token_address}}),
+    })
 
 # --- Enhanced Bitquery Integration ---
+# Constant query text with the address passed as a GraphQL variable, so the server can reuse its parsed plan
+BITQUERY_CONTRACT_QUERY = ('query ($address: String!) { ethereum { address(address: {is: $address}) '
+                           '{ smartContract { contractType currency { symbol } } } } }')
+
 def fetch_bitquery_all(token_address, bitquery_key, chain='ethereum'):
     """Try all relevant Bitquery endpoints for on-chain data."""
     results = {}
@@ -5727,10 +6030,10 @@ def fetch_bitquery_all(token_address, bitquery_key, chain='ethereum'):
     # 1. GraphQL endpoint
     try:
         url = 'https://graphql.bitquery.io/'
-        query = '{ ethereum { address(address: {is: "%s"}) { smartContract { contractType currency { symbol } } } } }' % token_address
-        resp = requests.post(url, headers=headers, json={'query': query}, timeout=20)
+        payload = {'query': BITQUERY_CONTRACT_QUERY, 'variables': {'address': token_address}}
+        resp = _http_session.post(url, headers=headers, json=payload, timeout=20)
         if resp.status_code == 200:
-            results['graphql'] = resp.json()
+            results['graphql'] = _response_json(resp)
             print(f"✓ Bitquery GraphQL: Success")
         else:
             print(f"✗ Bitquery GraphQL: {resp.text[:100]}")
@@ -5746,9 +6049,9 @@ def fetch_dune_all(query_id, dune_key):
     # 1. Query results
     try:
         url = f"https://api.dune.com/api/v1/query/{query_id}/results"
-        resp = requests.get(url, headers=headers, timeout=30)
+        resp = _http_session.get(url, headers=headers, timeout=30)
         if resp.status_code == 200:
-            results['results'] = resp.json()
+            results['results'] = _response_json(resp)
             print(f"✓ Dune query results: Success")
         else:
             print(f"✗ Dune query results: {resp.text[:100]}")
@@ -5759,163 +6062,80 @@ def fetch_dune_all(query_id, dune_key):
 # --- Enhanced Zapper Integration ---
 def fetch_zapper_all(address, zapper_key):
     """Try all relevant Zapper endpoints for portfolio and protocol data."""
-    results = {}
-    headers = {"Authorization": f"Basic {zapper_key}"}
-    # 1. Portfolio
-    try:
-        url = f"https://api.zapper.fi/v2/balances/{address}"
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            results['portfolio'] = resp.json()
-            print(f"✓ Zapper portfolio: Success")
-        else:
-            print(f"✗ Zapper portfolio: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Zapper portfolio error: {e}")
-    # 2. Protocols
-    try:
-        url = f"https://api.zapper.fi/v2/protocols"
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            results['protocols'] = resp.json()
-            print(f"✓ Zapper protocols: Success")
-        else:
-            print(f"✗ Zapper protocols: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Zapper protocols error: {e}")
-    return results
+    request_kwargs = {'headers': {"Authorization": f"Basic {zapper_key}"}}
+    return _gather_probes({
+        # 1. Portfolio
+        'portfolio': (_probe_json, "Zapper portfolio", 'GET', f"https://api.zapper.fi/v2/balances/{address}", request_kwargs),
+        # 2. Protocols
+        'protocols': (_probe_json, "Zapper protocols", 'GET', "https://api.zapper.fi/v2/protocols", request_kwargs),
+    })
 
 # --- Enhanced Debank Integration ---
 def fetch_debank_all(address, debank_key):
     """Try all relevant Debank endpoints for portfolio and token list."""
-    results = {}
-    headers = {"Authorization": f"Bearer {debank_key}"}
-    # 1. Portfolio
-    try:
-        url = f"https://pro-openapi.debank.com/v1/user/total_balance?id={address}"
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            results['portfolio'] = resp.json()
-            print(f"✓ Debank portfolio: Success")
-        else:
-            print(f"✗ Debank portfolio: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Debank portfolio error: {e}")
-    # 2. Token list
-    try:
-        url = f"https://pro-openapi.debank.com/v1/user/token_list?id={address}"
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            results['token_list'] = resp.json()
-            print(f"✓ Debank token_list: Success")
-        else:
-            print(f"✗ Debank token_list: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Debank token_list error: {e}")
-    return results
+    request_kwargs = {'headers': _bearer_headers(debank_key)}
+    return _gather_probes({
+        # 1. Portfolio
+        'portfolio': (_probe_json, "Debank portfolio", 'GET',
+                      f"https://pro-openapi.debank.com/v1/user/total_balance?id={address}", request_kwargs),
+        # 2. Token list
+        'token_list': (_probe_json, "Debank token_list", 'GET',
+                       f"https://pro-openapi.debank.com/v1/user/token_list?id={address}", request_kwargs),
+    })
 
 # --- Enhanced Moralis Integration ---
 def fetch_moralis_all(address, moralis_key, chain='eth'):
     """Try all relevant Moralis endpoints for token metadata, price, and transfers."""
-    results = {}
-    headers = {"X-API-Key": moralis_key}
-    # 1. Token metadata
-    try:
-        url = f"https://deep-index.moralis.io/api/v2/erc20/metadata?chain={chain}&addresses={address}"
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            results['metadata'] = resp.json()
-            print(f"✓ Moralis metadata: Success")
-        else:
-            print(f"✗ Moralis metadata: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Moralis metadata error: {e}")
-    # 2. Token price
-    try:
-        url = f"https://deep-index.moralis.io/api/v2/erc20/{address}/price?chain={chain}"
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            results['price'] = resp.json()
-            print(f"✓ Moralis price: Success")
-        else:
-            print(f"✗ Moralis price: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Moralis price error: {e}")
-    # 3. Token transfers
-    try:
-        url = f"https://deep-index.moralis.io/api/v2/erc20/{address}/transfers?chain={chain}"
-        resp = requests.get(url, headers=headers, timeout=20)
-        if resp.status_code == 200:
-            results['transfers'] = resp.json()
-            print(f"✓ Moralis transfers: Success")
-        else:
-            print(f"✗ Moralis transfers: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Moralis transfers error: {e}")
-    return results
+    request_kwargs = {'headers': {"X-API-Key": moralis_key}}
+    return _gather_probes({
+        # 1. Token metadata
+        'metadata': (_probe_json, "Moralis metadata", 'GET',
+                     f"https://deep-index.moralis.io/api/v2/erc20/metadata?chain={chain}&addresses={address}", request_kwargs,
+                     CACHE_TTL_METADATA),
+        # 2. Token price
+        'price': (_probe_json, "Moralis price", 'GET',
+                  f"https://deep-index.moralis.io/api/v2/erc20/{address}/price?chain={chain}", request_kwargs,
+                  CACHE_TTL_SPOT),
+        # 3. Token transfers
+        'transfers': (_probe_json, "Moralis transfers", 'GET',
+                      f"https://deep-index.moralis.io/api/v2/erc20/{address}/transfers?chain={chain}", request_kwargs),
+    })
 
 # --- Enhanced Coinpaprika Integration ---
 def fetch_coinpaprika_all(symbol):
     """Try all relevant Coinpaprika endpoints for market data."""
-    results = {}
-    # 1. Ticker
-    try:
-        url = f"https://api.coinpaprika.com/v1/tickers/{symbol.lower()}-usd"
-        resp = requests.get(url, timeout=20)
-        if resp.status_code == 200:
-            results['ticker'] = resp.json()
-            print(f"✓ Coinpaprika ticker: Success")
-        else:
-            print(f"✗ Coinpaprika ticker: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Coinpaprika ticker error: {e}")
-    # 2. Markets
-    try:
-        url = f"https://api.coinpaprika.com/v1/coins/{symbol.lower()}-usd/markets"
-        resp = requests.get(url, timeout=20)
-        if resp.status_code == 200:
-            results['markets'] = resp.json()
-            print(f"✓ Coinpaprika markets: Success")
-        else:
-            print(f"✗ Coinpaprika markets: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ Coinpaprika markets error: {e}")
-    return results
+    return _gather_probes({
+        # 1. Ticker
+        'ticker': (_probe_json, "Coinpaprika ticker", 'GET', f"https://api.coinpaprika.com/v1/tickers/{symbol.lower()}-usd"),
+        # 2. Markets
+        'markets': (_probe_json, "Coinpaprika markets", 'GET', f"https://api.coinpaprika.com/v1/coins/{symbol.lower()}-usd/markets"),
+    })
 
 # --- Enhanced DefiLlama Integration ---
 def fetch_defillama_all(token_address, chain='ethereum'):
     """Try all relevant DefiLlama endpoints for protocol TVL, token price, and yield pools."""
-    results = {}
-    # 1. Protocol TVL
-    try:
-        url = f"https://api.llama.fi/protocol/{token_address}"
-        resp = requests.get(url, timeout=20)
-        if resp.status_code == 200:
-            results['protocol_tvl'] = resp.json()
-            print(f"✓ DefiLlama protocol TVL: Success")
-        else:
-            print(f"✗ DefiLlama protocol TVL: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ DefiLlama protocol TVL error: {e}")
-    # 2. Token price
-    try:
-        url = f"https://coins.llama.fi/prices/current/{chain}:{token_address}"
-        resp = requests.get(url, timeout=20)
-        if resp.status_code == 200:
-            results['token_price'] = resp.json()
-            print(f"✓ DefiLlama token price: Success")
-        else:
-            print(f"✗ DefiLlama token price: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ DefiLlama token price error: {e}")
-    # 3. Yield pools
+    return _gather_probes({
+        # 1. Protocol TVL
+        'protocol_tvl': (_probe_json, "DefiLlama protocol TVL", 'GET', f"https://api.llama.fi/protocol/{token_address}"),
+        # 2. Token price
+        'token_price': (_probe_json, "DefiLlama token price", 'GET', f"https://coins.llama.fi/prices/current/{chain}:{token_address}",
+                        EMPTY, CACHE_TTL_SPOT),
+        # 3. Yield pools (multi-MB and the same for every token)
+        'yield_pools': (_probe_json, "DefiLlama yield pools", 'GET', "https://yields.llama.fi/pools", EMPTY, CACHE_TTL_PRICE,
+                        _decode_yield_pools),
+    })
+
+if __name__ == "__main__":
+    # At the start of main execution (before processing tokens)
     try:
-        url = f"https://yields.llama.fi/pools"
-        resp = requests.get(url, timeout=20)
-        if resp.status_code == 200:
-            results['yield_pools'] = resp.json()
-            print(f"✓ DefiLlama yield pools: Success")
-        else:
-            print(f"✗ DefiLlama yield pools: {resp.text[:100]}")
-    except Exception as e:
-        print(f"✗ DefiLlama yield pools error: {e}")
\ No newline at end of file
+        process_token_batch(input_file=TOKENS_CSV, output_file=RISK_REPORT_CSV, json_output_file=RISK_REPORT_JSON)
+    finally:
+        # Close progress bar and cleanup
+        if PROGRESS_AVAILABLE:
+            close_progress_bar()
+        time.sleep(0.5)
+        print(f"Fetcher cache: {_fetch_cache_stats['hits']} hits, {_fetch_cache_stats['misses']} misses")
+        api_cache.close()
+        _http_session.close()
+        if HTTPX_AVAILABLE:
+            _oneinch_client.close()
@@ -7,11 +7,18 @@ import numpy as np
 import time
 import sys
 import threading
-from openpyxl import load_workbook
+from itertools import count
 from openpyxl.styles import Font
 from datetime import datetime
 from working_progress_bar import update_progress_phase, finish_progress_bar, working_progress_bar
 
+# Optional fast JSON parser for the report and symbol map; falls back to json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 SCRIPT_DIR = os.path.abspath(os.path.dirname(__file__))
 PROJECT_ROOT = SCRIPT_DIR
 DEFAULT_DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
@@ -23,9 +30,16 @@ xlsx_file = os.path.join(DATA_DIR, 'DeFi Tokens Risk Assessment Results.xlsx')
 print("[DEBUG] Excel file path:", xlsx_file)
 json_file = os.path.join(DATA_DIR, 'risk_report.json')
 
+def load_json_file(path):
+    """Load a JSON file, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
 # Load symbol and name mapping from JSON
-with open(os.path.join(DATA_DIR, 'cmc_symbol_map.json'), 'r') as f:
-    CMC_MAP = json.load(f)
+CMC_MAP = {addr.lower(): info for addr, info in load_json_file(os.path.join(DATA_DIR, 'cmc_symbol_map.json')).items()}
 RED_FLAGS = [
     'unverified_contract',
     'low_liquidity',
@@ -36,7 +50,15 @@ RED_FLAGS = [
     'mica_non_compliant',
     'mica_no_whitepaper'
 ]
+RED_FLAG_COLS = [f'Red Flag: {flag}' for flag in RED_FLAGS]
+RED_FLAG_INDEX = {flag: i for i, flag in enumerate(RED_FLAGS)}
+EU_NON_COMPLIANT_STATUSES = [
+    'Non-Compliant (Unlicensed Stablecoin)',
+    'Non-Compliant (Regulatory Issues)'
+]
 COMPONENTS = ['industry_impact','tech_innovation','whitepaper_quality','roadmap_adherence','business_model','team_expertise','management_strategy','global_reach','code_security','dev_activity','aml_data','compliance_data','market_dynamics','marketing_demand','esg_impact']
+# Sheet column name for each component score
+COMPONENT_COLS = {comp: 'Esg Impact' if comp == 'esg_impact' else comp.replace('_', ' ').title() for comp in COMPONENTS}
 
 # --- Simple Console Progress Bar (No AppleEvents) ---
 class ConsoleProgressBar:
@@ -44,47 +66,64 @@ class ConsoleProgressBar:
         self.total_items = total_items
         self.description = description
         self.completed = 0
-        self.lock = threading.Lock()
-        self.start_time = time.time()
-        self.last_update = 0
+        self._counter = count(1)  # Implicit increments; see update() for why there is no lock
+        self._message = ""
+        self._drawn = None  # (completed, message) of the last frame written
+        self.start_time = time.monotonic()
         self.update_interval = 0.5  # Update every 0.5 seconds
+        # Workers only record progress; a single render thread does all terminal writes
+        self._done = threading.Event()
+        self._render_thread = threading.Thread(target=self._render_loop, name='console-progress', daemon=True)
+        self._render_thread.start()
         
     def update(self, completed=None, message=""):
-        with self.lock:
-            if completed is not None:
-                self.completed = completed
-            else:
-                self.completed += 1
-                
-            now = time.time()
-            if now - self.last_update < self.update_interval and self.completed < self.total_items:
-                return  # Skip update if too soon and not final
-            self.last_update = now
-            
-            percent = int((self.completed / self.total_items) * 100)
-            elapsed = now - self.start_time
-            
-            # Calculate ETA
-            if self.completed > 0:
-                eta = (elapsed / self.completed) * (self.total_items - self.completed)
-                eta_str = f"ETA: {eta:.1f}s"
-            else:
-                eta_str = "ETA: --"
-            
-            # Create progress bar
-            bar_length = 30
-            filled_length = int(bar_length * self.completed // self.total_items)
-            bar = '█' * filled_length + '-' * (bar_length - filled_length)
-            
-            # Clear line and print progress
-            sys.stdout.write(f'\r{self.description}: [{bar}] {percent}% ({self.completed}/{self.total_items}) {eta_str} {message}')
-            sys.stdout.flush()
-            
-            if self.completed >= self.total_items:
-                print()  # New line when complete
+        """Record progress; the render thread draws it on its next tick"""
+        if completed is not None:
+            self.completed = completed
+            self._counter = count(completed + 1)
+        else:
+            # Not thread-safe: only the main thread calls update(), the render thread just reads the fields
+            self.completed = next(self._counter)
+        self._message = message
+    
+    def _render_loop(self):
+        while not self._done.wait(self.update_interval):
+            self._draw()
+    
+    def _draw(self):
+        """Render the current state unless it is the frame already on screen"""
+        frame = (self.completed, self._message)
+        if frame != self._drawn:
+            self._drawn = frame
+            self._render(frame[0], time.monotonic(), frame[1])
+    
+    def _render(self, completed, now, message):
+        """Write one progress line for completed items"""
+        percent = int((completed / self.total_items) * 100)
+        elapsed = now - self.start_time
+        
+        # Calculate ETA
+        if completed > 0:
+            eta = (elapsed / completed) * (self.total_items - completed)
+            eta_str = f"ETA: {eta:.1f}s"
+        else:
+            eta_str = "ETA: --"
+        
+        # Create progress bar
+        bar_length = 30
+        filled_length = int(bar_length * completed // self.total_items)
+        bar = '█' * filled_length + '-' * (bar_length - filled_length)
+        
+        # Clear line and print progress as one write (new line when complete)
+        end = '\n' if completed >= self.total_items else ''
+        sys.stdout.write(f'\r{self.description}: [{bar}] {percent}% ({completed}/{self.total_items}) {eta_str} {message}{end}')
+        sys.stdout.flush()
     
     def finish(self, message="Complete!"):
+        self._done.set()
+        self._render_thread.join()
         self.update(self.total_items, message)
+        self._draw()
         print()
 
 # Global progress bar instance
@@ -114,9 +153,9 @@ def close_progress_bar():
 def main():
     print("Analysis Complete")  # Only print at the start of the Excel update script
     # Load the spreadsheet
-    df = pd.read_excel(xlsx_file)
+    df = pd.read_excel(xlsx_file, engine='openpyxl')
     # Load the JSON report
-    data = json.load(open(json_file))
+    data = load_json_file(json_file)
 
     # Show 'Generating final reports...' in the web progress bar
     update_progress_phase(2, "Generating final reports...")
@@ -173,20 +212,17 @@ def main():
         new_cols = left_cols + base_cols
         df = df.reindex(columns=new_cols)
 
-    # Helper: get row index by token address
-    def find_row(token_addr):
-        matches = df.index[df['Token Address'].str.lower() == token_addr.lower()].tolist()
-        return matches[0] if matches else None
-
     # At the start of main execution (before updating Excel)
     launch_progress_bar()
 
-    for entry in data:
+    records = []
+    flag_hits = np.zeros((len(data), len(RED_FLAGS)), dtype=bool)
+    for entry_idx, entry in enumerate(data):
         token_addr = entry['token'].lower()
         # Get symbol and name from CMC_MAP if available
-        symbol = CMC_MAP.get(token_addr, {}).get('symbol', entry.get('symbol', ''))
-        token_name = CMC_MAP.get(token_addr, {}).get('name', symbol or token_addr)
-        row_idx = find_row(token_addr)
+        cmc_info = CMC_MAP.get(token_addr, {})
+        symbol = cmc_info.get('symbol', entry.get('symbol', ''))
+        token_name = cmc_info.get('name', symbol or token_addr)
         # Prepare update dict
         update = {
             'Token Name': token_name,
@@ -209,7 +245,11 @@ def main():
             try:
                 # Handle both list string format and comma-separated format
                 if red_flags_list.startswith('[') and red_flags_list.endswith(']'):
-                    parsed_flags = ast.literal_eval(red_flags_list) if red_flags_list else []
+                    # JSON lists parse with the C decoder; Python reprs fall back to literal_eval
+                    try:
+                        parsed_flags = json.loads(red_flags_list)
+                    except ValueError:
+                        parsed_flags = ast.literal_eval(red_flags_list)
                     red_flags_list = [str(flag).strip() for flag in parsed_flags if str(flag).strip()] if isinstance(parsed_flags, list) else []
                 else:
                     # Handle comma-separated format
@@ -219,124 +259,80 @@ def main():
         elif not isinstance(red_flags_list, list):
             red_flags_list = []
             
-        for flag in RED_FLAGS:
-            update[f'Red Flag: {flag}'] = 'Yes' if flag in red_flags_list else 'No'
+        # Mark this entry's known flags; the Yes/No columns are filled for all entries at once below
+        flag_hits[entry_idx, [RED_FLAG_INDEX[flag] for flag in red_flags_list if flag in RED_FLAG_INDEX]] = True
         # Component scores
-        for comp in COMPONENTS:
-            col = comp.replace('_', ' ').title()
-            if comp == 'esg_impact':
-                col = 'Esg Impact'
+        for comp, col in COMPONENT_COLS.items():
             update[col] = entry['component_scores'].get(comp, '')
-        # Update or append
-        if row_idx is not None:
-            for k, v in update.items():
-                if k in df.columns:
-                    # Handle numeric columns properly
-                    if np.issubdtype(df[k].dtype, np.number):
-                        # Convert empty strings to 0 for numeric columns
-                        if v == '' or v is None:
-                            df.at[row_idx, k] = 0
-                        else:
-                            # Try to convert to numeric, fallback to 0
-                            try:
-                                df.at[row_idx, k] = float(v) if v != '' else 0
-                            except (ValueError, TypeError):
-                                df.at[row_idx, k] = 0
-                    else:
-                        df.at[row_idx, k] = v
-        else:
-            # Append as new row, filling all columns
-            row = {col: update.get(col, '') for col in df.columns}
-            df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
+        records.append(update)
+
+    # Apply all updates column-wise: later entries for the same token win,
+    # existing tokens update their first matching row, the rest are appended once
+    if records:
+        updates = pd.concat([pd.DataFrame.from_records(records),
+                             pd.DataFrame(np.where(flag_hits, 'Yes', 'No'), columns=RED_FLAG_COLS)], axis=1)
+        updates.index = updates['Token Address'].str.lower()
+        updates = updates[~updates.index.duplicated(keep='last')]
+        row_by_addr = pd.Series(df.index, index=df['Token Address'].str.lower())
+        row_by_addr = row_by_addr[row_by_addr.index.notna() & ~row_by_addr.index.duplicated()]
+        found = updates.index.isin(row_by_addr.index)
+        existing = updates[found]
+        if not existing.empty:
+            row_idx = row_by_addr.loc[existing.index].to_numpy()
+            for k in existing.columns.intersection(df.columns):
+                values = existing[k]
+                # Numeric columns: empty or unparseable values become 0
+                if np.issubdtype(df[k].dtype, np.number):
+                    values = pd.to_numeric(values, errors='coerce').fillna(0)
+                df.loc[row_idx, k] = values.to_numpy()
+        # Append new tokens as rows, filling all columns
+        new_rows = updates[~found].reindex(columns=df.columns, fill_value='')
+        if not new_rows.empty:
+            df = pd.concat([df, new_rows], ignore_index=True)
 
     # Remove any rows with NaN Token Name (these are extra rows)
     df = df.dropna(subset=['Token Name'])
 
     # Replace NaN values appropriately for each column type
-    for col in df.columns:
-        if np.issubdtype(df[col].dtype, np.number):
-            df[col] = df[col].fillna(0)  # Fill numeric columns with 0
-        else:
-            df[col] = df[col].fillna('')  # Fill text columns with empty string
+    num_cols = df.select_dtypes(include='number').columns
+    text_cols = df.columns.difference(num_cols, sort=False)
+    df[num_cols] = df[num_cols].fillna(0)  # Fill numeric columns with 0
+    df[text_cols] = df[text_cols].fillna('')  # Fill text columns with empty string
 
-    # Save the updated file
-    df.to_excel(xlsx_file, index=False)
-    print("[DEBUG] Excel file updated at:", xlsx_file)
+    # Drop the previous run's timestamp row (read back as data); a fresh one is written below
+    df = df[df['Token Name'] != 'Last Updated:']
 
-    # Update or add timestamp at the bottom of the first sheet
-    wb = load_workbook(xlsx_file)
-    ws = wb.active
-    
-    # Style the EU Compliance Status column with lighter yellow background
-    try:
-        from openpyxl.styles import PatternFill
-        yellow_fill = PatternFill(start_color="FFF200", end_color="FFF200", fill_type="solid")  # Bright yellow
-        
-        # Find the EU Compliance Status column
-        eu_compliance_col = None
-        for col in range(1, ws.max_column + 1):
-            if ws.cell(row=1, column=col).value == "EU Compliance Status":
-                eu_compliance_col = col
-                break
-        
-        # Apply yellow background only to specific values
-        if eu_compliance_col:
-            for row in range(2, ws.max_row + 1):
-                cell = ws.cell(row=row, column=eu_compliance_col)
-                if cell.value in [
-                    'Non-Compliant (Unlicensed Stablecoin)',
-                    'Non-Compliant (Regulatory Issues)'
-                ]:
-                    cell.fill = yellow_fill
-                else:
-                    cell.fill = PatternFill(fill_type=None)  # Default/no fill
-    except Exception as e:
-        print(f"Warning: Could not apply styling to EU Compliance Status column: {e}")
-    
-    # Remove all but the last 'Last Updated:' row
-    last_updated_rows = []
-    for row in range(1, ws.max_row + 1):
-        if ws.cell(row=row, column=1).value == "Last Updated:":
-            last_updated_rows.append(row)
-    # If more than one, delete all but the last
-    if len(last_updated_rows) > 1:
-        for row_idx in reversed(last_updated_rows[:-1]):
-            ws.delete_rows(row_idx, 1)
-
-    # Look for existing "Last Updated:" row (after cleanup)
-    timestamp_row = None
-    for row in range(1, ws.max_row + 1):
-        if ws.cell(row=row, column=1).value == "Last Updated:":
-            timestamp_row = row
-            break
-    
-    if timestamp_row is None:
-        # Add new timestamp row if it doesn't exist
-        timestamp_row = ws.max_row + 2  # Leave one blank row for better spacing
-        ws.cell(row=timestamp_row, column=1, value="Last Updated:")
-        ws.cell(row=timestamp_row, column=1).font = Font(bold=True)
-    else:
-        # If timestamp row exists, ensure there's a blank row before it
-        if timestamp_row > 2 and ws.cell(row=timestamp_row-1, column=1).value is not None:
-            ws.insert_rows(timestamp_row, 1)
-            timestamp_row += 1
-    
-    # Update the timestamp (clear any existing data in the row first)
-    for col in range(2, ws.max_column + 1):
-        ws.cell(row=timestamp_row, column=col).value = None
-    ws.cell(row=timestamp_row, column=2, value=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-    wb.save(xlsx_file)
+    # Save the updated file, styling and timestamping the sheet in the same write
+    with pd.ExcelWriter(xlsx_file, engine='openpyxl') as writer:
+        df.to_excel(writer, index=False)
+        ws = writer.sheets['Sheet1']
+
+        # Style the EU Compliance Status column with lighter yellow background
+        try:
+            from openpyxl.styles import PatternFill
+            yellow_fill = PatternFill(start_color="FFF200", end_color="FFF200", fill_type="solid")  # Bright yellow
+
+            # Apply yellow background only to rows with specific values (new cells have no fill)
+            if 'EU Compliance Status' in df.columns:
+                eu_compliance_col = df.columns.get_loc('EU Compliance Status') + 1
+                mask = df['EU Compliance Status'].isin(EU_NON_COMPLIANT_STATUSES).to_numpy()
+                for row in np.flatnonzero(mask) + 2:  # +2: 1-based rows below the header
+                    ws.cell(row=int(row), column=eu_compliance_col).fill = yellow_fill
+        except Exception as e:
+            print(f"Warning: Could not apply styling to EU Compliance Status column: {e}")
+
+        # Add the timestamp at the bottom of the sheet, leaving one blank row for better spacing
+        timestamp_row = ws.max_row + 2
+        ws.cell(row=timestamp_row, column=1, value="Last Updated:").font = Font(bold=True)
+        ws.cell(row=timestamp_row, column=2, value=datetime.now().isoformat(sep=" ", timespec="seconds"))
+    print("[DEBUG] Excel file updated at:", xlsx_file)
 
     # At the end of the script (after all processing is done)
     if working_progress_bar:
         working_progress_bar.completed_phases = working_progress_bar.total_phases
     finish_progress_bar("Risk Assessment Completed!")
 
-    # Wait for progress bar to close before showing notification
-    import time
-    time.sleep(3)  # Wait for the webpage to close
-
-    # Show completion dialog with disclaimer (after webpage closes)
+    # Show completion dialog with disclaimer (finish_progress_bar has already written the final page state)
     try:
         import subprocess
         completion_script = f'''
@@ -8,11 +8,41 @@ import os
 import sys
 import time
 import threading
-import subprocess
+import webbrowser
+import json
+import tempfile
 from typing import Optional
 import shutil
 import glob
-import base64
+from urllib.parse import quote
+
+# Logo images staged next to the progress page in /tmp and referenced by relative URL
+LOGO_FILES = [
+    '1inch-exchange-logo.png',
+    'bitquery-logo.jpg',
+    'coingecko logo.png',
+    'defillama-logo.jpg',
+    '450px-EtherScan-Logo.png',
+]
+
+# The page is written once; progress is read from a small state script it polls (250ms, backing off to 2s)
+PROGRESS_HTML_FILE = "/tmp/progress_bar.html"
+PROGRESS_STATE_FILE = "/tmp/progress_bar_state.js"
+
+def _replace_file(path: str, data: bytes):
+    """Write data to a private temp file beside path, then atomically rename it over path"""
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='pb_')
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
 
 class WorkingProgressBar:
     """
@@ -39,28 +69,20 @@ class WorkingProgressBar:
             "Generating final reports..."
         ]
         
+        # Relative URLs of the logo copies in /tmp, cached by the browser across page refreshes
+        self._logo_srcs = [quote(logo) for logo in LOGO_FILES]
+        
         # Create the progress bar window
         self._create_progress_window()
+        
+        # Producers publish the latest state and wake the writer thread, which writes only the newest one
+        self._latest_state = None
+        self._last_posted_state = None
+        self._state_ready = threading.Event()
+        self._stopping = False
+        self._writer = threading.Thread(target=self._writer_loop, name='progress-page-writer', daemon=True)
+        self._writer.start()
     
-    def _get_logo_data_urls(self):
-        # Read base64 logo files and return data URLs
-        logo_files = [
-            ("1inch-exchange-logo.png", "/tmp/1inch-exchange-logo.b64", "image/png"),
-            ("bitquery-logo.jpg", "/tmp/bitquery-logo.b64", "image/jpeg"),
-            ("coingecko logo.png", "/tmp/coingecko logo.b64", "image/png"),
-            ("defillama-logo.jpg", "/tmp/defillama-logo.b64", "image/jpeg"),
-            ("450px-EtherScan-Logo.png", "/tmp/450px-EtherScan-Logo.b64", "image/png"),
-        ]
-        data_urls = []
-        for name, b64_path, mime in logo_files:
-            try:
-                with open(b64_path, "r") as f:
-                    b64 = f.read().replace("\n", "")
-                data_urls.append(f"data:{mime};base64,{b64}")
-            except Exception:
-                data_urls.append("")
-        return data_urls
-
     def _create_progress_window(self):
         """Create a working progress bar using a simple GUI"""
         try:
@@ -71,30 +93,20 @@ class WorkingProgressBar:
                 os.path.abspath(os.path.join(script_dir, "..", "docs", "Logos")),
             ]
             logo_dir = next((path for path in logo_dir_candidates if os.path.isdir(path)), logo_dir_candidates[0])
-            logo_files = [
-                '1inch-exchange-logo.png',
-                'bitquery-logo.jpg',
-                'coingecko logo.png',
-                'defillama-logo.jpg',
-                '450px-EtherScan-Logo.png',
-            ]
-            for logo in logo_files:
+            for logo in LOGO_FILES:
                 src = os.path.join(logo_dir, logo)
                 dst = os.path.join('/tmp', logo)
                 if os.path.exists(src):
                     shutil.copyfile(src, dst)
 
-            # Only add meta refresh if not finished
-            meta_refresh = '<meta http-equiv="refresh" content="1">' if self.completed_phases < self.total_phases else ''
-
-            logo_data_urls = self._get_logo_data_urls()
+            logo_srcs = self._logo_srcs
+            state_src = os.path.basename(PROGRESS_STATE_FILE)
 
             html_content = f"""
             <!DOCTYPE html>
             <html>
             <head>
                 <title>{self.title}</title>
-                {meta_refresh}
                 <style>
                     body {{
                         font-family: Arial, sans-serif;
@@ -163,15 +175,31 @@ class WorkingProgressBar:
                         font-size: 14px;
                         color: #95a5a6;
                     }}
+                    .completion-message {{
+                        display: none;
+                        margin: 32px 0 0 0;
+                    }}
+                    .completion-title {{
+                        font-size: 32px;
+                        font-weight: bold;
+                        color: #27ae60;
+                        margin-bottom: 18px;
+                    }}
+                    .countdown {{
+                        font-size: 22px;
+                        color: #e74c3c;
+                        margin-top: 32px;
+                        font-weight: bold;
+                    }}
                 </style>
             </head>
             <body>
                 <div class="logo-row">
-                    <img src="{logo_data_urls[0]}" alt="1inch" />
-                    <img src="{logo_data_urls[1]}" alt="BitQuery" />
-                    <img src="{logo_data_urls[2]}" alt="CoinGecko" />
-                    <img src="{logo_data_urls[3]}" alt="DefiLlama" />
-                    <img src="{logo_data_urls[4]}" alt="Etherscan" />
+                    <img src="{logo_srcs[0]}" alt="1inch" />
+                    <img src="{logo_srcs[1]}" alt="BitQuery" />
+                    <img src="{logo_srcs[2]}" alt="CoinGecko" />
+                    <img src="{logo_srcs[3]}" alt="DefiLlama" />
+                    <img src="{logo_srcs[4]}" alt="Etherscan" />
                 </div>
                 <div class="container">
                     <div class="title">{self.title}</div>
@@ -180,22 +208,76 @@ class WorkingProgressBar:
                         <div class="progress-bar" id="progress"></div>
                     </div>
                     <div class="details" id="details">Token 0/{self.total_tokens} - Phase 0/3</div>
+                    <div class="completion-message" id="completion">
+                        <div class="completion-title">Risk Assessment Completed!</div>
+                        Please check the notification on the Apple Dialog window and see the results on the report.
+                        <div class="countdown" id="countdown">This page will be closed in 10 seconds...</div>
+                    </div>
                 </div>
+                <script>
+                    // The state script calls applyProgress(); a <script> tag (unlike fetch) may load file:// siblings
+                    // Poll quickly while the state changes; back off up to 2s while it stays the same
+                    var lastState = null;
+                    var pollDelay = 250;
+                    var finished = false;
+                    function applyProgress(state) {{
+                        var key = JSON.stringify(state);
+                        if (key === lastState) {{
+                            pollDelay = Math.min(pollDelay * 2, 2000);
+                            return;
+                        }}
+                        lastState = key;
+                        pollDelay = 250;
+                        document.getElementById('progress').style.width = state.pct + '%';
+                        document.getElementById('status').textContent = state.status;
+                        document.getElementById('details').textContent = state.details;
+                        if (state.done && !finished) {{
+                            finished = true;
+                            startCountdown();
+                        }}
+                    }}
+                    function startCountdown() {{
+                        document.getElementById('completion').style.display = 'block';
+                        var countdown = 10;
+                        var countdownElement = document.getElementById('countdown');
+                        var timer = setInterval(function() {{
+                            countdown--;
+                            if (countdown > 0) {{
+                                countdownElement.textContent = `This page will be closed in ${{countdown}} seconds...`;
+                            }} else {{
+                                countdownElement.textContent = 'Closing Now...';
+                                clearInterval(timer);
+                                setTimeout(function() {{
+                                    window.close();
+                                }}, 1000);
+                            }}
+                        }}, 1000);
+                    }}
+                    function pollProgress() {{
+                        var script = document.createElement('script');
+                        script.src = '{state_src}?t=' + Date.now();
+                        script.onload = script.onerror = function() {{
+                            script.remove();
+                            if (!finished) {{
+                                setTimeout(pollProgress, pollDelay);
+                            }}
+                        }};
+                        document.head.appendChild(script);
+                    }}
+                    pollProgress();
+                </script>
             </body>
             </html>
             """
             
-            # Write HTML to a temporary file
-            self.html_file = "/tmp/progress_bar.html"
-            self.html_temp = "/tmp/progress_bar.html.tmp"
-            with open(self.html_temp, 'w') as f:
-                f.write(html_content)
-            shutil.move(self.html_temp, self.html_file)
+            # Write the page once, with the initial state beside it
+            self.html_file = PROGRESS_HTML_FILE
+            _replace_file(self.html_file, html_content.encode('utf-8'))
+            self._write_state(0, "Initializing...", f"Token 0/{self.total_tokens} - Phase 0/3")
             
-            # Open the HTML file in a browser
-            subprocess.Popen(['open', self.html_file], 
-                           stdout=subprocess.DEVNULL, 
-                           stderr=subprocess.DEVNULL)
+            # Open the HTML file in the default browser
+            if not webbrowser.open('file://' + self.html_file):
+                raise RuntimeError("No web browser available for the progress page")
             
             self.is_running = True
             # Removed the initialization message
@@ -261,326 +343,88 @@ class WorkingProgressBar:
             
             self._update_progress_bar()
     
+    def _write_state(self, percentage, status, details, done=False):
+        """Atomically replace the state script polled by the page"""
+        state = {'pct': round(percentage, 2), 'status': status, 'details': details, 'done': done}
+        _replace_file(PROGRESS_STATE_FILE, b"applyProgress(%b);" % json.dumps(state).encode('ascii'))
+    
+    def _writer_loop(self):
+        """Write the latest published state, at most once per 0.2s, until stopped"""
+        written = None
+        while True:
+            self._state_ready.wait()
+            self._state_ready.clear()
+            stopping = self._stopping  # read before the state, so a final state posted before stopping is seen
+            state = self._latest_state
+            if state is not written:
+                written = state
+                try:
+                    self._write_state(*state)
+                except Exception as e:
+                    with open("/tmp/progress_bar_error.log", "a") as logf:
+                        logf.write(f"[UPDATE] {time.ctime()}: {e}\n")
+                    self.is_running = False
+            if stopping:
+                return
+            time.sleep(0.2)
+    
+    def _post_state(self, state):
+        """Publish state for the writer thread; an unwritten older state is simply dropped"""
+        self._latest_state = state
+        self._state_ready.set()
+    
+    def _stop_writer(self):
+        """Let the writer flush the latest state, then stop it"""
+        self._stopping = True
+        self._state_ready.set()
+        self._writer.join(timeout=2)
+    
     def _update_progress_bar(self):
         """Update the progress bar display"""
         if not self.is_running or self.finished:
             return
             
-        try:
-            # Calculate percentage (ensure it never exceeds 100%)
-            percentage = min((self.completed_phases / self.total_phases) * 100 if self.total_phases > 0 else 0, 100.0)
-            
-            # Add a unique timestamp to force browser refresh
-            timestamp = int(time.time() * 1000)
-            
-            # Only add meta refresh if not finished
-            meta_refresh = '<meta http-equiv="refresh" content="1">' if self.completed_phases < self.total_phases else ''
-            # If finished, add the countdown/auto-close JS
-            countdown_html = ""
-            if self.completed_phases >= self.total_phases:
-                countdown_html = '''
-                <div class="completion-message">
-                    <div class="completion-title">Risk Assessment Completed!</div>
-                    Please check the notification on the Apple Dialog window and see the results on the report.
-                </div>
-                <div class="countdown" id="countdown">This page will be closed in 10 seconds...</div>
-                <script>
-                    var countdown = 10;
-                    var countdownElement = document.getElementById('countdown');
-                    var timer = setInterval(function() {
-                        countdown--;
-                        if (countdown > 0) {
-                            countdownElement.textContent = `This page will be closed in ${{countdown}} seconds...`;
-                        } else {
-                            countdownElement.textContent = 'Closing Now...';
-                            clearInterval(timer);
-                            setTimeout(function() {
-                                window.close();
-                            }, 1000);
-                        }
-                    }, 1000);
-                </script>
-                '''
-            logo_data_urls = self._get_logo_data_urls()
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>{self.title}</title>
-                {meta_refresh}
-                <style>
-                    body {{
-                        font-family: Arial, sans-serif;
-                        background-color: #2c3e50;
-                        color: white;
-                        margin: 0;
-                        padding: 20px;
-                        display: flex;
-                        flex-direction: column;
-                        align-items: center;
-                        justify-content: center;
-                        height: 100vh;
-                        position: relative;
-                        overflow: hidden;
-                    }}
-                    .logo-row {{
-                        display: flex;
-                        flex-direction: row;
-                        justify-content: center;
-                        align-items: center;
-                        gap: 32px;
-                        margin-bottom: 24px;
-                        margin-top: 8px;
-                    }}
-                    .logo-row img {{
-                        height: 80px;
-                        width: auto;
-                        border-radius: 12px;
-                        background: #fff;
-                        padding: 4px 10px;
-                        box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-                        opacity: 0.5;
-                        transition: opacity 0.2s;
-                    }}
-                    .container {{
-                        text-align: center;
-                        max-width: 500px;
-                        z-index: 1;
-                        position: relative;
-                    }}
-                    .title {{
-                        font-size: 24px;
-                        margin-bottom: 30px;
-                        color: #ecf0f1;
-                    }}
-                    .progress-container {{
-                        width: 100%;
-                        background-color: #34495e;
-                        border-radius: 10px;
-                        padding: 3px;
-                        margin-bottom: 20px;
-                    }}
-                    .progress-bar {{
-                        width: {percentage}%;
-                        height: 30px;
-                        background: linear-gradient(90deg, #27ae60, #2ecc71);
-                        border-radius: 8px;
-                        transition: width 0.3s ease;
-                    }}
-                    .status {{
-                        font-size: 16px;
-                        margin-bottom: 10px;
-                        color: #bdc3c7;
-                    }}
-                    .details {{
-                        font-size: 14px;
-                        color: #95a5a6;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="logo-row">
-                    <img src="{logo_data_urls[0]}" alt="1inch" />
-                    <img src="{logo_data_urls[1]}" alt="BitQuery" />
-                    <img src="{logo_data_urls[2]}" alt="CoinGecko" />
-                    <img src="{logo_data_urls[3]}" alt="DefiLlama" />
-                    <img src="{logo_data_urls[4]}" alt="Etherscan" />
-                </div>
-                <div class="container">
-                    <div class="title">{self.title}</div>
-                    <div class="status" id="status">{getattr(self, 'current_message', 'Initializing...')}</div>
-                    <div class="progress-container">
-                        <div class="progress-bar" id="progress"></div>
-                    </div>
-                    <div class="details">Token {self.current_token}/{self.total_tokens} - Phase {min(self.current_phase + 1, 3)}/3</div>
-                    {countdown_html}
-                </div>
-                <script>
-                    // Force immediate refresh with timestamp
-                    if (window.location.search !== '?t={timestamp}') {{
-                        window.location.search = '?t={timestamp}';
-                    }}
-                </script>
-            </body>
-            </html>
-            """
-            
-            self.html_temp = "/tmp/progress_bar.html.tmp"
-            with open(self.html_temp, 'w') as f:
-                f.write(html_content)
-            shutil.move(self.html_temp, self.html_file)
-            
-            # Small delay to ensure browser processes the update
-            time.sleep(0.3)  # Throttle updates to 0.3s
-                
-        except Exception as e:
-            with open("/tmp/progress_bar_error.log", "a") as logf:
-                logf.write(f"[UPDATE] {time.ctime()}: {e}\n")
-            self.is_running = False
+        # Calculate percentage (ensure it never exceeds 100%)
+        percentage = min((self.completed_phases / self.total_phases) * 100 if self.total_phases > 0 else 0, 100.0)
+        state = (
+            percentage,
+            getattr(self, 'current_message', 'Initializing...'),
+            f"Token {self.current_token}/{self.total_tokens} - Phase {min(self.current_phase + 1, 3)}/3",
+            self.completed_phases >= self.total_phases,
+        )
+        # Repeated calls with nothing new (e.g. the same phase again) skip the writer entirely
+        if state == self._last_posted_state:
+            return
+        self._last_posted_state = state
+        self._post_state(state)
     
     def finish(self, message: str = "Risk assessment complete!"):
         """Complete the progress bar"""
         with self.lock:
             self.finished = True
-            try:
-                logo_data_urls = self._get_logo_data_urls()
-                html_content = f"""
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <title>{self.title}</title>
-                    <style>
-                        body {{
-                            font-family: Arial, sans-serif;
-                            background-color: #2c3e50;
-                            color: white;
-                            margin: 0;
-                            padding: 20px;
-                            display: flex;
-                            flex-direction: column;
-                            align-items: center;
-                            justify-content: center;
-                            height: 100vh;
-                            position: relative;
-                        }}
-                        .logo-row {{
-                            display: flex;
-                            flex-direction: row;
-                            justify-content: center;
-                            align-items: center;
-                            gap: 32px;
-                            margin-bottom: 24px;
-                            margin-top: 8px;
-                        }}
-                        .logo-row img {{
-                            height: 60px;
-                            width: auto;
-                            border-radius: 12px;
-                            background: #fff;
-                            padding: 2px 6px;
-                            box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-                            opacity: 0.5;
-                            transition: opacity 0.2s;
-                        }}
-                        .container {{
-                            text-align: center;
-                            max-width: 500px;
-                            z-index: 1;
-                            position: relative;
-                        }}
-                        .title {{
-                            font-size: 24px;
-                            margin-bottom: 30px;
-                            color: #ecf0f1;
-                        }}
-                        .progress-container {{
-                            width: 100%;
-                            background-color: #34495e;
-                            border-radius: 10px;
-                            padding: 3px;
-                            margin-bottom: 20px;
-                        }}
-                        .progress-bar {{
-                            width: 100%;
-                            height: 30px;
-                            background: linear-gradient(90deg, #27ae60, #2ecc71);
-                            border-radius: 8px;
-                            transition: width 0.3s ease;
-                        }}
-                        .status {{
-                            font-size: 16px;
-                            margin-bottom: 10px;
-                            color: #bdc3c7;
-                        }}
-                        .details {{
-                            font-size: 14px;
-                            color: #95a5a6;
-                        }}
-                        .completion-message {{
-                            margin: 32px 0 0 0;
-                        }}
-                        .completion-title {{
-                            font-size: 32px;
-                            font-weight: bold;
-                            color: #27ae60;
-                            margin-bottom: 18px;
-                        }}
-                        .countdown {{
-                            font-size: 22px;
-                            color: #e74c3c;
-                            margin-top: 32px;
-                            font-weight: bold;
-                        }}
-                    </style>
-                </head>
-                <body>
-                    <div class="logo-row">
-                        <img src="{logo_data_urls[0]}" alt="1inch" />
-                        <img src="{logo_data_urls[1]}" alt="BitQuery" />
-                        <img src="{logo_data_urls[2]}" alt="CoinGecko" />
-                        <img src="{logo_data_urls[3]}" alt="DefiLlama" />
-                        <img src="{logo_data_urls[4]}" alt="Etherscan" />
-                    </div>
-                    <div class="container">
-                        <div class="title">{self.title}</div>
-                        <div class="progress-container">
-                            <div class="progress-bar"></div>
-                        </div>
-                        <div class="details">Complete!</div>
-                        <div class="completion-message">
-                            <div class="completion-title">Risk Assessment Completed!</div>
-                            Please check the notification on the Apple Dialog window and see the results on the report.
-                        </div>
-                        <div class="countdown" id="countdown">This page will be closed in 10 seconds...</div>
-                    </div>
-                    <script>
-                        // Force a final reload if not already in ?final=1
-                        if (!window.location.search.includes('final=1')) {{
-                            window.location.search = '?final=1';
-                        }} else {{
-                            var countdown = 10;
-                            var countdownElement = document.getElementById('countdown');
-                            var timer = setInterval(function() {{
-                                countdown--;
-                                if (countdown > 0) {{
-                                    countdownElement.textContent = `This page will be closed in ${{countdown}} seconds...`;
-                                }} else {{
-                                    countdownElement.textContent = 'Closing Now...';
-                                    clearInterval(timer);
-                                    setTimeout(function() {{
-                                        window.close();
-                                    }}, 1000);
-                                }}
-                            }}, 1000);
-                        }}
-                    </script>
-                </body>
-                </html>
-                """
-                self.html_temp = "/tmp/progress_bar.html.tmp"
-                with open(self.html_temp, 'w') as f:
-                    f.write(html_content)
-                shutil.move(self.html_temp, self.html_file)
-                print("[DEBUG] finish() called on working_progress_bar")
-            except Exception as e:
-                with open("/tmp/progress_bar_error.log", "a") as logf:
-                    logf.write(f"[FINISH] {time.ctime()}: {e}\n")
-                pass
-            self.is_running = False
+            self._post_state((100, message, "Complete!", True))
+            print("[DEBUG] finish() called on working_progress_bar")
+        self._stop_writer()
+        self.is_running = False
     
     def close(self):
         """Close the progress bar"""
+        self._stop_writer()
         if self.is_running:
             try:
-                # Remove the HTML file
-                if os.path.exists(self.html_file):
-                    os.remove(self.html_file)
+                # Remove the page and its state script
+                for path in (self.html_file, PROGRESS_STATE_FILE):
+                    if os.path.exists(path):
+                        os.remove(path)
             except Exception as e:
                 with open("/tmp/progress_bar_error.log", "a") as logf:
                     logf.write(f"[CLOSE] {time.ctime()}: {e}\n")
             self.is_running = False
 
-# Console progress bar as fallback
+# Console progress bar as fallback; every possible bar string, indexed by filled length
+CONSOLE_BAR_LENGTH = 30
+CONSOLE_BARS = ['█' * filled + '-' * (CONSOLE_BAR_LENGTH - filled) for filled in range(CONSOLE_BAR_LENGTH + 1)]
+
 class ConsoleProgressBar:
     """Console progress bar that always works"""
     
@@ -593,6 +437,7 @@ class ConsoleProgressBar:
         self.total_phases = (total_tokens * self.phases_per_token) + 1  # +1 for final report generation
         self.completed_phases = 0
         self.start_time = time.time()
+        self._line_prefix = f'\r{title}: ['
         
         self.token_phases = [
             "Fetching token data",
@@ -636,11 +481,10 @@ class ConsoleProgressBar:
         else:
             eta_str = "ETA: --"
         
-        bar_length = 30
-        filled_length = int(bar_length * self.completed_phases // self.total_phases)
-        bar = '█' * filled_length + '-' * (bar_length - filled_length)
+        filled_length = min(CONSOLE_BAR_LENGTH * self.completed_phases // self.total_phases, CONSOLE_BAR_LENGTH)
+        bar = CONSOLE_BARS[filled_length]
         
-        sys.stdout.write(f'\r{self.title}: [{bar}] {percent}% ({self.completed_phases}/{self.total_phases}) {eta_str} {message}')
+        sys.stdout.write(f'{self._line_prefix}{bar}] {percent}% ({self.completed_phases}/{self.total_phases}) {eta_str} {message}')
         sys.stdout.flush()
     
     def finish(self, message: str = "Risk assessment complete!"):
@@ -674,8 +518,6 @@ def update_progress_phase(phase_index: int, message: str = None):
     global working_progress_bar, console_progress_bar
     if working_progress_bar:
         working_progress_bar.update_phase(phase_index, message)
-        # Small delay to ensure browser sees the update
-        time.sleep(0.1)
     elif console_progress_bar:
         console_progress_bar.update_phase(phase_index, message)
 
@@ -699,10 +541,8 @@ def finish_progress_bar(message: str = "Risk assessment complete!"):
     """Finish the progress bar"""
     global working_progress_bar, console_progress_bar
     if working_progress_bar:
-        working_progress_bar.finish(message)
+        working_progress_bar.finish(message)  # Returns once the final state is written; the page closes itself
         print("[DEBUG] finish() called on working_progress_bar")
-        import time
-        time.sleep(3)  # Allow browser to process final HTML and close
         working_progress_bar = None
     elif console_progress_bar:
         console_progress_bar.finish(message)